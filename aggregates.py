@@ -0,0 +1,176 @@
+# Importing Toolkit
+import numpy as np
+import pandas as pd
+
+from row_index import RowIndex
+from code_engine import ColumnCodes, first_seen, count_sum, sort_descending, sort_descending_stable, top_distinct, \
+    top_k
+
+# *************************************************************************
+# ** Aggregate Cube: Counts & Salary Sums Per (Year, Job, Dimension)     **
+# *************************************************************************
+# Every chart only needs counts and mean salaries of one column after
+# filtering on Year and Job_Title, so we compute them once here and the
+# chart functions just look them up.
+#
+#   cube[(year, job, dimension)] -> DataFrame(index=dimension values,
+#                                             columns=["count", "sum"])
+#
+# year is "all" or a Year value, job is "All" or a Job_Title.
+# The rows of each cell keep the order in which the values first appear in
+# the filtered data (the same order `value_counts` sees before sorting), so
+# the charts keep their ordering of ties.
+
+ALL_YEARS = "all"
+ALL_JOBS = "All"
+
+# Columns we aggregate for every (Year, Job) cell
+CUBE_DIMENSIONS = ["Company_Location", "Experience_Level", "Expertise_Level"]
+
+
+def _present(codes, weights):
+    # Missing Values (Code -1) Are Left Out, Like groupby Does
+    if len(codes) and codes.min() < 0:
+        keep = codes >= 0
+        return codes[keep], weights[keep]
+    return codes, weights
+
+
+def _group_cell(column, rows, salary):
+    codes = column.codes if rows is None else column.codes[rows]
+    codes, weights = _present(codes, salary if rows is None else salary[rows])
+
+    counts, sums = count_sum(codes, weights, column.n_groups)
+    groups = first_seen(codes)
+    return pd.DataFrame({"count": counts[groups], "sum": sums[groups]}, index=column.index(groups))
+
+
+def _add_cells(cube, year, rows, jobs, column, salary):
+    # One Cell Per Job + The All Jobs Cell
+    job_codes = jobs.codes if rows is None else jobs.codes[rows]
+    codes = column.codes if rows is None else column.codes[rows]
+    pair_codes = np.where((job_codes < 0) | (codes < 0), -1, job_codes * column.n_groups + codes)
+    pair_codes, weights = _present(pair_codes, salary if rows is None else salary[rows])
+
+    counts, sums = count_sum(pair_codes, weights, jobs.n_groups * column.n_groups)
+    pairs = first_seen(pair_codes)
+    # Grouped By Job, Each Job's Values Still In First Appearance Order
+    pairs = pairs[np.argsort(pairs // column.n_groups, kind="stable")]
+    pair_jobs = pairs // column.n_groups
+    starts = np.flatnonzero(np.diff(pair_jobs, prepend=-1))
+    for start, end in zip(starts, np.append(starts[1:], len(pairs))):
+        cell_pairs = pairs[start:end]
+        cube[(year, jobs.labels[pair_jobs[start]], column.name)] = pd.DataFrame(
+            {"count": counts[cell_pairs], "sum": sums[cell_pairs]},
+            index=column.index(cell_pairs % column.n_groups))
+
+    cube[(year, ALL_JOBS, column.name)] = _group_cell(column, rows, salary)
+
+
+def build_cube(df, row_index=None):
+    if row_index is None:
+        row_index = RowIndex(df)
+
+    # Counts & Sums With np.bincount Over The Category Codes (code_engine.py)
+    salary = df["Salary_in_USD"].to_numpy()
+    jobs = ColumnCodes(df["Job_Title"])
+    columns = {dimension: ColumnCodes(df[dimension]) for dimension in CUBE_DIMENSIONS + ["Year"]}
+
+    cube = {}
+    years = sorted(row_index.years)
+
+    for year in [ALL_YEARS] + years:
+        rows = row_index.rows(year=year)
+
+        # Jobs Rollup (Home Page Charts & Cards)
+        cube[(year, ALL_JOBS, "Job_Title")] = _group_cell(jobs, rows, salary)
+
+        for dimension in CUBE_DIMENSIONS:
+            _add_cells(cube, year, rows, jobs, columns[dimension], salary)
+
+    # Salary Over The Years (Time Series Page)
+    _add_cells(cube, ALL_YEARS, None, jobs, columns["Year"], salary)
+
+    return cube
+
+
+# -------------- Folding New Rows In ------------------ #
+# The cube of the new rows alone is added cell by cell: counts and sums just
+# add up, and values seen for the first time go after the old ones (where
+# they first appear in the combined rows).
+def merge_cells(cell, delta):
+    new_values = delta.index[~delta.index.isin(cell.index)]
+    index = cell.index.append(new_values)
+    return cell.reindex(index, fill_value=0) + delta.reindex(index, fill_value=0)
+
+
+def merge_cubes(cube, delta, dtypes=None):
+    # dtypes: {column: CategoricalDtype} when the new rows brought new categories
+    merged = {}
+    for key, cell in cube.items():
+        dimension = key[2]
+        if dtypes and dimension in dtypes and cell.index.dtype != dtypes[dimension]:
+            cell = cell.set_axis(cell.index.astype(dtypes[dimension]))
+        merged[key] = cell
+
+    for key, cell in delta.items():
+        merged[key] = merge_cells(merged[key], cell) if key in merged else cell
+
+    return merged
+
+
+def get_cell(cube, year, job, dimension):
+    # Missing Cell --> The Job Did Not Exist In That Year
+    cell = cube.get((year, job, dimension))
+    if cell is None:
+        cell = pd.DataFrame({"count": pd.Series(dtype="int64"), "sum": pd.Series(dtype="int64")},
+                            index=pd.Index([], name=dimension))
+    return cell
+
+
+# -------------- Reading a Cell ------------------ #
+# Same Series as the pandas chains the charts were written with, taken from
+# the cell's arrays (code_engine.py): only the k values shown are sorted
+# when their order doesn't depend on how ties are sorted.
+def _series(cell, column, order, name):
+    return pd.Series(cell[column].to_numpy()[order], index=cell.index[order], name=name)
+
+
+def cell_counts(cell):
+    # Same result (and order) as value_counts() on the filtered rows
+    counts = cell["count"].to_numpy()
+    return _series(cell, "count", sort_descending_stable(counts), "count")
+
+
+def top_counts(cell, k=None):
+    # cell_counts(cell).sort_values(ascending=False).head(k)
+    counts = cell["count"].to_numpy()
+    order = top_distinct(counts, k)
+    if order is None:
+        stable = sort_descending_stable(counts)
+        order = stable[sort_descending(counts[stable])][:k]
+    return _series(cell, "count", order, "count")
+
+
+def _key_order(index):
+    # groupby().mean() returns the groups sorted by key
+    return np.argsort(index.codes if isinstance(index, pd.CategoricalIndex) else index.to_numpy(), kind="stable")
+
+
+def _means(cell):
+    return cell["sum"].to_numpy() / cell["count"].to_numpy()
+
+
+def cell_means(cell):
+    order = _key_order(cell.index)
+    return pd.Series(_means(cell)[order], index=cell.index[order], name="Salary_in_USD")
+
+
+def top_means(cell, k=None):
+    # cell_means(cell).sort_values(ascending=False).head(k)
+    means = _means(cell)
+    top = top_distinct(means, k)
+    if top is None:
+        order = _key_order(cell.index)
+        top = order[top_k(means[order], k)]
+    return pd.Series(means[top], index=cell.index[top], name="Salary_in_USD")
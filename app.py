@@ -1,47 +1,151 @@
 # Importing Toolkit
+# Times Each Phase of The Startup (DASHBOARD_STARTUP_REPORT=1 Prints Them)
+from startup import startup
+import os
+import gc
+import pickle
 import pandas as pd
-import numpy as np
-import plotly.express as px
 
 # Dash Components
 import dash
-from dash import Dash, html, dcc, Input, Output
+from dash import Dash, html, dcc, Input, Output, State
+from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
 
-# -------------- Load The Data ------------------ #
-df = pd.read_csv("Latest_Data_Science_Salaries.csv")
+# Typed Data Loading & Precomputed Aggregates
+from data_loader import load_data, snapshot_key, snapshot_dir
+from row_index import RowIndex
+from live_data import DataState, LiveDataset
+from partitions import PartitionedState
+from job_search import JobSearchIndex
+from aggregates import build_cube, get_cell, cell_counts, cell_means, top_counts, top_means
+from code_engine import top_k
+from kpi_engine import build_kpis
+from histograms import build_histograms, get_histogram, SALARY_BIN_WIDTH
+from figure_cache import FigureCache
+from shared_cache import make_shared_cache, get_or_build
+from background import make_background_manager, figure_callback_options
+from metrics import Metrics, figure_cache_collector
+import serialization  # Sets plotly's JSON Engine (orjson When Installed)
+from warmup import warm_up
+
+# Chart Styles (Built Once) Filled With Each Request's Data
+import figure_factory as figures
+
+startup.mark("imports")
 
+# -------------- Load The Data ------------------ #
 # *************************************************************************
 # ** Notice: The EDA of This DataSet has Already Done In Kaggle Notebook **
 # *************************************************************************
 
-# Clean The Column Names
-df.columns = df.columns.str.replace(" ", "_")
+# Another CSV With The Same Columns Can Be Served With SALARY_DATA=<path>
+data_path = os.environ.get("SALARY_DATA", "Latest_Data_Science_Salaries.csv")
+
+# Big CSVs Can Be Read In Chunks (SALARY_CHUNKSIZE=<rows>) With The Salary
+# Quartiles Exact (Default) or Sketched (SALARY_IQR=sketch, Fixed Memory)
+chunksize = int(os.environ.get("SALARY_CHUNKSIZE", 0)) or None
+iqr_method = os.environ.get("SALARY_IQR", "exact")
+
+# New Rows Folded In While Running (Off Unless DASHBOARD_REFRESH_SECONDS Is Set):
+# Rows Appended To The CSV + CSV Files Dropped In DASHBOARD_APPEND_DIR
+refresh_seconds = float(os.environ.get("DASHBOARD_REFRESH_SECONDS", 0))
+append_dir = os.environ.get("DASHBOARD_APPEND_DIR")
 
-df["Job_Title"].replace("Data Engineer 2", "Data Engineer", inplace=True)
+# Cache Shared By The gunicorn Workers (Off Unless DASHBOARD_SHARED_CACHE Is Set)
+# e.g. DASHBOARD_SHARED_CACHE=file:///tmp/dashboard-cache?max_mb=256 or redis://localhost:6379/0
+# (The Aggregates Are Stored Pickled --> Only Point It To a Store You Trust)
+# Figure Callbacks Run In Background Processes (Off Unless DASHBOARD_BACKGROUND=<folder>,
+# Needs pip install "dash[diskcache]"): The Worker Stays Free, a Render Is Cancelled When
+# The Page, Year or Job Changes Again & Its Graph Is Dimmed While It Computes
+background_folder = os.environ.get("DASHBOARD_BACKGROUND")
+background_manager = make_background_manager(background_folder)
 
-# Remove Outliers in Salary
-q1, q3 = df["Salary_in_USD"].quantile([0.25, 0.75])
-IQR = q3 - q1
-lower = q1 - (IQR * 1.5)
-upper = q3 + (IQR * 1.5)
+# The Background Processes Are Forks --> Their Figures Reach The Others Through The
+# Shared Cache (a Folder Next To The Jobs, Unless DASHBOARD_SHARED_CACHE Is Set)
+shared_cache = make_shared_cache(os.environ.get("DASHBOARD_SHARED_CACHE") or (
+    background_folder and f"file://{os.path.abspath(os.path.join(background_folder, 'figures'))}"))
 
-filt = (df["Salary_in_USD"] >=lower) & (df["Salary_in_USD"] < upper)
-df = df[filt].copy().reset_index(drop=True)
 
-df["Company_Location"].replace("Israel", "Palestine", inplace=True)
+# One Copy of The Data For All The gunicorn Workers (DASHBOARD_SHARED_DATA=1):
+# The Cleaned Columns (Integer Codes + String Tables) & The Row Index Are Mapped
+# Read-Only From The Snapshot Files, and With --preload The Objects Built At
+# Import Are Frozen Before The Workers Are Forked (See The End of This File)
+shared_data = os.environ.get("DASHBOARD_SHARED_DATA") == "1"
 
-# Let's Select Columns That We Work With !!
-df = df[["Job_Title", "Employment_Type",  "Experience_Level",  "Expertise_Level",
-         "Company_Location", "Salary_in_USD", "Company_Size", "Year"]].copy()
 
+def load_state():
+    mmap_mode = "r" if shared_data else None
 
-# Companues Location
-jobs_title = sorted(df["Job_Title"].unique().tolist())
-jobs_title.insert(0,"All")
+    # Typed Load + Cleaning (Column Names, Outliers, Job & Location Fixes)
+    # Run `python data_loader.py` To See The Memory Saving
+    df = load_data(data_path, chunksize=chunksize, iqr_method=iqr_method, mmap_mode=mmap_mode)
+    startup.mark("data load")
+
+    # Changes Whenever The CSV or The Cleaning Changes
+    version = snapshot_key(data_path, iqr_method)
+
+    # Row Positions of Every Year, Job & (Year, Job) --> Filters Without Scans
+    if shared_data:
+        row_index = RowIndex.cached(df, snapshot_dir(data_path), version, mmap_mode)
+    else:
+        row_index = RowIndex(df)
+
+    # Counts & Salary Sums Per (Year, Job, Column) --> Built Once For All Charts
+    # (By The First Worker, The Others Load It From The Shared Cache)
+    cube = get_or_build(shared_cache, f"cube:{version}", lambda: build_cube(df, row_index),
+                        dumps=lambda cube: pickle.dumps(cube, pickle.HIGHEST_PROTOCOL), loads=pickle.loads)
+
+    # Card Numbers (Counts, Mean, Percentiles ...) of Every (Year, Job) In One Pass
+    kpis = build_kpis(df)
+
+    # Salary Histograms (Fixed Bins) of Every (Year, Job, Group) --> Distribution Page
+    histograms = build_histograms(df)
+    startup.mark("aggregates")
+
+    return DataState(df, version, row_index, cube, kpis=kpis, histograms=histograms)
+
+
+# Or One CSV Per Year (SALARY_PARTITIONS=<folder>, See partitions.py): The
+# Years Are Loaded On First Use, At Most DASHBOARD_PARTITIONS_RESIDENT At Once
+partitions_folder = os.environ.get("SALARY_PARTITIONS")
+partitions_resident = int(os.environ.get("DASHBOARD_PARTITIONS_RESIDENT", 2))
+
+# The Data Every Callback Reads --> `live.current` (Swapped Whole On Refresh)
+live = LiveDataset()
+if partitions_folder:
+    live.swap(PartitionedState(partitions_folder, resident=partitions_resident))
+    startup.mark("data load")
+elif refresh_seconds:
+    # Read From The Raw Files (No Snapshot) So New Rows Can Be Folded In
+    live.follow(data_path, append_dir, iqr_method)
+    startup.mark("data load")
+else:
+    # Marks Its Own Phases
+    live.swap(load_state())
+
+# Job Menu Searched On The Server (DASHBOARD_JOB_SEARCH=1, On By Itself Above
+# JOB_SEARCH_TITLES Titles): Only The Best Matches of What Is Typed Are Sent
+JOB_SEARCH_TITLES = 1000
+JOB_SEARCH_LIMIT = 20
+job_search = os.environ.get("DASHBOARD_JOB_SEARCH", "auto") == "1" or (
+    os.environ.get("DASHBOARD_JOB_SEARCH", "auto") == "auto" and len(live.current.jobs_title) > JOB_SEARCH_TITLES)
+
+# Figures Already Built For a (Chart, Year, Job) --> Served From Memory
+# (Size Set By figure_cache_size() Below, Once The Warm-Up Figures Are Known)
+FIGURE_CACHE_SIZE = 4096
+figure_cache = FigureCache(maxsize=FIGURE_CACHE_SIZE, version=live.current.version, shared=shared_cache)
+
+# Chart Templates: Drawn Now (~1s), Or By The First Chart With DASHBOARD_FAST_START=1
+if os.environ.get("DASHBOARD_FAST_START") != "1":
+    figures.load_templates()
+startup.mark("figure templates")
 
 # -------------- Start The App ------------------ #
-app = Dash(__name__, external_stylesheets=[dbc.themes.VAPOR])
+app = Dash(__name__, external_stylesheets=[dbc.themes.VAPOR],
+           # The Graphs Only Exist On Their Page
+           suppress_callback_exceptions=True,
+           background_callback_manager=background_manager)
 # To render on web app
 server = app.server
 
@@ -71,8 +175,17 @@ pages_dict = {
     "Locations": "/Locations",
     "Experiences/ Experties": "/experinces",
     "Time Series": "/TimeSeries",
+    "Salary Distribution": "/distribution",
 }
 
+# Latency / Payload Metrics On /metrics (Switch Off With DASHBOARD_METRICS=0)
+metrics = Metrics(enabled=os.environ.get("DASHBOARD_METRICS", "1") != "0", routes=pages_dict.values())
+metrics.add_collector(figure_cache_collector(figure_cache))
+metrics.register(server)
+
+# Counts The Aggregated Rows Each Chart Reads
+get_cell = metrics.count_rows(get_cell)
+
 
 # Modal Alert
 def get_alert(job_value, year_value):
@@ -93,949 +206,812 @@ def get_alert(job_value, year_value):
         style={"box-shadow": "none", "text-shdow":"none"}
     )
 
-# Nav Bar
-sidebar = html.Div(
-    [
-        html.H1("Sidebar",
-                style={"font": "bold 35px tahoma",
-                       "margin-top": "30px",
-                       "margin-bottom": "20px",
-                       "color":"#fefefe",
-                       "text-align":"center"}),
-        html.Hr(),
-        dbc.Nav(
-            [
-                dbc.NavLink(k, href=f"{v}",
-                            className="btn", active="exact",
-                            style={"margin-bottom":"20px"})
-                for k, v in pages_dict.items()
-            ],
-            vertical=True,
-            pills=True,
-        ),
-        html.Br(),
+# Year Menu --> "All Years" + The Years In The Data
+def year_options(years):
+    options = [{"label": html.Span(["All Years"], style={'color': '#D62AD0', 'font-size': 17}), "value": "all"}]
+    for year in years:
+        options.append({"label": html.Span([year], style={'color': '#FF00E4', 'font-size': 17}), "value": year})
+    return options
 
-        # dbc.Label("Year"),
-        dcc.Dropdown(
-                id="year-menu",
-                options=[
-                    {
-                        "label": html.Span(["All Years"], style={'color': '#D62AD0', 'font-size': 17}),
-                        "value": "all",
-                    },
-                    {
-                        "label": html.Span([2021], style={'color': '#FF00E4', 'font-size': 17}),
-                        "value": 2021,
-                    },
-                    {
-                        "label": html.Span([2022], style={'color': '#FF00E4', 'font-size': 17}),
-                        "value": 2022,
-                    },
-                    {
-                        "label": html.Span([2023], style={'color': '#FF00E4', 'font-size': 17}),
-                        "value": 2023,
-                    },
+# Nav Bar
+def get_sidebar():
+    data = live.current
+    return html.Div(
+        [
+            html.H1("Sidebar",
+                    style={"font": "bold 35px tahoma",
+                           "margin-top": "30px",
+                           "margin-bottom": "20px",
+                           "color":"#fefefe",
+                           "text-align":"center"}),
+            html.Hr(),
+            dbc.Nav(
+                [
+                    dbc.NavLink(k, href=f"{v}",
+                                className="btn", active="exact",
+                                style={"margin-bottom":"20px"})
+                    for k, v in pages_dict.items()
                 ],
-                value="all",
+                vertical=True,
+                pills=True,
+            ),
+            html.Br(),
+
+            # dbc.Label("Year"),
+            dcc.Dropdown(
+                    id="year-menu",
+                    options=year_options(data.years),
+                    value="all",
+
+                    multi=False,
+                    searchable=False,
+                    clearable=False,
+                    style={
+                        "color": "white",
+                        "border": "0px",
+                        "font-family": "tahoma",
+                        "margin-bottom": "15px",
+                        "background-color": "black"
+
+                    }
+                ),
+            html.Br(),
+            dcc.Dropdown(
+                id="job-menu",
+                options = [
+                    {"label": html.Span([i], style={'color': '#9818D6', 'font-size': 17}), "value": i,} for i in  (["All"] if job_search else data.jobs_title)
 
+                ],
+                value="All",
                 multi=False,
-                searchable=False,
+                optionHeight= 60,
                 clearable=False,
+                searchable=True,
                 style={
-                    "color": "white",
+                    "color":"white",
                     "border": "0px",
                     "font-family": "tahoma",
                     "margin-bottom": "15px",
-                    "background-color": "black"
-
+                    "background-color": "#000"
                 }
-            ),
-        html.Br(),
-        dcc.Dropdown(
-            id="job-menu",
-            options = [
-                {"label": html.Span([i], style={'color': '#9818D6', 'font-size': 17}), "value": i,} for i in  jobs_title
-
-            ],
-            value="All",
-            multi=False,
-            optionHeight= 60,
-            clearable=False,
-            searchable=True,
-            style={
-                "color":"white",
-                "border": "0px",
-                "font-family": "tahoma",
-                "margin-bottom": "15px",
-                "background-color": "#000"
-            }
 
-        ),
+            ),
 
 
-    ],
-    style=sidebar_style
-)
+        ],
+        style=sidebar_style
+    )
 
 header=  html.H1(f"", id="header", style={"text-align":"center"})
 
 # page content
 content = html.Div(id="page-content", children = [], style = content_style)
 
-# ►►► App Layout
-app.layout = html.Div([
-    dcc.Location(id = "page-url"),
-    sidebar,
-    header,
-    content,
-], className="container-fluid")
+# Jobs of Every Year ("all" + Each Year) --> Sent With The Page, Used By The
+# Browser To Fill The Job Menu Without Asking The Server
+def jobs_store():
+    data = live.current
+    return dcc.Store(id="jobs-store", data={
+        str(year): sorted(get_cell(data.cube, year, "All", "Job_Title").index.tolist())
+        for year in ["all"] + data.years
+    })
+
+# Search Index of The Job Titles, Rebuilt When The Data Changes
+job_search_indexes = {}
+
+def job_search_index():
+    data = live.current
+    index = job_search_indexes.get(data.version)
+    if index is None:
+        job_counts = {}
+        for year in ["all"] + data.years:
+            cell = get_cell(data.cube, year, "All", "Job_Title")
+            job_counts[year] = dict(zip(cell.index.tolist(), cell["count"].tolist()))
+        index = JobSearchIndex(job_counts)
+        job_search_indexes.clear()
+        job_search_indexes[data.version] = index
+    return index
+
+# ►►► App Layout (Built On Each Page Load --> Jobs of The Current Data)
+def serve_layout():
+    return html.Div([
+        dcc.Location(id = "page-url"),
+        # Not Needed (Nor Sent) When The Job Menu Is Searched On The Server
+        *([] if job_search else [jobs_store()]),
+        get_sidebar(),
+        header,
+        content,
+    ], className="container-fluid")
+
+app.layout = serve_layout
 
 # ****************************************************************************
 # **************************** Creating Graphs Functions *********************
 # ****************************************************************************
 
 # ---------------- Home Page Graphs ----------------
+@figure_cache.memoize
+@metrics.track_chart
 def create_top_job_chart(year):
-    if year == "all":
-        df_filtered = df.copy()
+    df_filtered = top_counts(get_cell(live.current.cube, year, "All", "Job_Title"), 10)[::-1]
 
-    else:
-        filt = df["Year"] == year
-        df_filtered = df[filt].copy()
+    # Bar Chart of Wanted Job
+    return figures.top_job_chart(df_filtered)
 
-    df_filtered = df_filtered["Job_Title"].value_counts().sort_values(ascending=False).head(10)[::-1]
+@figure_cache.memoize
+@metrics.track_chart
+def create_high_salary_job_chart(year):
+    df_filtered = top_means(get_cell(live.current.cube, year, "All", "Job_Title"), 10)[::-1]
 
     # Bar Chart of Wanted Job
-    fig_wanted_job = px.bar(df_filtered,
-                 orientation="h",
-                 y = df_filtered.index ,
-                 x = (df_filtered / sum(df_filtered)) * 100,
-                 # color = df_filtered.index,
-                 color_discrete_sequence=["#A31ACB"],
-                 title= "Top Demanded Job",
-                 labels={"x": "Popularity of Jobs(%)", "Job_Title": "Job Title"},
-                 template="plotly_dark",
-                 text = df_filtered.apply(lambda x: f"{(x / sum(df_filtered)) * 100:0.2f}%")
-                 )
-
-    fig_wanted_job.update_layout(
-        showlegend= False,
-        title={
-            "font": {
-                "size": 35,
-                "family": "tahoma",
-            }
-        }
-    )
+    return figures.high_salary_job_chart(df_filtered)
 
-    fig_wanted_job.update_traces(
-        textfont = {
-                   "family": "consolas",
-                   "size": 14,
-                    "color":"white"
-                   },
-        hovertemplate="Job Title: %{label}<br>Popularity (%): %{value}",
-    )
+def create_cards(year):
+    # Read From The KPI Table (kpi_engine.py), No Rows Scanned
+    kpi = live.current.kpis.get(year, "All")
+    if kpi is None:
+        return [0, "-", "-", "-"]
 
-    return fig_wanted_job
+    all_jobs = kpi["jobs"]
+    avg_salary = f"${kpi['mean']:0,.0f}"
+    median_salary = f"${kpi['median']:0,.0f}"
+    middle_salary = f"Middle 50%: ${kpi['p25']:0,.0f} - ${kpi['p75']:0,.0f}"
 
-def create_high_salary_job_chart(year):
-    if year == "all":
-        df_filtered = df.copy()
-    else:
-        filt = df["Year"] == year
-        df_filtered = df[filt].copy()
+    return [all_jobs, avg_salary, median_salary, middle_salary]
 
-    df_filtered = df_filtered.groupby("Job_Title")["Salary_in_USD"].mean().sort_values(ascending=False).head(10)[::-1]
 
-    # Bar Chart of Wanted Job
-    fig_wanted_job = px.bar(df_filtered,
-                 y = df_filtered.index ,
-                 x = df_filtered ,
-                 orientation="h",
-                 color_discrete_sequence = ["#C32BAD"],
-                 title= "Jobs of the Highest Average Salary",
-                 labels={"Job_Title": "Job Title", "x": "AVG Salary (USD)"},
-                 template="plotly_dark",
-                 text_auto = "0.3s"
-                 )
-
-    fig_wanted_job.update_layout(
-        showlegend= False,
-        title={
-            "font": {
-                "size": 35,
-                "family": "tahoma",
-            }
-        }
-    )
+# *************** Locations Graphs *************
+@figure_cache.memoize
+@metrics.track_chart
+def create_top_locations(year, job):
+    df_filtered = top_counts(get_cell(live.current.cube, year, job, "Company_Location"), 5)
 
-    fig_wanted_job.update_traces(
-        textfont = {
-                   "family": "consolas",
-                   "size": 15,
-                    "color":"white"
-                   },
-        hovertemplate="Job Title: %{label}<br>AVG Salary: %{value}",
-    )
+    # Scatter For 1-2 Locations, Bar Chart Otherwise
+    return figures.top_locations(df_filtered)
 
-    return fig_wanted_job
+@figure_cache.memoize
+@metrics.track_chart
+def create_salary_locations(year, job):
+    df_filtered = top_means(get_cell(live.current.cube, year, job, "Company_Location"), 10)[::-1]
 
-def create_cards(year):
-    if year == "all":
-        df_filtered = df.copy()
-    else:
-        filt = df["Year"] == year
-        df_filtered = df[filt].copy()
+    # Scatter For 1-3 Locations, Bar Chart Otherwise
+    return figures.salary_locations(df_filtered)
 
-    all_jobs = df_filtered["Job_Title"].nunique()
-    avg_salary = df_filtered["Salary_in_USD"].mean()
-    avg_salary = f"${avg_salary:0,.0f}"
 
+# ================ Experience Graphs ================
+@figure_cache.memoize
+@metrics.track_chart
+def create_bar_experince(year, job):
+    df_filtered = top_means(get_cell(live.current.cube, year, job, "Experience_Level"))
 
+    # Scatter For 1-2 Levels, Bar Chart Otherwise
+    return figures.bar_experince(df_filtered)
 
-    return [all_jobs, avg_salary]
+@figure_cache.memoize
+@metrics.track_chart
+def create_pie_experince_popularity(year, job):
+    df_filtered = cell_counts(get_cell(live.current.cube, year, job, "Experience_Level"))
+    return figures.pie_experince_popularity(df_filtered)
 
+@figure_cache.memoize
+@metrics.track_chart
+def create_pie_experties_popularity(year, job):
+    df_filtered = cell_counts(get_cell(live.current.cube, year, job, "Expertise_Level"))
+    return figures.pie_experties_popularity(df_filtered)
 
-# *************** Locations Graphs *************
-def create_top_locations(year, job):
-    chart_title = "Top Location of Jobs"
-    df_filtered = ""
-    if year == "all":
-        df_filtered = df.copy()
+# ================== Time Series ===============
+@figure_cache.memoize
+@metrics.track_chart
+def create_year_line_chart(job):
+    df_filtered = cell_means(get_cell(live.current.cube, "all", job, "Year")).to_frame()
+    return figures.year_line_chart(df_filtered, job)
+
+# ================== Salary Distribution ===============
+# Only Bin Counts & Quartiles Reach The Figures (histograms.py), Never The Salaries
+DISTRIBUTION_GROUPS = {
+    "Experience_Level": "Experience Level",
+    "Company_Size": "Company Size",
+    "Job_Title": "Job Title",
+}
+# Levels In Their Natural Order (Values Not Listed Go After, Sorted)
+GROUP_ORDER = {
+    "Experience_Level": ["Entry", "Mid", "Senior", "Executive"],
+    "Company_Size": ["Small", "Medium", "Large"],
+}
+# Grouped By Job Title --> The Most Common Jobs Only
+DISTRIBUTION_TOP_JOBS = 10
+
+
+def distribution_histogram(year, job, group):
+    histogram = get_histogram(live.current.histograms, year, job, group)
+    if group == "Job_Title":
+        return histogram.take(top_k(histogram.sizes(), DISTRIBUTION_TOP_JOBS))
+
+    order = GROUP_ORDER.get(group, [])
+    rank = {label: i for i, label in enumerate(order)}
+    positions = sorted(range(len(histogram.labels)),
+                       key=lambda i: (rank.get(histogram.labels[i], len(order)), histogram.labels[i]))
+    return histogram.take(positions)
+
+@figure_cache.memoize
+@metrics.track_chart
+def create_salary_histogram(year, job, group):
+    histogram = distribution_histogram(year, job, group)
+
+    # Rows Per Bin: Bin Centres x Group Values
+    df_filtered = pd.DataFrame(histogram.counts.T,
+                               index=pd.Index(histogram.edges() + SALARY_BIN_WIDTH / 2, name="Salary_in_USD"),
+                               columns=pd.Index(histogram.labels, name=DISTRIBUTION_GROUPS[group]))
+    return figures.salary_histogram(df_filtered)
+
+@figure_cache.memoize
+@metrics.track_chart
+def create_salary_box(year, job, group):
+    histogram = distribution_histogram(year, job, group)
+
+    # Quartiles, Whisker Ends & Mean of Every Group Value
+    df_filtered = pd.DataFrame(histogram.box_summary(),
+                               index=pd.Index(histogram.labels, name=DISTRIBUTION_GROUPS[group]))
+    return figures.salary_box(df_filtered)
 
-    else:
-        filt = df["Year"] == year
-        df_filtered = df[filt].copy()
+# ****************************************************************************
+# ******************************* Pages Layouts ******************************
+# ****************************************************************************
+# The pages are static, every graph & card is filled by its own callback, so
+# changing the year or the job only rebuilds the figures that depend on it.
+
+card_style = {"background-color": "#000", "text-align": "center",
+              "border": "1px solid purple", "border-radius": "10px", "margin-bottom": "5px"}
+
+home_layout = html.Div([
+    html.Br(),
+    dbc.Row([
+        html.H1("Data Science Salary Analysis", style={"font":"bold 40px tahoma", "text-align": "center"})
+
+    ]),
+    html.Br(),
+
+    dbc.Row([
+        dbc.Col([
+            dbc.Card(
+                dbc.CardBody([
+                    html.H3("Availbale Jobs", style={"color":"#FFA1F5"}),
+                    html.H3(id='availbale-job-crd')
+                ], style=card_style)
+            ),
 
-    if job == "All":
-        df_filtered = df_filtered.copy()
+        ]),
+        dbc.Col([
+            dbc.Card(
+                dbc.CardBody([
+                    html.H3("Average Salary per Job", style={"color":"#FFA1F5"}),
+                    html.H3(id='salary-job-crd')
+                ], style=card_style)
+            ),
+        ]),
+        dbc.Col([
+            dbc.Card(
+                dbc.CardBody([
+                    html.H3("Median Salary", style={"color":"#FFA1F5"}),
+                    html.H3(id='median-salary-crd'),
+                    html.P(id='middle-salary-crd', style={"margin-bottom": "0"})
+                ], style=card_style)
+            ),
+        ]),
+    ]),
+    html.Br(),
 
-    else:
-        filt = df_filtered["Job_Title"] == job
-        df_filtered = df_filtered[filt].copy()
-
-    df_filtered = df_filtered["Company_Location"].value_counts().sort_values(ascending=False).head(5)
-
-    if len(df_filtered) > 0 and len(df_filtered) <3:
-        fig_wanted_job = px.scatter(df_filtered,
-                                    x=df_filtered.index,
-                                    y=df_filtered,
-                                    color=df_filtered.index,
-                                    size=df_filtered,
-                                    color_discrete_sequence=["#FCDDB0", "#FF9F9F", "#EDD2F3"],
-                                    template="plotly_dark",
-                                    labels={"y": "Popularity",
-                                            "Company_Location": "Company Location"},
-                                    title=chart_title,
-                                    opacity=0.8,
-                                    )
+    dbc.Row([
+        dbc.Col([
+            dcc.Graph(id="top-10-job", style={"margin-bottom": "10px", "height": "580px"})
+        ], width=12),
+    ]),
 
-    else:
-        # Bar Chart of Wanted Job
-        fig_wanted_job = px.bar(df_filtered,
-                     # orientation="h",
-                     x = df_filtered.index ,
-                     y = (df_filtered / sum(df_filtered)) * 100,
-                     color_discrete_sequence = ["#A31ACB"],
-                     title=chart_title,
-                     labels={"y": "Popularity of Jobs(%)", "Company_Location": "Company Location"},
-                     template="plotly_dark",
-                     text = df_filtered.apply(lambda x: f"{x}\n({(x / sum(df_filtered)) * 100:0.2f}%)")
-                     )
-        fig_wanted_job.update_traces(
-            textfont = {
-                       "family": "consolas",
-                       "size": 15,
-                        "color":"white"
-                       },
-            hovertemplate="Company Location: %{label}<br>Popularity (%): %{text}",
-        )
-
-    fig_wanted_job.update_layout(
-        showlegend= False,
-        title={
-            "font": {
-                "size": 35,
-                "family": "tahoma",
-            }
-        },
-        hoverlabel={
-            "bgcolor": "#C32BAD",
-            "font_size": 16,
-            "font_family": "tahoma"
-        }
-    )
+    html.Hr(),
 
-    return fig_wanted_job
+    dbc.Row([
+        dbc.Col([
+            dcc.Graph(id="high-salary-job", style={"margin-bottom": "10px", "height": "580px"})
+        ], width=12),
+    ])
 
-def create_salary_locations(year, job):
-    chart_title = "Top Comapny Location and AVG Salary Per Job"
-    df_filtered = ""
-    if year == "all":
-        df_filtered = df.copy()
+])
 
-    else:
-        filt = df["Year"] == year
-        df_filtered = df[filt].copy()
+locations_layout = html.Div([
+    html.Div(id="page-alert"),
 
-    if job == "All":
-        df_filtered = df_filtered.copy()
+    html.Div([
+        html.Br(),
+        dbc.Row([
+            html.H1("Data Science Jobs & Locations", style={"font":"bold 40px tahoma", "text-align": "center"})
 
-    else:
-        filt = df_filtered["Job_Title"] == job
-        df_filtered = df_filtered[filt].copy()
-
-    df_filtered = df_filtered.groupby("Company_Location")["Salary_in_USD"].mean().sort_values(ascending=False).head(10)[::-1]
-
-    if len(df_filtered) > 0 and len(df_filtered) < 4:
-        fig_salary_job_loc = px.scatter(df_filtered,
-                                        x = df_filtered.index,
-                                        y = df_filtered,
-                                        color=df_filtered.index,
-                                        size=df_filtered,
-                                        color_discrete_sequence=["#FCDDB0", "#FF9F9F", "#EDD2F3"],
-                                        template="plotly_dark",
-                                        labels={"y": "AVG Salary(USD)",
-                                               "Company_Location": "Company Location"},
-                                        title=chart_title ,opacity=0.8
-
-                                        )
-        fig_salary_job_loc.update_layout(
-            title={
-                "font": {
-                    "size": 35,
-                    "family": "tahoma",
-                }
-            },
-            hoverlabel = {
-                "bgcolor":"#222",
-                "font_size":14,
-                "font_family":"Rockwell"
-            }
-        )
+        ]),
+        html.Br(),
 
-    else:
-        fig_salary_job_loc = px.bar(df_filtered,
-                             orientation="h",
-                             x = df_filtered,
-                             y=df_filtered.index,
-                             color_discrete_sequence = ["#C32BAD"],
-                             title= chart_title,
-                             labels={"x": "AVG Salary(USD)", "Company_Location": "Company Location"},
-                             template="plotly_dark",
-                             text_auto = "0.3s"
-                     )
-
-        fig_salary_job_loc.update_traces(
-            textfont = {
-                       "family": "consolas",
-                       "size": 15,
-                        "color":"white"
-                       },
-            hovertemplate="Company Location: %{label}<br>AVG Salary: %{value}",
-        )
-
-    fig_salary_job_loc.update_layout(
-        showlegend= False,
-        title={
-            "font": {
-                "size": 35,
-                "family": "tahoma",
-            }
-        },
-        hoverlabel={
-            "bgcolor": "#C32BAD",
-            "font_size": 16,
-            "font_family": "tahoma"
-        }
-    )
+        dbc.Row([
+            dbc.Col([
+                dcc.Graph(id="top-location", style={"margin-bottom": "10px", "height": "580px"})
+            ], width=12),
+        ]),
 
-    return fig_salary_job_loc
+        html.Hr(),
 
+        dbc.Row([
+            dbc.Col([
+                dcc.Graph(id="top-salary-location", style={"margin-bottom": "10px", "height": "580px"})
+            ], width=12),
+        ], style={"border-bottom": "1px solid darkcyan"})
 
-# ================ Experience Graphs ================
-def create_bar_experince(year, job):
-    chart_title = "Expected Salary Per Experience Level"
-    df_filtered = ""
-    if year == "all":
-        df_filtered = df.copy()
+    ], id="page-graphs"),
+])
 
-    else:
-        filt = df["Year"] == year
-        df_filtered = df[filt].copy()
+experiences_layout = html.Div([
+    html.Div(id="page-alert"),
 
-    if job == "All":
-        df_filtered = df_filtered.copy()
+    html.Div([
+        html.Br(),
+        dbc.Row([
+            html.H1("Data Science Jobs & Experience Level",
+                    style={"font": "bold 40px tahoma", "text-align": "center"})
+        ]),
+        html.Br(),
 
-    else:
-        filt = df_filtered["Job_Title"] == job
-        df_filtered = df_filtered[filt].copy()
-
-    df_filtered = df_filtered.groupby("Experience_Level")["Salary_in_USD"].mean().sort_values(ascending=False)
-
-    if len(df_filtered) > 0 and len(df_filtered) < 3:
-        fig_experience = px.scatter(df_filtered,
-                                    x=df_filtered.index,
-                                    y=df_filtered,
-                                    color=df_filtered.index,
-                                    size=df_filtered,
-                                    color_discrete_sequence=["#FCDDB0", "#FF9F9F", "#EDD2F3"],
-                                    template="plotly_dark",
-                                    labels={"y": "AVG Salary",
-                                            "Experience_Level": "Experience Level"},
-                                    title=chart_title,
-                                    opacity=0.8,
-                                    )
+        dbc.Row([
+            dbc.Col([
+                dcc.Graph(id="experience-salary", style={"margin-bottom": "10px", "height": "600px"})
+            ], width=12),
+        ]),
 
-    else:
-        fig_experience = px.bar(df_filtered,
-                                x = df_filtered.index,
-                                y = df_filtered,
-                                color=df_filtered.index,
-                               color_discrete_sequence=["#C0DEFF", "#FCDDB0", "#FF9F9F", "#EDD2F3"],
-                               template="plotly_dark",
-                               title=chart_title,
-                                labels={"Experience_Level": "Experience Level", "y":"AVG Salary"},
-                                text_auto="0.3s"
-                       )
-
-        fig_experience.update_traces(
-            textfont = {
-                       "family": "consolas",
-                       "size": 18,
-                        "color":"#111"
-                       },
-            hovertemplate="Experience Level: %{label}<br>AVG Salary: %{value}",
-        )
-
-    fig_experience.update_layout(
-        showlegend=False,
-        title={
-            "font": {
-                "size": 28,
-                "family": "tahoma",
-            }
-        },
-        hoverlabel={
-            "bgcolor": "#000",
-            "font_size": 16,
-            "font_family": "tahoma"
-        },
-        xaxis={
-            "tickfont": {
-                "family": "arial",
-                "size": 15,
-            }
-        }
-    )
+        html.Hr(),
 
-    return fig_experience
+        dbc.Row([
+            dbc.Col([
+                html.H4("Frequency of Demanded Experience", style={"text-align": "center", "margin-top": "10px"}),
+                dcc.Graph(id="large-company", style={"height": "400px"})
+            ], style={"background-color": "rgb(17, 17, 17)", "margin-right":"10px"}),
+            dbc.Col([
+                html.H4("Frequency of Demanded Expert Level", style={"text-align": "center", "margin-top": "10px"}),
 
-def create_pie_experince_popularity(year, job):
-    df_filtered = ""
-    if year == "all":
-        df_filtered = df.copy()
+                dcc.Graph(id="medium-company", style={"height": "400px"})
+            ], style={"background-color": "rgb(17, 17, 17)", }),
 
-    else:
-        filt = df["Year"] == year
-        df_filtered = df[filt].copy()
+        ]),
 
-    if job == "All":
-        df_filtered = df_filtered.copy()
+    ], id="page-graphs"),
+])
 
-    else:
-        filt = df_filtered["Job_Title"] == job
-        df_filtered = df_filtered[filt].copy()
-
-    df_filtered = df_filtered["Experience_Level"].value_counts()
-    fig_pie_chart = px.pie(values=df_filtered,
-                           names=df_filtered.index,
-                           hole=0.40, template="plotly_dark",
-                           color=df_filtered.index,
-                           color_discrete_sequence=["#ADA2FF", "#C0DEFF", "#FCDDB0", "#FF9F9F", "#EDD2F3"],
-                           )
-
-
-    fig_pie_chart.update_traces(
-        textinfo="percent+label",
-        textposition="outside",
-        textfont = {
-                   "family": "consolas",
-                   "size": 14,
-                    "color":"white"
-                   },
-        hovertemplate="Experience Level: %{label}<br>Frequency: %{value}",
-        marker=dict(line=dict(color='#111', width=2))
-    )
+time_series_layout = html.Div([
+    html.Div(id="page-alert"),
 
-    fig_pie_chart.update_layout(
-        title={
-            "font": {
-                "size": 28,
-                "family": "tahoma",
-            }
-        },
-        hoverlabel={
-            "bgcolor": "#000",
-            "font_size": 16,
-            "font_family": "tahoma"
-        },
-    )
+    html.Div([
+        html.Br(),
+        dbc.Row([
+            html.H1("Data Science Jobs & Experience Level",
+                    style={"font": "bold 40px tahoma", "text-align": "center"})
+        ]),
+        html.Br(),
 
-    return fig_pie_chart
+        dbc.Row([
+            dbc.Col([
+                dcc.Graph(id="year-salary", style={"margin-bottom": "10px", "height": "600px"})
+            ], width=12),
+        ]),
 
-def create_pie_experties_popularity(year, job):
-    df_filtered = ""
-    if year == "all":
-        df_filtered = df.copy()
+    ], id="page-graphs"),
+])
 
-    else:
-        filt = df["Year"] == year
-        df_filtered = df[filt].copy()
+distribution_layout = html.Div([
+    html.Div(id="page-alert"),
 
-    if job == "All":
-        df_filtered = df_filtered.copy()
+    html.Div([
+        html.Br(),
+        dbc.Row([
+            html.H1("Data Science Salary Distribution",
+                    style={"font": "bold 40px tahoma", "text-align": "center"})
+        ]),
+        html.Br(),
 
-    else:
-        filt = df_filtered["Job_Title"] == job
-        df_filtered = df_filtered[filt].copy()
-
-    df_filtered = df_filtered["Expertise_Level"].value_counts()
-    fig_pie_chart = px.pie(values=df_filtered,
-                           names=df_filtered.index,
-                           hole=0.38, template="plotly_dark",
-                           color=df_filtered.index,
-                           color_discrete_sequence=["#ADA2FF", "#C0DEFF", "#FCDDB0", "#FF9F9F", "#EDD2F3"],
-                           )
-
-    fig_pie_chart.update_traces(
-        textinfo="percent+label",
-        textposition="outside",
-        textfont={
-            "family": "consolas",
-            "size": 14,
-            "color": "white"
-        },
-        hovertemplate="Experience Level: %{label}<br>Frequency: %{value}",
-        marker=dict(line=dict(color='#111', width=2))
-    )
+        dbc.Row([
+            dbc.Col([
+                dbc.RadioItems(
+                    id="distribution-group",
+                    options=[{"label": label, "value": group} for group, label in DISTRIBUTION_GROUPS.items()],
+                    value="Experience_Level",
+                    inline=True,
+                    style={"font": "bold 18px tahoma", "text-align": "center"},
+                ),
+            ], width=12),
+        ]),
+        html.Br(),
+
+        dbc.Row([
+            dbc.Col([
+                dcc.Graph(id="salary-histogram", style={"margin-bottom": "10px", "height": "580px"})
+            ], width=12),
+        ]),
+
+        html.Hr(),
 
-    fig_pie_chart.update_layout(
-        title={
-            "font": {
-                "size": 28,
-                "family": "tahoma",
+        dbc.Row([
+            dbc.Col([
+                dcc.Graph(id="salary-box", style={"margin-bottom": "10px", "height": "580px"})
+            ], width=12),
+        ]),
+
+    ], id="page-graphs"),
+])
+
+pages_layout = {
+    "/": home_layout,
+    "/Locations": locations_layout,
+    "/experinces": experiences_layout,
+    "/TimeSeries": time_series_layout,
+    "/distribution": distribution_layout,
+}
+
+
+def job_exists(year_value, job_value):
+    return job_value == "All" or job_value in get_cell(live.current.cube, year_value, "All", "Job_Title").index
+
+
+# ****************************************************************************
+# ********************************* Callbacks ********************************
+# ****************************************************************************
+
+# ►►► Page Layout --> Only When The Page Changes
+@app.callback(
+    Output(component_id="page-content", component_property="children"),
+    Input(component_id="page-url", component_property="pathname"),
+)
+@metrics.track_callback
+def get_page_content(pathname):
+    return pages_layout.get(pathname, [])
+
+
+# ►►► Sidebar Menus --> Runs In The Browser (No Server Round-Trip)
+if not job_search:
+    app.clientside_callback(
+        """
+        function(pathname, year_value, jobs) {
+            const menuStyle = {
+                "display": "block",
+                "color": "white",
+                "border": "0px",
+                "font-family": "tahoma",
+                "margin-bottom": "15px",
+                "background-color": "black"
+            };
+            const hiddenStyle = {"display": "none"};
+
+            const toOptions = (titles, color, size) => titles.map(job => ({
+                "label": {
+                    "namespace": "dash_html_components",
+                    "type": "Span",
+                    "props": {"children": [job], "style": {"color": color, "font-size": size}}
+                },
+                "value": job
+            }));
+
+            if (pathname === "/") {
+                const titles = jobs[String(year_value)].slice();
+                if (year_value !== "all") {
+                    titles.unshift("All");
+                }
+                return [menuStyle, hiddenStyle, toOptions(titles, "#9818D6", 15)];
+            }
+
+            if (pathname === "/Locations" || pathname === "/experinces" || pathname === "/distribution") {
+                const titles = ["All"].concat(jobs[String(year_value)]);
+                return [menuStyle, menuStyle, toOptions(titles, "#FF00E4", 17)];
+            }
+
+            if (pathname === "/TimeSeries") {
+                const titles = ["All"].concat(jobs["all"]);
+                return [hiddenStyle, menuStyle, toOptions(titles, "#FF00E4", 17)];
             }
-        },
-        hoverlabel={
-            "bgcolor": "#000",
-            "font_size": 16,
-            "font_family": "tahoma"
-        },
+
+            throw window.dash_clientside.PreventUpdate;
+        }
+        """,
+        Output("year-menu", "style"),
+        Output("job-menu", "style"),
+        Output("job-menu", "options"),
+
+        Input(component_id="page-url", component_property="pathname"),
+        Input(component_id="year-menu", component_property="value"),
+        Input(component_id="jobs-store", component_property="data"),
     )
 
-    return fig_pie_chart
+else:
+    # Job Options Come From The Search Callback Below, Only The Styles Here
+    app.clientside_callback(
+        """
+        function(pathname) {
+            const menuStyle = {
+                "display": "block",
+                "color": "white",
+                "border": "0px",
+                "font-family": "tahoma",
+                "margin-bottom": "15px",
+                "background-color": "black"
+            };
+            const hiddenStyle = {"display": "none"};
 
-# ================== Time Series ===============
-def create_year_line_chart(job):
-    df_filtered = ""
-    if job == "All":
-        df_filtered = df.copy()
-    else:
-        filt = (df["Job_Title"] == job)
-        df_filtered = df[filt].copy()
-
-    df_filtered = df_filtered.pivot_table(index="Year", values="Salary_in_USD", aggfunc="mean")
-
-    fig = px.line(df_filtered,
-                  x=list(map(lambda x: str(x), df_filtered.index)),
-                  y="Salary_in_USD",
-                  markers=True,
-                  color_discrete_sequence=["#FF55BB"],
-                  labels={"x": "Year", "Salary_in_USD": "AVG Salary (USD)"},
-                  template="plotly_dark",
-                  title=f"{job} Evolution of The Salary",
-                  )
-
-    fig.update_traces(marker=dict(size=12,
-                                  line=dict(width=2,
-                                            color='#9336B4')))
-
-
-    fig.update_layout(
-        title={
-            "font": {
-                "size": 28,
-                "family": "tahoma",
+            if (pathname === "/") {
+                return [menuStyle, hiddenStyle];
             }
-        },
-        hoverlabel={
-            "bgcolor": "#C32BAD",
-            "font_size": 16,
-            "font_family": "tahoma"
+            if (pathname === "/Locations" || pathname === "/experinces" || pathname === "/distribution") {
+                return [menuStyle, menuStyle];
+            }
+            if (pathname === "/TimeSeries") {
+                return [hiddenStyle, menuStyle];
+            }
+            throw window.dash_clientside.PreventUpdate;
         }
+        """,
+        Output("year-menu", "style"),
+        Output("job-menu", "style"),
+
+        Input(component_id="page-url", component_property="pathname"),
     )
 
-    return fig
 
-@app.callback(
-    Output("year-menu", "style"),
-    Output("job-menu", "style"),
-    Output("job-menu", "options"),
+# ►►► Job Menu Search (Server-Side Mode) --> Best Matches of What Is Typed
+def search_job_menu(search_value, pathname, year_value, job_value):
+    if pathname not in pages_layout:
+        raise PreventUpdate
 
-    Output(component_id="page-content", component_property="children"),
+    year = "all" if pathname == "/TimeSeries" else year_value
+    titles = job_search_index().search(search_value, year, JOB_SEARCH_LIMIT)
+
+    # Same Options As The Full Menu: "All" First (Except Home With All Years)
+    if not (pathname == "/" and year == "all"):
+        titles = ["All"] + titles
+    # The Selected Job Stays In The Options (Or The Menu Would Show It Empty)
+    if job_value and job_value not in titles:
+        titles.append(job_value)
+
+    color, size = ("#9818D6", 15) if pathname == "/" else ("#FF00E4", 17)
+    return [{"label": html.Span([title], style={"color": color, "font-size": size}), "value": title}
+            for title in titles]
+
+
+if job_search:
+    app.callback(
+        Output("job-menu", "options"),
+
+        Input(component_id="job-menu", component_property="search_value"),
+        Input(component_id="page-url", component_property="pathname"),
+        Input(component_id="year-menu", component_property="value"),
+        State(component_id="job-menu", component_property="value"),
+    )(metrics.track_callback(search_job_menu))
+
+
+# ►►► Warning Instead of The Graphs When The Job Did Not Exist In The Year
+@app.callback(
+    Output("page-alert", "children"),
+    Output("page-graphs", "style"),
 
     Input(component_id="page-url", component_property="pathname"),
     Input(component_id="year-menu", component_property="value"),
     Input(component_id="job-menu", component_property="value"),
+)
+@metrics.track_callback
+def update_alert(pathname, year_value, job_value):
+    # Time Series Page Shows All The Years
+    year = "all" if pathname == "/TimeSeries" else year_value
 
+    if job_exists(year, job_value):
+        return None, {'display': 'block'}
 
+    return get_alert(job_value, year_value), {'display': 'none'}
+
+
+# ---------------- Home Page ----------------
+@app.callback(
+    Output("availbale-job-crd", "children"),
+    Output("salary-job-crd", "children"),
+    Output("median-salary-crd", "children"),
+    Output("middle-salary-crd", "children"),
+    Input(component_id="year-menu", component_property="value"),
 )
-def get_page_content(pathname, year_value, job_value="All"):
-    if pathname == "/":
-        if year_value == "all":
-            jobs_title = sorted(df.loc[:, "Job_Title"].unique().tolist())
+@metrics.track_callback
+def update_cards(year_value):
+    return create_cards(year_value)
 
-        else:
-            filt = df["Year"] == year_value
 
-            jobs_title = sorted(df.loc[filt, "Job_Title"].unique().tolist())
-            jobs_title.insert(0, "All")
+@app.callback(
+    Output("top-10-job", "figure"),
+    Input(component_id="year-menu", component_property="value"),
+    **figure_callback_options(background_manager, "top-10-job"),
+)
+@metrics.track_callback
+def update_top_job_chart(year_value):
+    return create_top_job_chart(year_value)
 
 
-        return [
-            # Year Menu
-            {
-                'display': 'block',
-                "color": "white",
-                "border": "0px",
-                "font-family": "tahoma",
-                "margin-bottom": "15px",
-                "background-color": "black"
-            },
-
-            # Job Menu
-            {'display': 'none'},
-
-            [{"label": html.Span([i], style={'color': '#9818D6', 'font-size': 15}), "value": i, }
-            for i in jobs_title],
-
-
-            html.Div([
-                html.Br(),
-                dbc.Row([
-                    html.H1("Data Science Salary Analysis", style={"font":"bold 40px tahoma", "text-align": "center"})
-
-                ]),
-                html.Br(),
-
-                dbc.Row([
-                    dbc.Col([
-                        dbc.Card(
-                            dbc.CardBody([
-                                html.H3("Availbale Jobs", style={"color":"#FFA1F5"}),
-                                html.H3(create_cards(year_value)[0], id='availbale-job-crd')
-                            ], style={"background-color": "#000", "text-align": "center",
-                                      "border": "1px solid purple", "border-radius": "10px", "margin-bottom": "5px"})
-                        ),
-
-                    ]),
-                    dbc.Col([
-                        dbc.Card(
-                            dbc.CardBody([
-                                html.H3("Average Salary per Job", style={"color":"#FFA1F5"}),
-                                html.H3(create_cards(year_value)[1], id='salary-job-crd')
-                            ], style={"background-color": "#000", "text-align": "center",
-                                      "border": "1px solid purple", "border-radius": "10px",  "margin-bottom": "5px"})
-                        ),
-                    ]),
-                ]),
-                html.Br(),
-
-                dbc.Row([
-                    dbc.Col([
-                        dcc.Graph(id="top-10-job", figure=create_top_job_chart(year_value),
-                                  style={"margin-bottom": "10px", "height": "580px"})
-                    ], width=12),
-                ]),
+@app.callback(
+    Output("high-salary-job", "figure"),
+    Input(component_id="year-menu", component_property="value"),
+    **figure_callback_options(background_manager, "high-salary-job"),
+)
+@metrics.track_callback
+def update_high_salary_job_chart(year_value):
+    return create_high_salary_job_chart(year_value)
+
+
+# ---------------- Locations & Experience Pages ----------------
+def register_graph_callback(graph_id, create_chart):
+    @app.callback(
+        Output(graph_id, "figure"),
+        Input(component_id="year-menu", component_property="value"),
+        Input(component_id="job-menu", component_property="value"),
+        **figure_callback_options(background_manager, graph_id),
+    )
+    @metrics.track_callback
+    def update_graph(year_value, job_value):
+        # The Warning Is Shown --> Nothing To Draw
+        if not job_exists(year_value, job_value):
+            raise PreventUpdate
+        return create_chart(year_value, job_value)
+
+    return update_graph
+
+
+for graph_id, create_chart in [
+    ("top-location", create_top_locations),
+    ("top-salary-location", create_salary_locations),
+    ("experience-salary", create_bar_experince),
+    ("large-company", create_pie_experince_popularity),
+    ("medium-company", create_pie_experties_popularity),
+]:
+    register_graph_callback(graph_id, create_chart)
+
+
+# ---------------- Salary Distribution Page ----------------
+def register_distribution_callback(graph_id, create_chart):
+    @app.callback(
+        Output(graph_id, "figure"),
+        Input(component_id="year-menu", component_property="value"),
+        Input(component_id="job-menu", component_property="value"),
+        Input(component_id="distribution-group", component_property="value"),
+        **figure_callback_options(background_manager, graph_id),
+    )
+    @metrics.track_callback
+    def update_graph(year_value, job_value, group):
+        if not job_exists(year_value, job_value):
+            raise PreventUpdate
+        return create_chart(year_value, job_value, group)
 
-                html.Hr(),
+    return update_graph
 
-                dbc.Row([
-                    dbc.Col([
-                        dcc.Graph(id="high-salary-job", figure=create_high_salary_job_chart(year_value),
-                                  style={"margin-bottom": "10px", "height": "580px"})
-                    ], width=12),
-                ])
-
-            ])
-        ]
-
-    elif pathname == "/Locations":
-        if year_value == "all":
-            jobs_title = sorted(df.loc[:, "Job_Title"].unique().tolist())
-            jobs_title.insert(0, "All")
-            if job_value not in jobs_title:
-                page_content = get_alert(job_value, year_value)
-            else:
-
-                page_content = html.Div([
-
-                    html.Br(),
-                    dbc.Row([
-                        html.H1("Data Science Jobs & Locations",
-                                style={"font": "bold 40px tahoma", "text-align": "center"})
-
-                    ]),
-                    html.Br(),
-
-                    dbc.Row([
-                        dbc.Col([
-                            dcc.Graph(id="top-location", figure=create_top_locations(year_value, job_value),
-                                      style={"margin-bottom": "10px", "height": "580px"})
-                        ], width=12),
-                    ]),
-
-                    html.Hr(),
-
-                    dbc.Row([
-                        dbc.Col([
-                            dcc.Graph(id="top-salary-location", figure=create_salary_locations(year_value, job_value),
-                                      style={"margin-bottom": "10px", "height": "580px"})
-                        ], width=12),
-                    ], style={"border-bottom": "1px solid darkcyan"})
-
-                ])
-
-
-        else:
-            filt = df["Year"] == year_value
-
-            jobs_title = sorted(df.loc[filt, "Job_Title"].unique().tolist())
-            jobs_title.insert(0, "All")
-            if job_value not in jobs_title:
-                page_content = get_alert(job_value, year_value)
-            else:
-
-                page_content = html.Div([
-
-                    html.Br(),
-                    dbc.Row([
-                        html.H1("Data Science Jobs & Locations", style={"font":"bold 40px tahoma", "text-align": "center"})
-
-                    ]),
-                    html.Br(),
-
-                    dbc.Row([
-                        dbc.Col([
-                            dcc.Graph(id="top-location", figure=create_top_locations(year_value, job_value),
-                                      style={"margin-bottom": "10px", "height": "580px"})
-                        ], width=12),
-                    ]),
-
-                    html.Hr(),
-
-                    dbc.Row([
-                        dbc.Col([
-                            dcc.Graph(id="top-salary-location", figure=create_salary_locations(year_value, job_value),
-                                      style={"margin-bottom": "10px", "height": "580px"})
-                        ], width=12),
-                    ], style={"border-bottom": "1px solid darkcyan"})
-
-            ])
-
-        return [
-            # Year Menu
-            {
-                'display': 'block',
-                "color": "white",
-                "border": "0px",
-                "font-family": "tahoma",
-                "margin-bottom": "15px",
-                "background-color": "black"
-            },
 
-            # Job Menu
-            {
-                'display': 'block',
-                "color":"white",
-                "border": "0px",
-                "font-family": "tahoma",
-                "margin-bottom": "15px",
-                "background-color": "black"
-            },
-
-            [{"label": html.Span([i], style={'color': '#FF00E4', 'font-size': 17}), "value": i, }
-            for i in jobs_title],
-
-            page_content
-        ]
-
-
-    elif pathname =="/experinces":
-        if year_value == "all":
-            jobs_title = sorted(df.loc[:, "Job_Title"].unique().tolist())
-            jobs_title.insert(0, "All")
-            if job_value not in jobs_title:
-                page_content = get_alert(job_value, year_value)
-            else:
-
-                page_content = html.Div([
-
-                    html.Br(),
-                    dbc.Row([
-                        html.H1("Data Science Jobs & Experience Level",
-                                style={"font": "bold 40px tahoma", "text-align": "center"})
-                    ]),
-                    html.Br(),
-
-                    dbc.Row([
-                        dbc.Col([
-                            dcc.Graph(id="experience-salary", figure=create_bar_experince(year_value, job_value),
-                                      style={"margin-bottom": "10px", "height": "600px"})
-                        ], width=12),
-                    ]),
-
-                    html.Hr(),
-
-                    dbc.Row([
-                        dbc.Col([
-                            html.H4("Frequency of Demanded Experience", style={"text-align": "center", "margin-top": "10px"}),
-                            dcc.Graph(id="large-company", figure=create_pie_experince_popularity(year_value, job_value),
-                                      style={"height": "400px"})
-                        ], style={"background-color": "rgb(17, 17, 17)", "margin-right":"10px"}),
-                        dbc.Col([
-                            html.H4("Frequency of Demanded Expert Level", style={"text-align": "center", "margin-top": "10px"}),
-
-                            dcc.Graph(id="medium-company", figure=create_pie_experties_popularity(year_value, job_value),
-                                          style={"height": "400px"})
-                        ], style={"background-color": "rgb(17, 17, 17)", }),
-
-                    ]),
-
-                ])
-
-
-        else:
-            filt = df["Year"] == year_value
-
-            jobs_title = sorted(df.loc[filt, "Job_Title"].unique().tolist())
-            jobs_title.insert(0, "All")
-            if job_value not in jobs_title:
-                page_content = get_alert(job_value, year_value)
-            else:
-
-                page_content = html.Div([
-
-                    html.Br(),
-                    dbc.Row([
-                        html.H1("Data Science Jobs & Experience Level",
-                                style={"font": "bold 40px tahoma", "text-align": "center"})
-                    ]),
-                    html.Br(),
-
-                    dbc.Row([
-                        dbc.Col([
-                            dcc.Graph(id="experience-salary", figure=create_bar_experince(year_value, job_value),
-                                      style={"margin-bottom": "10px", "height": "600px"})
-                        ], width=12),
-                    ]),
-
-                    html.Hr(),
-
-                    dbc.Row([
-                        dbc.Col([
-                            html.H4("Frequency of Demanded Experience",
-                                    style={"text-align": "center", "margin-top": "10px"}),
-                            dcc.Graph(id="large-company", figure=create_pie_experince_popularity(year_value, job_value),
-                                      style={"height": "400px"})
-                        ], style={"background-color": "rgb(17, 17, 17)", "margin-right": "10px"}),
-                        dbc.Col([
-                            html.H4("Frequency of Demanded Expert Level",
-                                    style={"text-align": "center", "margin-top": "10px"}),
-
-                            dcc.Graph(id="medium-company",
-                                      figure=create_pie_experties_popularity(year_value, job_value),
-                                      style={"height": "400px"})
-                        ], style={"background-color": "rgb(17, 17, 17)", }),
-
-                    ]),
-
-                ])
-
-        return [
-            # Year Menu
-            {
-                'display': 'block',
-                "color": "white",
-                "border": "0px",
-                "font-family": "tahoma",
-                "margin-bottom": "15px",
-                "background-color": "black"
-            },
+for graph_id, create_chart in [
+    ("salary-histogram", create_salary_histogram),
+    ("salary-box", create_salary_box),
+]:
+    register_distribution_callback(graph_id, create_chart)
 
-            # Job Menu
-            {
-                'display': 'block',
-                "color": "white",
-                "border": "0px",
-                "font-family": "tahoma",
-                "margin-bottom": "15px",
-                "background-color": "black"
-            },
 
-            [{"label": html.Span([i], style={'color': '#FF00E4', 'font-size': 17}), "value": i, }
-             for i in jobs_title],
+# ---------------- Time Series Page ----------------
+@app.callback(
+    Output("year-salary", "figure"),
+    Input(component_id="job-menu", component_property="value"),
+    **figure_callback_options(background_manager, "year-salary"),
+)
+@metrics.track_callback
+def update_year_line_chart(job_value):
+    if not job_exists("all", job_value):
+        raise PreventUpdate
+    return create_year_line_chart(job_value)
 
-            page_content
-        ]
 
+# -------------- Live Data Refresh ------------------ #
+def figure_affected(key, touched):
+    # Does a Cached Figure Read a Cell That Got New Rows (touched (year, job) pairs)?
+    chart, args = key[1], key[2:]
+    if chart == "create_year_line_chart":
+        return any(args[0] in ("All", job) for _, job in touched)
+    if len(args) == 1:
+        return any(args[0] in ("all", year) for year, _ in touched)
+    return any(args[0] in ("all", year) and args[1] in ("All", job) for year, job in touched)
 
-    elif pathname =="/TimeSeries":
-        jobs_title = sorted(df.loc[:, "Job_Title"].unique().tolist())
-        jobs_title.insert(0, "All")
-        if job_value not in jobs_title:
-            page_content = get_alert(job_value, year_value)
-        else:
-            page_content = html.Div([
 
-                html.Br(),
-                dbc.Row([
-                    html.H1("Data Science Jobs & Experience Level",
-                            style={"font": "bold 40px tahoma", "text-align": "center"})
-                ]),
-                html.Br(),
+def on_new_data(old, new, touched):
+    # Everything Re-Read --> Every Figure Dropped, Folded Rows --> Only Theirs
+    keep = None if touched is None else (lambda key: not figure_affected(key, touched))
+    figure_cache.set_version(new.version, keep=keep)
+    figure_cache.maxsize = figure_cache_size()
 
-                dbc.Row([
-                    dbc.Col([
-                        dcc.Graph(id="year-salary", figure=create_year_line_chart(job_value),
-                                  style={"margin-bottom": "10px", "height": "600px"})
-                    ], width=12),
-                ]),
 
-            ])
+live.on_swap(on_new_data)
 
+if refresh_seconds:
+    # Polling Starts In The Process Serving The Requests (After gunicorn Forks)
+    server.before_request(lambda: live.watch(refresh_seconds))
 
-        return [
-            # Hide Year Menu
 
-            {'display': 'none'},
+# ****************************************************************************
+# ********************************** Warm-Up *********************************
+# ****************************************************************************
+# DASHBOARD_WARMUP=1 --> Every Figure Is Built At Boot (Best With gunicorn --preload)
+#   DASHBOARD_WARMUP_PROCESSES / _SECONDS / _MB --> Processes, Time & Memory Budgets
 
-            {
-                'display': 'block',
-                "color": "white",
-                "border": "0px",
-                "font-family": "tahoma",
-                "margin-bottom": "15px",
-                "background-color": "black"
-            },
+cached_charts = [create_top_job_chart, create_high_salary_job_chart, create_top_locations,
+                 create_salary_locations, create_bar_experince, create_pie_experince_popularity,
+                 create_pie_experties_popularity, create_year_line_chart, create_salary_histogram,
+                 create_salary_box]
+
+
+def figure_tasks():
+    data = live.current
+    tasks = []
+    for year in ["all"] + data.years:
+        tasks.append(("create_top_job_chart", (year,)))
+        tasks.append(("create_high_salary_job_chart", (year,)))
+
+        for job in data.jobs_title:
+            # The Warning Is Shown For a Missing Job --> No Figure Needed
+            if not job_exists(year, job):
+                continue
+            for chart in ["create_top_locations", "create_salary_locations", "create_bar_experince",
+                          "create_pie_experince_popularity", "create_pie_experties_popularity"]:
+                tasks.append((chart, (year, job)))
+            for chart in ["create_salary_histogram", "create_salary_box"]:
+                for group in DISTRIBUTION_GROUPS:
+                    tasks.append((chart, (year, job, group)))
+
+    for job in data.jobs_title:
+        tasks.append(("create_year_line_chart", (job,)))
+
+    return tasks
+
+
+def figure_cache_size():
+    # FIGURE_CACHE_SIZE, Else 4096 Figures; With DASHBOARD_WARMUP=1 Raised To
+    # Every Figure The Warm-Up Builds (Else The First Ones Would Be Evicted)
+    if os.environ.get("FIGURE_CACHE_SIZE"):
+        return int(os.environ["FIGURE_CACHE_SIZE"])
+    if os.environ.get("DASHBOARD_WARMUP") == "1":
+        return max(FIGURE_CACHE_SIZE, len(figure_tasks()))
+    return FIGURE_CACHE_SIZE
+
+
+figure_cache.maxsize = figure_cache_size()
+
+
+def warm_up_figures(processes=None, time_budget=None, memory_budget_mb=None):
+    # Templates Drawn Once Here, Not By Every Warm-Up Process
+    figures.load_templates()
+    # The Functions Under The Cache Decorator Build The Figures
+    charts = {chart.__name__: chart.__wrapped__ for chart in cached_charts}
+    return warm_up(charts, figure_tasks(), figure_cache, processes=processes,
+                   time_budget=time_budget, memory_budget_mb=memory_budget_mb)
+
+
+def env_number(name, cast=float):
+    value = os.environ.get(name)
+    return cast(value) if value else None
+
+
+startup.mark("app & callbacks")
+if os.environ.get("DASHBOARD_WARMUP") == "1":
+    warm_up_figures(processes=env_number("DASHBOARD_WARMUP_PROCESSES", int),
+                    time_budget=env_number("DASHBOARD_WARMUP_SECONDS"),
+                    memory_budget_mb=env_number("DASHBOARD_WARMUP_MB"))
+startup.mark("warm-up")
+
+
+if shared_data:
+    # Everything Built At Import Lives As Long As The App --> Out of The Garbage
+    # Collector's Reach, So Its Passes In The Forked Workers Don't Write To
+    # (And Copy) The Pages They Share With The Master
+    gc.freeze()
 
-            [{"label": html.Span([i], style={'color': '#FF00E4', 'font-size': 17}), "value": i, }
-             for i in jobs_title],
 
-            page_content
-        ]
+metrics.add_collector(startup.collector())
+if os.environ.get("DASHBOARD_STARTUP_REPORT") == "1":
+    startup.report()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,45 @@
+# Importing Toolkit
+import os
+
+from dash import Input, Output
+
+# *************************************************************************
+# ** Background Figure Callbacks (Dash Background Callbacks + diskcache) **
+# *************************************************************************
+# With a manager, every figure callback runs in a process forked for it and
+# the browser polls for the result, so a slow figure never holds a gunicorn
+# worker while cheap requests (cards, menus, alerts) wait behind it:
+#   - cancel  --> leaving the page kills its renders (a new year / job
+#                 already replaces the running render in the browser)
+#   - running --> the graph gets the "chart-computing" class meanwhile
+#                 (dimmed by assets/background.css)
+# The jobs & their results are kept in <folder>/jobs (diskcache).
+
+# How Often The Browser Asks For The Result (Milliseconds)
+POLL_INTERVAL_MS = 250
+
+RUNNING_CLASS = "chart-computing"
+
+
+def make_background_manager(folder):
+    if not folder:
+        return None
+    try:
+        import diskcache
+        from dash import DiskcacheManager
+        return DiskcacheManager(diskcache.Cache(os.path.join(folder, "jobs")))
+    except ImportError as error:
+        raise ImportError('DASHBOARD_BACKGROUND needs pip install "dash[diskcache]"') from error
+
+
+def figure_callback_options(manager, graph_id):
+    # Extra app.callback Arguments of a Figure Callback (None --> Runs In The Request)
+    if manager is None:
+        return {}
+
+    return {
+        "background": True,
+        "interval": POLL_INTERVAL_MS,
+        "cancel": [Input("page-url", "pathname")],
+        "running": [(Output(graph_id, "className"), RUNNING_CLASS, "")],
+    }
@@ -0,0 +1,243 @@
+# *************************************************************************
+# ** Benchmark Suite: Chart Builders & Page Renders of app.py            **
+# *************************************************************************
+# Times every create_* function (without the figure cache) and the server
+# work of a full page render for every (route, year, job), on the bundled
+# CSV and on copies of it scaled to 10x / 100x / 1000x rows.
+#
+#   python benchmarks/bench_app.py                          # all scales
+#   python benchmarks/bench_app.py --scales 1 10 --output now.json
+#   python benchmarks/bench_app.py --scales 1 --baseline before.json
+#
+# Every scale runs in its own interpreter (app.py loads its data at import)
+# with SALARY_DATA pointing to the scaled CSV. Results are saved as JSON;
+# with --baseline every timing is compared to a previous run and the exit
+# code is 1 when one of them got slower than --threshold.
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+import warnings
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(ROOT, "benchmarks", "data")
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+SOURCE_CSV = os.path.join(ROOT, "Latest_Data_Science_Salaries.csv")
+
+SCALES = [1, 10, 100, 1000]
+
+
+# -------------- Scaled Copies of The CSV ------------------ #
+def scaled_csv(scale):
+    if scale == 1:
+        return SOURCE_CSV
+
+    path = os.path.join(DATA_DIR, f"salaries_x{scale}.csv")
+    if os.path.exists(path):
+        return path
+
+    os.makedirs(DATA_DIR, exist_ok=True)
+    with open(SOURCE_CSV) as f:
+        header = f.readline()
+        body = f.read()
+    if not body.endswith("\n"):
+        body += "\n"
+
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w") as f:
+        f.write(header)
+        for _ in range(scale):
+            f.write(body)
+    os.replace(temp_path, path)
+
+    return path
+
+
+# -------------- Timing ------------------ #
+def summarize(seconds):
+    seconds = sorted(seconds)
+    n = len(seconds)
+    if n == 0:
+        return {"calls": 0}
+    return {
+        "calls": n,
+        "mean_ms": sum(seconds) / n * 1000,
+        "p50_ms": seconds[n // 2] * 1000,
+        "p95_ms": seconds[min(n - 1, int(n * 0.95))] * 1000,
+        "max_ms": seconds[-1] * 1000,
+    }
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def run_scale(repeat):
+    # Runs Inside The Worker Interpreter
+    warnings.filterwarnings("ignore")
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+
+    start = time.perf_counter()
+    import app
+    import_seconds = time.perf_counter() - start
+
+    # Without The Figure Cache --> What a First View Costs
+    charts_by_year = [app.create_top_job_chart, app.create_high_salary_job_chart, app.create_cards]
+    charts_by_year_job = [app.create_top_locations, app.create_salary_locations, app.create_bar_experince,
+                          app.create_pie_experince_popularity, app.create_pie_experties_popularity]
+    charts_by_group = [app.create_salary_histogram, app.create_salary_box]
+    uncached = lambda function: getattr(function, "__wrapped__", function)
+
+    page_charts = {
+        "/": lambda year, job: [uncached(chart)(year) for chart in charts_by_year],
+        "/Locations": lambda year, job: [uncached(chart)(year, job) for chart in charts_by_year_job[:2]],
+        "/experinces": lambda year, job: [uncached(chart)(year, job) for chart in charts_by_year_job[2:]],
+        "/TimeSeries": lambda year, job: [uncached(app.create_year_line_chart)(job)],
+        "/distribution": lambda year, job: [uncached(chart)(year, job, group)
+                                            for chart in charts_by_group for group in app.DISTRIBUTION_GROUPS],
+    }
+
+    def render_page(pathname, year, job):
+        # Same Server Work As The Callbacks of One Page View
+        app.get_page_content(pathname)
+        if pathname != "/":
+            app.update_alert(pathname, year, job)
+            if not app.job_exists("all" if pathname == "/TimeSeries" else year, job):
+                return
+        page_charts[pathname](year, job)
+
+    # Same Years As The Year Menu (Every Partition Year Too)
+    years = ["all"] + app.live.current.years
+    timings = {}
+
+    def record(name, seconds):
+        timings.setdefault(name, []).append(seconds)
+
+    for _ in range(repeat):
+        for year in years:
+            for chart in charts_by_year:
+                record(chart.__name__, timed(uncached(chart), year))
+
+            for job in app.live.current.jobs_title:
+                if not app.job_exists(year, job):
+                    continue
+                for chart in charts_by_year_job:
+                    record(chart.__name__, timed(uncached(chart), year, job))
+                for chart in charts_by_group:
+                    for group in app.DISTRIBUTION_GROUPS:
+                        record(chart.__name__, timed(uncached(chart), year, job, group))
+
+        for job in app.live.current.jobs_title:
+            record("create_year_line_chart", timed(uncached(app.create_year_line_chart), job))
+
+        for pathname in app.pages_dict.values():
+            for year in years:
+                for job in app.live.current.jobs_title:
+                    record(f"page {pathname}", timed(render_page, pathname, year, job))
+
+    return {
+        "rows": app.live.current.rows,
+        "startup": {"import_app_s": import_seconds},
+        "timings": {name: summarize(seconds) for name, seconds in timings.items()},
+    }
+
+
+def run_in_worker(scale, repeat):
+    env = dict(os.environ, SALARY_DATA=scaled_csv(scale))
+    command = [sys.executable, os.path.abspath(__file__), "--worker", "--repeat", str(repeat)]
+    output = subprocess.run(command, env=env, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+# -------------- Comparison With a Baseline ------------------ #
+def compare(results, baseline, threshold):
+    regressions = []
+    for scale, result in results["scales"].items():
+        base = baseline.get("scales", {}).get(scale)
+        if base is None:
+            continue
+
+        metrics = {f"{name} (mean)": (timing.get("mean_ms"), base["timings"].get(name, {}).get("mean_ms"))
+                   for name, timing in result["timings"].items()}
+        metrics["import app"] = (result["startup"]["import_app_s"], base["startup"].get("import_app_s"))
+
+        print(f"\n--- {scale} ({result['rows']:,} rows) vs baseline ---")
+        for name, (now, before) in metrics.items():
+            if not now or not before:
+                continue
+            ratio = now / before
+            flag = "  <-- SLOWER" if ratio > threshold else ""
+            print(f"{name:<45}{before:>12.3f}{now:>12.3f}{ratio:>8.2f}x{flag}")
+            if ratio > threshold:
+                regressions.append((scale, name, ratio))
+
+    return regressions
+
+
+def print_results(results):
+    for scale, result in results["scales"].items():
+        print(f"\n--- {scale}: {result['rows']:,} rows, import app {result['startup']['import_app_s']:.2f}s ---")
+        print(f"{'Function':<32}{'Calls':>8}{'Mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'Max ms':>10}")
+        for name, timing in result["timings"].items():
+            print(f"{name:<32}{timing['calls']:>8}{timing['mean_ms']:>10.3f}{timing['p50_ms']:>10.3f}"
+                  f"{timing['p95_ms']:>10.3f}{timing['max_ms']:>10.3f}")
+
+
+def versions():
+    import dash, plotly, pandas, numpy
+    return {
+        "python": platform.python_version(),
+        "dash": dash.__version__,
+        "plotly": plotly.__version__,
+        "pandas": pandas.__version__,
+        "numpy": numpy.__version__,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the chart builders and page renders of app.py")
+    parser.add_argument("--scales", type=int, nargs="+", default=SCALES, help="row multipliers of the bundled CSV")
+    parser.add_argument("--repeat", type=int, default=1, help="passes over every combination")
+    parser.add_argument("--output", help="where to save the JSON results (default: benchmarks/results/)")
+    parser.add_argument("--baseline", help="JSON results of a previous run to compare with")
+    parser.add_argument("--threshold", type=float, default=1.2, help="slowdown ratio reported as a regression")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_scale(args.repeat)))
+        return
+
+    results = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "versions": versions(),
+        "scales": {f"{scale}x": run_in_worker(scale, args.repeat) for scale in args.scales},
+    }
+    print_results(results)
+
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"bench_{datetime.now():%Y%m%d_%H%M%S}.json")
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nSaved: {output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold}x")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
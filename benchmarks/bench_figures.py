@@ -0,0 +1,101 @@
+# *************************************************************************
+# ** Benchmark: Plotly Express vs Figure Templates (figure_factory.py)   **
+# *************************************************************************
+# Every chart is built for every (year, job) of the dataset, once with its
+# px_* function (the way the charts were built before) and once from its
+# template, and both figures must be the same (exit code 1 when one isn't).
+# Run from anywhere:  python benchmarks/bench_figures.py
+
+import os
+import sys
+import json
+import time
+import warnings
+from collections import defaultdict
+
+from plotly.utils import PlotlyJSONEncoder
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+warnings.filterwarnings("ignore")
+
+import app
+import figure_factory as figures
+
+
+# The Aggregated Series Each Chart Receives From app.py
+def collect_inputs():
+    inputs = defaultdict(list)
+    originals = {name: getattr(figures, name) for name in figures.CHARTS}
+
+    def recorder(name):
+        def record(*args):
+            inputs[name].append(args)
+            return originals[name](*args)
+        return record
+
+    for name in figures.CHARTS:
+        setattr(figures, name, recorder(name))
+
+    try:
+        # Same Years As The Year Menu
+        years = ["all"] + app.live.current.years
+        for year in years:
+            app.create_top_job_chart.__wrapped__(year)
+            app.create_high_salary_job_chart.__wrapped__(year)
+            for job in app.live.current.jobs_title:
+                # Same Guard As The Callbacks (No Figure For a Missing Job)
+                if not app.job_exists(year, job):
+                    continue
+                app.create_top_locations.__wrapped__(year, job)
+                app.create_salary_locations.__wrapped__(year, job)
+                app.create_bar_experince.__wrapped__(year, job)
+                app.create_pie_experince_popularity.__wrapped__(year, job)
+                app.create_pie_experties_popularity.__wrapped__(year, job)
+                for group in app.DISTRIBUTION_GROUPS:
+                    app.create_salary_histogram.__wrapped__(year, job, group)
+                    app.create_salary_box.__wrapped__(year, job, group)
+        for job in app.live.current.jobs_title:
+            app.create_year_line_chart.__wrapped__(job)
+    finally:
+        for name, function in originals.items():
+            setattr(figures, name, function)
+
+    return inputs
+
+
+def build_all(build, calls):
+    # (Seconds Per Call, The Figures)
+    start = time.perf_counter()
+    built = [build(*args) for args in calls]
+    return (time.perf_counter() - start) / len(calls), built
+
+
+def as_json(figure):
+    # What The Browser Receives (numpy Arrays As Lists)
+    return json.loads(json.dumps(figure, cls=PlotlyJSONEncoder))
+
+
+def main():
+    inputs = collect_inputs()
+
+    print(f"{'Chart':<26}{'Figures':>9}{'px (ms)':>12}{'Template (ms)':>15}{'Speedup':>10}{'Different':>11}")
+    different = 0
+    for name, (px_chart, template_chart) in figures.CHARTS.items():
+        calls = inputs[name]
+        before, px_figures = build_all(lambda *args: px_chart(*args).to_dict(), calls)
+        after, template_figures = build_all(template_chart, calls)
+        mismatches = [args for args, px_figure, template_figure in zip(calls, px_figures, template_figures)
+                      if as_json(px_figure) != as_json(template_figure)]
+        different += len(mismatches)
+        print(f"{name:<26}{len(calls):>9}{before * 1000:>12.3f}{after * 1000:>15.3f}{before / after:>9.0f}x"
+              f"{len(mismatches):>11}")
+
+    if different:
+        print(f"\n{different} template figure(s) differ from plotly express")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# *************************************************************************
+# ** Benchmark: Memory of The gunicorn Workers As Workers Are Added      **
+# *************************************************************************
+# Starts gunicorn with 1, 2, 4 ... workers, sends a few page loads to each,
+# then reads /proc/<pid>/smaps_rollup of the master and of every worker:
+#   PSS     --> shared pages split between the processes using them
+#   Private --> pages only that process has (what a new worker costs)
+#
+#   python benchmarks/bench_memory.py                              # default
+#   DASHBOARD_SHARED_DATA=1 python benchmarks/bench_memory.py      # shared data
+#   python benchmarks/bench_memory.py --workers 1 4 --no-preload
+#   SALARY_DATA=benchmarks/data/salaries_x100.csv python benchmarks/bench_memory.py
+#
+# Linux only (/proc). The environment is passed to gunicorn.
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from load_test import connect, request_json
+
+
+def memory_mb(pid):
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1]) / 1024
+    return {"pss": fields["Pss"], "private": fields["Private_Clean"] + fields["Private_Dirty"]}
+
+
+def children(pid):
+    with open(f"/proc/{pid}/task/{pid}/children") as f:
+        return [int(child) for child in f.read().split()]
+
+
+def measure(workers, preload, port, requests_per_worker):
+    command = [sys.executable, "-m", "gunicorn", "app:server", "--bind", f"127.0.0.1:{port}",
+               "--workers", str(workers)] + (["--preload"] if preload else [])
+    process = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    url = f"http://127.0.0.1:{port}"
+
+    try:
+        deadline = time.time() + 300
+        while len(children(process.pid)) < workers or not ready(url):
+            if process.poll() is not None:
+                raise RuntimeError(f"The server exited:\n{process.stderr.read().decode()}")
+            if time.time() > deadline:
+                raise RuntimeError("The server did not start in time")
+            time.sleep(0.5)
+
+        # New Connections --> Spread Over The Workers
+        for _ in range(workers * requests_per_worker):
+            connection = connect(url)
+            request_json(connection, "GET", "/")
+            request_json(connection, "GET", "/_dash-layout")
+            connection.close()
+        time.sleep(1)
+
+        master = memory_mb(process.pid)
+        worker_memory = [memory_mb(pid) for pid in children(process.pid)]
+    finally:
+        process.terminate()
+        process.wait()
+
+    return {
+        "workers": workers,
+        "total_pss": master["pss"] + sum(worker["pss"] for worker in worker_memory),
+        "master_pss": master["pss"],
+        "worker_pss": sum(worker["pss"] for worker in worker_memory) / len(worker_memory),
+        "worker_private": sum(worker["private"] for worker in worker_memory) / len(worker_memory),
+    }
+
+
+def ready(url):
+    try:
+        connection = connect(url)
+        status, _ = request_json(connection, "GET", "/_dash-layout")
+        connection.close()
+        return status == 200
+    except OSError:
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory of the gunicorn workers.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--no-preload", action="store_true", help="Every worker imports app.py itself")
+    parser.add_argument("--port", type=int, default=8060)
+    parser.add_argument("--requests", type=int, default=4, help="Page loads per worker before measuring")
+    args = parser.parse_args()
+
+    print(f"Shared data: {os.environ.get('DASHBOARD_SHARED_DATA') == '1'}   Preload: {not args.no_preload}")
+    print(f"{'Workers':>8}{'Total PSS':>12}{'Master PSS':>12}{'Worker PSS':>12}{'Worker Private':>16}  (MB)")
+    for workers in args.workers:
+        result = measure(workers, not args.no_preload, args.port, args.requests)
+        print(f"{result['workers']:>8}{result['total_pss']:>12.1f}{result['master_pss']:>12.1f}"
+              f"{result['worker_pss']:>12.1f}{result['worker_private']:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
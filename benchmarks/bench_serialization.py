@@ -0,0 +1,70 @@
+# *************************************************************************
+# ** Benchmark: Bytes On The Wire & Encode Time of Every Figure          **
+# *************************************************************************
+# Every chart is built for every (year, job) of the dataset (same inputs as
+# bench_figures.py), then each figure is encoded:
+#   - Text    --> numeric arrays written as JSON numbers, json module
+#   - Typed   --> base64 typed arrays (what the charts return), json module
+#   - Fast    --> base64 typed arrays, serialization.dumps (orjson if installed)
+# Bytes are per figure (gzip: what the browser downloads when compressed).
+# Run from anywhere:  python benchmarks/bench_serialization.py
+
+import os
+import sys
+import gzip
+import time
+import base64
+import warnings
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+warnings.filterwarnings("ignore")
+
+import figure_factory as figures
+import serialization
+from bench_figures import collect_inputs
+
+
+def as_text_arrays(value):
+    # {"dtype": "f8", "bdata": "..."} ---> Plain List of Numbers
+    if isinstance(value, dict):
+        if "bdata" in value and "dtype" in value:
+            array = np.frombuffer(base64.b64decode(value["bdata"]), dtype=value["dtype"])
+            return array.reshape(value["shape"]).tolist() if "shape" in value else array.tolist()
+        return {key: as_text_arrays(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [as_text_arrays(item) for item in value]
+    return value
+
+
+def encode_stats(values, engine):
+    start = time.perf_counter()
+    encoded = [serialization.dumps(value, engine).encode() for value in values]
+    seconds = (time.perf_counter() - start) / len(values)
+    size = sum(len(data) for data in encoded) / len(values)
+    gzipped = sum(len(gzip.compress(data)) for data in encoded) / len(values)
+    return size, gzipped, seconds
+
+
+def main():
+    inputs = collect_inputs()
+
+    print(f"Fast engine: {serialization.ENGINE}")
+    print(f"{'Chart':<26}{'Figures':>9}{'Text (B)':>10}{'Typed (B)':>11}{'gzip (B)':>10}"
+          f"{'json (us)':>11}{'Fast (us)':>11}")
+    for name, (_, template_chart) in figures.CHARTS.items():
+        built = [template_chart(*args) for args in inputs[name]]
+        text = [as_text_arrays(figure) for figure in built]
+
+        text_size, _, _ = encode_stats(text, "json")
+        typed_size, typed_gzip, json_seconds = encode_stats(built, "json")
+        _, _, fast_seconds = encode_stats(built, serialization.ENGINE)
+        print(f"{name:<26}{len(built):>9}{text_size:>10.0f}{typed_size:>11.0f}{typed_gzip:>10.0f}"
+              f"{json_seconds * 1e6:>11.0f}{fast_seconds * 1e6:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
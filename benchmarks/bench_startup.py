@@ -0,0 +1,65 @@
+# *************************************************************************
+# ** Benchmark: Cold Start of app.py (Default vs DASHBOARD_FAST_START=1) **
+# *************************************************************************
+# Each run is a new Python process (nothing already imported) that times:
+#   import --> `import app`, split into the phases of startup.py
+#   first  --> the first chart built after the import (the home page's)
+# With DASHBOARD_FAST_START=1 the chart templates are drawn by that first
+# chart instead of at import.
+#
+#   python benchmarks/bench_startup.py
+#   python benchmarks/bench_startup.py --runs 10
+#
+# The environment is passed to every run (SALARY_DATA, DASHBOARD_SHARED_DATA ...).
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+from statistics import median
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Run In The Child Process
+CHILD = """
+import json, time
+start = time.perf_counter()
+import app
+from startup import startup
+imported = time.perf_counter()
+app.create_top_job_chart.__wrapped__("all")
+first = time.perf_counter()
+print(json.dumps({"import": imported - start, "first": first - imported, "phases": startup.phases}))
+"""
+
+
+def run_once(fast_start):
+    env = dict(os.environ, DASHBOARD_FAST_START="1" if fast_start else "0", DASHBOARD_STARTUP_REPORT="0")
+    output = subprocess.run([sys.executable, "-c", CHILD], cwd=ROOT, env=env, check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold start of app.py.")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    results = {}
+    for fast_start in [False, True]:
+        results[fast_start] = [run_once(fast_start) for _ in range(args.runs)]
+
+    print(f"Median of {args.runs} runs (seconds)")
+    print(f"{'':<22}{'Default':>10}{'Fast Start':>12}")
+    phases = list(results[False][0]["phases"])
+    for name in phases:
+        values = [median(run["phases"].get(name, 0.0) for run in results[fast]) for fast in [False, True]]
+        print(f"{'  ' + name:<22}{values[0]:>10.3f}{values[1]:>12.3f}")
+    for name in ["import", "first"]:
+        values = [median(run[name] for run in results[fast]) for fast in [False, True]]
+        print(f"{name:<22}{values[0]:>10.3f}{values[1]:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+# *************************************************************************
+# ** Regression Check: The Fast Paths Give The Same Results As pandas    **
+# *************************************************************************
+# Two claims the speed-ups rely on, checked on the bundled CSV (or any CSV
+# with the same columns):
+#   cube --> every top-k / count / mean the charts read from the cube
+#            (code_engine.py, aggregates.py) is the same, values AND order
+#            (ties included), as the pandas chain the chart was written with
+#   fold --> rows folded into the live data (live_data.py), appended to the
+#            CSV and dropped in the append folder, give the same version,
+#            frame, cube, row index, KPIs & histograms as reading everything
+#
+#   python benchmarks/check_engines.py
+#   python benchmarks/check_engines.py --data other.csv
+#
+# Exit code 1 when something differs (the first differences are printed).
+
+import os
+import sys
+import argparse
+import tempfile
+import warnings
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from data_loader import CATEGORY_COLUMNS, read_and_clean
+from row_index import RowIndex
+from aggregates import build_cube, get_cell, cell_counts, cell_means, top_counts, top_means
+from live_data import LiveDataset
+
+SOURCE_CSV = os.path.join(ROOT, "Latest_Data_Science_Salaries.csv")
+
+# Rows Read First, Then Appended In Batches of FOLD_BATCH Rows (A Batch
+# Moving The IQR Bounds Is Re-Read, Not Folded: That's Expected); The Rows
+# From FOLD_APPEND_FILE To FOLD_END Go In a File of The Append Folder, The
+# Rest At The End of The CSV Again
+FOLD_START = 0.6
+FOLD_APPEND_FILE = 0.9
+FOLD_END = 0.95
+FOLD_BATCH = 10
+
+
+def same_series(fast, reference):
+    # Same Labels In The Same Order, Same Values
+    return (fast.index.astype(object).tolist() == reference.index.astype(object).tolist()
+            and np.allclose(fast.to_numpy(dtype=float), reference.to_numpy(dtype=float), rtol=1e-12))
+
+
+# -------------- Cube vs pandas ------------------ #
+def check_cube(df):
+    # The Reference Chains Run On Plain Text Columns, Like The Original app.py
+    rows = df.astype({column: object for column in CATEGORY_COLUMNS})
+    cube = build_cube(df, RowIndex(df))
+    failures = []
+
+    def check(name, fast, reference):
+        if not same_series(fast, reference):
+            failures.append(name)
+
+    years = ["all"] + sorted(df["Year"].unique().tolist())
+    jobs = ["All"] + sorted(df["Job_Title"].unique().tolist())
+    for year in years:
+        year_rows = rows if year == "all" else rows[rows["Year"] == year]
+
+        cell = get_cell(cube, year, "All", "Job_Title")
+        check(f"top jobs {year}", top_counts(cell, 10),
+              year_rows["Job_Title"].value_counts().sort_values(ascending=False).head(10))
+        check(f"high salary jobs {year}", top_means(cell, 10),
+              year_rows.groupby("Job_Title")["Salary_in_USD"].mean().sort_values(ascending=False).head(10))
+
+        for job in jobs:
+            job_rows = year_rows if job == "All" else year_rows[year_rows["Job_Title"] == job]
+            if job_rows.empty:
+                continue
+            key = f"{year} / {job}"
+
+            check(f"top locations {key}", top_counts(get_cell(cube, year, job, "Company_Location"), 5),
+                  job_rows["Company_Location"].value_counts().sort_values(ascending=False).head(5))
+            check(f"salary locations {key}", top_means(get_cell(cube, year, job, "Company_Location"), 10),
+                  job_rows.groupby("Company_Location")["Salary_in_USD"].mean().sort_values(ascending=False).head(10))
+            check(f"experience salary {key}", top_means(get_cell(cube, year, job, "Experience_Level")),
+                  job_rows.groupby("Experience_Level")["Salary_in_USD"].mean().sort_values(ascending=False))
+            check(f"experience counts {key}", cell_counts(get_cell(cube, year, job, "Experience_Level")),
+                  job_rows["Experience_Level"].value_counts())
+            check(f"expertise counts {key}", cell_counts(get_cell(cube, year, job, "Expertise_Level")),
+                  job_rows["Expertise_Level"].value_counts())
+
+            if year == "all":
+                check(f"year line {job}", cell_means(get_cell(cube, "all", job, "Year")),
+                      job_rows.groupby("Year")["Salary_in_USD"].mean())
+
+    return failures
+
+
+# -------------- Folded Rows vs Full Reload ------------------ #
+def histograms_equal(a, b):
+    return (a.labels == b.labels and a.first_bin == b.first_bin and np.array_equal(a.counts, b.counts)
+            and np.array_equal(a.sums, b.sums) and np.array_equal(a.mins, b.mins)
+            and np.array_equal(a.maxs, b.maxs))
+
+
+def check_fold(path):
+    with open(path, "rb") as f:
+        header, *lines = f.read().splitlines(keepends=True)
+    if lines and not lines[-1].endswith(b"\n"):
+        lines[-1] += b"\n"
+    start, append_file, end = (int(len(lines) * share) for share in [FOLD_START, FOLD_APPEND_FILE, FOLD_END])
+    csv_lines = lines[:append_file] + lines[end:]
+    file_lines = lines[append_file:end]
+
+    with tempfile.TemporaryDirectory() as folder:
+        followed_path = os.path.join(folder, "followed", "salaries.csv")
+        reference_path = os.path.join(folder, "reference", "salaries.csv")
+        for path in [followed_path, reference_path]:
+            os.makedirs(os.path.join(os.path.dirname(path), "new"))
+
+        def append(path, new_lines):
+            with open(path, "ab") as f:
+                f.write(b"".join(new_lines))
+
+        append(followed_path, [header] + csv_lines[:start])
+        live = LiveDataset()
+        folds = []
+        live.on_swap(lambda old, new, touched: folds.append(touched is not None))
+        live.follow(followed_path, os.path.join(os.path.dirname(followed_path), "new"))
+        for batch in range(start, append_file, FOLD_BATCH):
+            append(followed_path, csv_lines[batch:min(batch + FOLD_BATCH, append_file)])
+            live.refresh()
+        # A File In The Append Folder, Then More Rows At The End of The CSV
+        append(os.path.join(os.path.dirname(followed_path), "new", "rows.csv"), [header] + file_lines)
+        live.refresh()
+        append(followed_path, csv_lines[append_file:])
+        live.refresh()
+
+        # Read In One Go: Same CSV & Same Append Folder
+        append(reference_path, [header] + csv_lines)
+        append(os.path.join(os.path.dirname(reference_path), "new", "rows.csv"), [header] + file_lines)
+        reference = LiveDataset()
+        reference.follow(reference_path, os.path.join(os.path.dirname(reference_path), "new"))
+
+    folded, full = live.current, reference.current
+    print(f"    {sum(folds)} batches folded, {folds.count(False) - 1} re-read")
+    failures = []
+    if not any(folds):
+        failures.append("no batch was folded")
+    if folded.version != full.version:
+        failures.append("version")
+
+    try:
+        pd.testing.assert_frame_equal(folded.df, full.df)
+    except AssertionError as error:
+        failures.append(f"rows: {str(error).splitlines()[0]}")
+
+    if folded.cube.keys() != full.cube.keys():
+        failures.append("cube cells")
+    for key in full.cube.keys() & folded.cube.keys():
+        try:
+            pd.testing.assert_frame_equal(folded.cube[key], full.cube[key], check_dtype=False)
+        except AssertionError:
+            failures.append(f"cube cell {key}")
+
+    for name in ["years", "jobs", "pairs"]:
+        a, b = getattr(folded.row_index, name), getattr(full.row_index, name)
+        if a.keys() != b.keys() or any(not np.array_equal(a[key], b[key]) for key in b):
+            failures.append(f"row index {name}")
+
+    if folded.kpis.keys.keys() != full.kpis.keys.keys():
+        failures.append("KPI cells")
+    for key in full.kpis.keys.keys() & folded.kpis.keys.keys():
+        a, b = folded.kpis.get(*key), full.kpis.get(*key)
+        if a.keys() != b.keys() or not np.allclose([a[name] for name in b], list(b.values()), rtol=1e-12):
+            failures.append(f"KPIs {key}")
+
+    if folded.histograms.keys() != full.histograms.keys():
+        failures.append("histogram cells")
+    for key in full.histograms.keys() & folded.histograms.keys():
+        if not histograms_equal(folded.histograms[key], full.histograms[key]):
+            failures.append(f"histogram {key}")
+
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the fast paths against pandas and a full reload")
+    parser.add_argument("--data", default=SOURCE_CSV, help="CSV with the columns of the bundled one")
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore")
+
+    failed = False
+    for name, check in [("cube vs pandas", lambda: check_cube(read_and_clean(args.data))),
+                        ("fold vs full reload", lambda: check_fold(args.data))]:
+        failures = check()
+        print(f"{name:<22}{'OK' if not failures else f'{len(failures)} difference(s)'}")
+        for failure in failures[:10]:
+            print(f"    {failure}")
+        failed = failed or bool(failures)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,370 @@
+# *************************************************************************
+# ** Load Test: Replays The Dash Callback Traffic of Real Page Views     **
+# *************************************************************************
+# Every simulated page view picks a route (by --mix weight), a year and a
+# job that exist in the served data, then sends the same
+# /_dash-update-component requests the browser sends: page-content first,
+# then every server callback of that page. The years come from the
+# year-menu options and the jobs from the jobs-store of /_dash-layout.
+#
+#   python benchmarks/load_test.py --start --workers 4 --concurrency 16 --duration 30
+#   python benchmarks/load_test.py --url http://127.0.0.1:8050 --mix /=3 /Locations=1
+#   python benchmarks/load_test.py --start --workers 4 --baseline before.json
+#
+# With --start a gunicorn server is started (and stopped) on --port; the
+# environment is passed through, e.g. DASHBOARD_WARMUP=1. With
+# DASHBOARD_BACKGROUND=<folder> the figure callbacks answer with a job that
+# is polled until its result, like the browser does. Results are saved as
+# JSON; with --baseline the throughput and the p95 of every route are
+# compared to a previous run and the exit code is 1 on a regression.
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+import subprocess
+import http.client
+from urllib.parse import urlparse
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+CALLBACK_PATH = "/_dash-update-component"
+# Values of The Distribution Page's Group Buttons
+DISTRIBUTION_GROUPS = ["Experience_Level", "Company_Size", "Job_Title"]
+
+
+# -------------- The Served App ------------------ #
+def request_json(connection, method, path, body=None, headers=None):
+    payload = json.dumps(body).encode() if body is not None else None
+    headers = dict(headers or {}, **({"Content-Type": "application/json"} if payload else {}))
+    connection.request(method, path, body=payload, headers=headers)
+    response = connection.getresponse()
+    data = response.read()
+    return response.status, data
+
+
+def send_callback(connection, body, headers, poll_interval=0.25):
+    # Background Callbacks (DASHBOARD_BACKGROUND) Answer With a Job --> Poll Its Result
+    status, data = request_json(connection, "POST", CALLBACK_PATH, body, headers)
+    job = json.loads(data) if status == 200 and b'"cacheKey"' in data[:64] else None
+    while job is not None:
+        time.sleep(poll_interval)
+        path = f"{CALLBACK_PATH}?cacheKey={job['cacheKey']}&job={job['job']}"
+        status, data = request_json(connection, "POST", path, body, headers)
+        if status != 200 or b'"response"' in data:
+            break
+    return status, data
+
+
+def connect(url):
+    parsed = urlparse(url)
+    return http.client.HTTPConnection(parsed.hostname, parsed.port or 80, timeout=60)
+
+
+def component_ids(node, ids):
+    # All The `id`s of a Dash Component Tree (As JSON)
+    if isinstance(node, list):
+        for child in node:
+            component_ids(child, ids)
+    elif isinstance(node, dict) and "props" in node:
+        if "id" in node["props"]:
+            ids[node["props"]["id"]] = node
+        component_ids(node["props"].get("children"), ids)
+    return ids
+
+
+def parse_outputs(output):
+    # "page-content.children" or "..page-alert.children...page-graphs.style.."
+    if output.startswith(".."):
+        parts = output.strip(".").split("...")
+        return [{"id": part.split(".")[0], "property": part.split(".")[1]} for part in parts]
+    component, prop = output.split(".")
+    return {"id": component, "property": prop}
+
+
+def make_body(callback, values, changed):
+    return {
+        "output": callback["output"],
+        "outputs": parse_outputs(callback["output"]),
+        "inputs": [{"id": i["id"], "property": i["property"], "value": values[(i["id"], i["property"])]}
+                   for i in callback["inputs"]],
+        "changedPropIds": [changed],
+        "state": [{"id": i["id"], "property": i["property"], "value": values[(i["id"], i["property"])]}
+                  for i in callback.get("state", [])],
+    }
+
+
+class Workload:
+    def __init__(self, url):
+        connection = connect(url)
+        _, layout = request_json(connection, "GET", "/_dash-layout")
+        _, dependencies = request_json(connection, "GET", "/_dash-dependencies")
+        layout_ids = component_ids(json.loads(layout), {})
+
+        self.callbacks = [callback for callback in json.loads(dependencies)
+                          if not callback.get("clientside_function")]
+        self.years = [option["value"] for option in layout_ids["year-menu"]["props"]["options"]]
+        self.static_ids = set(layout_ids)
+        if "jobs-store" in layout_ids:
+            self.jobs = layout_ids["jobs-store"]["props"]["data"]
+        else:
+            # Job Menu Searched On The Server --> The Top Jobs of Each Year
+            self.jobs = {str(year): self.searched_jobs(connection, year) for year in self.years}
+
+        # Callbacks Fired On Each Route --> Their Components Are In The Page
+        page_content = next(cb for cb in self.callbacks if cb["output"] == "page-content.children")
+        self.routes = {}
+        for route in ["/", "/Locations", "/experinces", "/TimeSeries", "/distribution"]:
+            values = {("page-url", "pathname"): route, ("year-menu", "value"): "all", ("job-menu", "value"): "All",
+                      ("distribution-group", "value"): DISTRIBUTION_GROUPS[0]}
+            _, data = request_json(connection, "POST", CALLBACK_PATH, make_body(page_content, values, "page-url.pathname"))
+            page = json.loads(data)["response"]["page-content"]["children"]
+            ids = self.static_ids | set(component_ids(page, {}))
+            self.routes[route] = [cb for cb in self.callbacks
+                                  if cb is not page_content
+                                  and all(i["id"] in ids for i in cb["inputs"])
+                                  and all(o["id"] in ids for o in listify(parse_outputs(cb["output"])))]
+        self.page_content = page_content
+        connection.close()
+
+    def searched_jobs(self, connection, year):
+        search = next(cb for cb in self.callbacks if cb["output"] == "job-menu.options")
+        values = {("job-menu", "search_value"): "", ("page-url", "pathname"): "/Locations",
+                  ("year-menu", "value"): year, ("job-menu", "value"): "All"}
+        _, data = request_json(connection, "POST", CALLBACK_PATH, make_body(search, values, "job-menu.search_value"))
+        options = json.loads(data)["response"]["job-menu"]["options"]
+        return [option["value"] for option in options if option["value"] != "All"]
+
+    def page_view(self, route, rng):
+        year = rng.choice(self.years)
+        job = rng.choice(["All"] + self.jobs[str(year)])
+        values = {("page-url", "pathname"): route, ("year-menu", "value"): year, ("job-menu", "value"): job,
+                  ("job-menu", "search_value"): "", ("distribution-group", "value"): rng.choice(DISTRIBUTION_GROUPS)}
+
+        requests = [make_body(self.page_content, values, "page-url.pathname")]
+        requests += [make_body(callback, values, "year-menu.value") for callback in self.routes[route]]
+        return requests
+
+
+def listify(value):
+    return value if isinstance(value, list) else [value]
+
+
+# -------------- Running The Load ------------------ #
+def percentile(values, q):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+def run_load(url, workload, mix, concurrency, duration, warmup, seed):
+    routes = list(mix)
+    weights = [mix[route] for route in routes]
+    records = []  # (route, start, seconds, ok, kind)
+    lock = threading.Lock()
+    start_time = time.perf_counter()
+    measure_from = start_time + warmup
+    stop_at = measure_from + duration
+
+    def user(number):
+        rng = random.Random(seed + number)
+        connection = connect(url)
+        local = []
+        while time.perf_counter() < stop_at:
+            route = rng.choices(routes, weights)[0]
+            view_start = time.perf_counter()
+            view_ok = True
+            for body in workload.page_view(route, rng):
+                request_start = time.perf_counter()
+                try:
+                    status, _ = send_callback(connection, body, headers={"Referer": url.rstrip("/") + route})
+                    ok = status in (200, 204)
+                except (OSError, http.client.HTTPException):
+                    ok = False
+                    connection.close()
+                    connection = connect(url)
+                view_ok = view_ok and ok
+                if request_start >= measure_from:
+                    local.append((route, request_start, time.perf_counter() - request_start, ok, "request"))
+            if view_start >= measure_from:
+                local.append((route, view_start, time.perf_counter() - view_start, view_ok, "page"))
+        connection.close()
+        with lock:
+            records.extend(local)
+
+    threads = [threading.Thread(target=user, args=(number,)) for number in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return summarize(records, time.perf_counter() - measure_from)
+
+
+def summarize(records, elapsed):
+    results = {}
+    for route in sorted({record[0] for record in records}) + ["all"]:
+        selected = [r for r in records if route in ("all", r[0])]
+        requests = [r for r in selected if r[4] == "request"]
+        pages = [r for r in selected if r[4] == "page"]
+        latencies = [r[2] * 1000 for r in requests if r[3]]
+        page_latencies = [r[2] * 1000 for r in pages if r[3]]
+        errors = sum(1 for r in requests if not r[3])
+        results[route] = {
+            "requests": len(requests),
+            "page_views": len(pages),
+            "errors": errors,
+            "error_rate": errors / len(requests) if requests else 0.0,
+            "requests_per_s": len(requests) / elapsed,
+            "page_views_per_s": len(pages) / elapsed,
+            "p50_ms": percentile(latencies, 0.50),
+            "p95_ms": percentile(latencies, 0.95),
+            "p99_ms": percentile(latencies, 0.99),
+            "page_p50_ms": percentile(page_latencies, 0.50),
+            "page_p95_ms": percentile(page_latencies, 0.95),
+        }
+    return results
+
+
+# -------------- Local Server ------------------ #
+def start_server(port, workers, threads):
+    command = [sys.executable, "-m", "gunicorn", "app:server", "--bind", f"127.0.0.1:{port}",
+               "--workers", str(workers), "--threads", str(threads), "--preload"]
+    process = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+    url = f"http://127.0.0.1:{port}"
+    deadline = time.time() + 300
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"The server exited:\n{process.stderr.read().decode()}")
+        try:
+            connection = connect(url)
+            status, _ = request_json(connection, "GET", "/_dash-layout")
+            connection.close()
+            if status == 200:
+                return process, url, command
+        except OSError:
+            pass
+        time.sleep(0.5)
+
+    process.terminate()
+    raise RuntimeError("The server did not start in time")
+
+
+# -------------- Comparison With a Baseline ------------------ #
+def compare(results, baseline, threshold):
+    regressions = []
+    print("\n--- vs baseline ---")
+    for route, now in results["routes"].items():
+        before = baseline.get("routes", {}).get(route)
+        if not before:
+            continue
+
+        # Ratio > 1 --> Worse (Less Throughput, More Latency, More Errors)
+        checks = [("requests/s", before["requests_per_s"], now["requests_per_s"],
+                   before["requests_per_s"] / now["requests_per_s"] if now["requests_per_s"] else float("inf")),
+                  ("p95 ms", before["p95_ms"], now["p95_ms"],
+                   now["p95_ms"] / before["p95_ms"] if before["p95_ms"] and now["p95_ms"] else None),
+                  ("error rate", before["error_rate"], now["error_rate"],
+                   float("inf") if now["error_rate"] > before["error_rate"] else None)]
+        for name, old, new, ratio in checks:
+            if ratio is None:
+                continue
+            flag = "  <-- WORSE" if ratio > threshold else ""
+            print(f"{route:<14}{name:<12}{old:>12.4f}{new:>12.4f}{ratio:>8.2f}x{flag}")
+            if ratio > threshold:
+                regressions.append((route, name, ratio))
+
+    return regressions
+
+
+def print_results(results):
+    print(f"\n{'Route':<14}{'Requests':>10}{'Err %':>8}{'Req/s':>9}{'Views/s':>9}"
+          f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'View p95':>10}")
+    for route, result in results["routes"].items():
+        cells = [result[name] for name in ["p50_ms", "p95_ms", "p99_ms", "page_p95_ms"]]
+        cells = [f"{cell:.1f}" if cell is not None else "-" for cell in cells]
+        print(f"{route:<14}{result['requests']:>10}{result['error_rate'] * 100:>8.2f}{result['requests_per_s']:>9.1f}"
+              f"{result['page_views_per_s']:>9.1f}{cells[0]:>9}{cells[1]:>9}{cells[2]:>9}{cells[3]:>10}")
+
+
+def parse_mix(items):
+    mix = {}
+    for item in items:
+        route, _, weight = item.partition("=")
+        mix[route] = float(weight or 1)
+    return mix
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay Dash callback traffic against a local server")
+    parser.add_argument("--url", default="http://127.0.0.1:8050", help="server to load (ignored with --start)")
+    parser.add_argument("--start", action="store_true", help="start a gunicorn server for the run")
+    parser.add_argument("--port", type=int, default=8051, help="port of the started server")
+    parser.add_argument("--workers", type=int, default=1, help="gunicorn workers of the started server")
+    parser.add_argument("--threads", type=int, default=1, help="gunicorn threads per worker")
+    parser.add_argument("--concurrency", type=int, default=8, help="simulated users sending page views")
+    parser.add_argument("--duration", type=float, default=30, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=5, help="seconds of load before measuring")
+    parser.add_argument("--mix", nargs="+", default=["/=1", "/Locations=1", "/experinces=1", "/TimeSeries=1",
+                                                   "/distribution=1"],
+                        help="route=weight of the page views")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the (year, job) choices")
+    parser.add_argument("--output", help="where to save the JSON results (default: benchmarks/results/)")
+    parser.add_argument("--baseline", help="JSON results of a previous run to compare with")
+    parser.add_argument("--threshold", type=float, default=1.2, help="worsening ratio reported as a regression")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    server, url, command = None, args.url, None
+    if args.start:
+        server, url, command = start_server(args.port, args.workers, args.threads)
+
+    try:
+        workload = Workload(url)
+        unknown = set(mix) - set(workload.routes)
+        if unknown:
+            parser.error(f"unknown routes in --mix: {sorted(unknown)}")
+
+        routes = run_load(url, workload, mix, args.concurrency, args.duration, args.warmup, args.seed)
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    results = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "config": {
+            "url": url, "server": command, "concurrency": args.concurrency, "duration_s": args.duration,
+            "warmup_s": args.warmup, "mix": mix, "seed": args.seed,
+            "env": {name: value for name, value in os.environ.items()
+                    if name.startswith("DASHBOARD_") or name in ("SALARY_DATA", "FIGURE_CACHE_SIZE")},
+        },
+        "routes": routes,
+    }
+    print_results(results)
+
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"load_{datetime.now():%Y%m%d_%H%M%S}.json")
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nSaved: {output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold}x")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# Importing Toolkit
+import numpy as np
+import pandas as pd
+
+# *************************************************************************
+# ** Aggregation Engine Over Integer Category Codes                      **
+# *************************************************************************
+# Every text column is a category (one small integer code per row), so a
+# group by is just arrays indexed by code:
+#   - counts & salary sums  --> np.bincount (one pass, no sort)
+#   - groups in the order they first appear (pandas groupby(sort=False))
+#   - top k                 --> np.argpartition, only the k values sorted
+#
+# The order of ties is the one the charts had with pandas:
+# sort_values(ascending=False) uses numpy's quicksort, which leaves equal
+# values in no set order. When the k largest values are all different (and
+# the k-th is not tied with a value left out), their order is fixed by the
+# values alone and argpartition is enough; otherwise the whole array is
+# sorted exactly like pandas does.
+
+
+class ColumnCodes:
+    # One Code Per Row + The Index pandas Gives To Groups of The Column
+    def __init__(self, column):
+        self.name = column.name
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            self.dtype = column.dtype
+            self.codes = column.cat.codes.to_numpy().astype(np.int64)
+            self.labels = column.cat.categories.tolist()
+        else:
+            self.dtype = None
+            codes, values = pd.factorize(column, sort=True)
+            self.codes = codes.astype(np.int64)
+            self.values = np.asarray(values, dtype=column.dtype)
+            self.labels = self.values.tolist()
+        self.n_groups = len(self.labels)
+
+    def index(self, group_codes):
+        if self.dtype is not None:
+            return pd.CategoricalIndex(pd.Categorical.from_codes(group_codes, dtype=self.dtype), name=self.name)
+        return pd.Index(self.values[group_codes], name=self.name)
+
+
+def first_seen(codes):
+    # Distinct Codes In The Order They First Appear
+    uniques, first = np.unique(codes, return_index=True)
+    return uniques[np.argsort(first)]
+
+
+def count_sum(codes, weights, n_groups):
+    # Sums of Integers Are Exact In float64 Up To 2^53
+    counts = np.bincount(codes, minlength=n_groups)
+    sums = np.bincount(codes, weights=weights, minlength=n_groups).astype(np.int64)
+    return counts, sums
+
+
+# -------------- Ordering ------------------ #
+def sort_descending(values):
+    # Same Order As pandas' sort_values(ascending=False)
+    return (len(values) - 1 - np.argsort(values[::-1], kind="quicksort"))[::-1]
+
+
+def sort_descending_stable(values):
+    # Same Order As pandas' sort_values(ascending=False, kind="stable")
+    return np.argsort(-values, kind="stable")
+
+
+def top_distinct(values, k):
+    # Positions of The k Largest Values, Largest First, or None When Ties
+    # Would Make Their Order Depend On The Sort Algorithm
+    if k is None or not 0 < k < len(values):
+        return None
+    top = np.argpartition(values, len(values) - k)[len(values) - k:]
+    top = top[np.argsort(values[top])[::-1]]
+    top_values = values[top]
+    if (top_values[:-1] == top_values[1:]).any() or np.count_nonzero(values == top_values[-1]) > 1:
+        return None
+    return top
+
+
+def top_k(values, k=None):
+    # sort_values(ascending=False).head(k) As Positions
+    top = top_distinct(values, k)
+    return top if top is not None else sort_descending(values)[:k]
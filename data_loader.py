@@ -0,0 +1,327 @@
+# Importing Toolkit
+import os
+import sys
+import json
+import shutil
+import hashlib
+import pandas as pd
+import numpy as np
+
+from quantile_sketch import ValueCounts, LogSketch
+
+# *************************************************************************
+# ** Typed Loading Stage of The Salary DataSet                          **
+# *************************************************************************
+# Text columns are loaded as categories (one small integer code per row +
+# one copy of each distinct string), Year and Salary as narrow integers.
+
+DATA_PATH = "Latest_Data_Science_Salaries.csv"
+
+# Columns That We Work With & Their Types (Raw CSV Names)
+DTYPES = {
+    "Job Title": "category",
+    "Employment Type": "category",
+    "Experience Level": "category",
+    "Expertise Level": "category",
+    "Company Location": "category",
+    "Salary in USD": "int32",
+    "Company Size": "category",
+    "Year": "int16",
+}
+
+COLUMNS = ["Job_Title", "Employment_Type", "Experience_Level", "Expertise_Level",
+           "Company_Location", "Salary_in_USD", "Company_Size", "Year"]
+
+CATEGORY_COLUMNS = [c for c in COLUMNS if DTYPES[c.replace("_", " ")] == "category"]
+
+# Values To Fix ---> (column, old value, new value)
+RENAMES = [
+    ("Job_Title", "Data Engineer 2", "Data Engineer"),
+    ("Company_Location", "Israel", "Palestine"),
+]
+
+# Outliers Are Outside [Q1 - 1.5 IQR, Q3 + 1.5 IQR)
+IQR_FACTOR = 1.5
+
+# Q1 / Q3 of a Chunked Load --> "exact" (same as pandas) or "sketch" (approximate, fixed memory)
+IQR_SKETCHES = {
+    "exact": ValueCounts,
+    "sketch": LogSketch,
+}
+
+
+def rename_category(column, old, new):
+    # Works on the categories only, the rows are never touched as strings
+    categories = column.cat.categories
+    if old not in categories:
+        return column
+
+    if new not in categories:
+        # Keep the categories sorted like the strings would be
+        column = column.cat.rename_categories({old: new})
+        return column.cat.reorder_categories(sorted(column.cat.categories))
+
+    # Both exist --> point the codes of `old` to `new` and drop `old`
+    codes = column.cat.codes.to_numpy().copy()
+    codes[codes == categories.get_loc(old)] = categories.get_loc(new)
+    merged = pd.Categorical.from_codes(codes, categories=categories)
+    return pd.Series(merged, index=column.index, name=column.name).cat.remove_categories(old)
+
+
+def iqr_bounds(salary, factor=IQR_FACTOR):
+    q1, q3 = salary.quantile([0.25, 0.75])
+    IQR = q3 - q1
+    return q1 - (IQR * factor), q3 + (IQR * factor)
+
+
+def sketch_bounds(sketch, factor=IQR_FACTOR):
+    q1, q3 = sketch.quantiles([0.25, 0.75])
+    IQR = q3 - q1
+    return q1 - (IQR * factor), q3 + (IQR * factor)
+
+
+def clean_data(df):
+    # Clean The Column Names
+    df.columns = df.columns.str.replace(" ", "_")
+
+    for column, old, new in RENAMES:
+        df[column] = rename_category(df[column], old, new)
+
+    # Remove Outliers in Salary
+    lower, upper = iqr_bounds(df["Salary_in_USD"])
+
+    filt = (df["Salary_in_USD"] >= lower) & (df["Salary_in_USD"] < upper)
+    df = df[filt].reset_index(drop=True)
+
+    return df[COLUMNS].copy()
+
+
+def read_and_clean(path=DATA_PATH):
+    df = pd.read_csv(path, usecols=list(DTYPES), dtype=DTYPES)
+    return clean_data(df)
+
+
+# -------------- Chunked Loading (Big Files) ------------------ #
+CHUNKSIZE = 100_000
+
+# Only a chunk of the raw rows is in memory at a time:
+#   pass 1 --> the Salary column alone, fed to the Q1 / Q3 sketch
+#   pass 2 --> the used columns, every chunk filtered with the IQR bounds and
+#              kept as plain arrays (category codes into one shared table)
+# The columns are then joined one by one, so the peak is about the cleaned
+# frame + one chunk. The kept rows get the categories of all the rows (as
+# read_csv would give): with the "exact" sketch the result is the same frame
+# as read_and_clean.
+def read_chunked(path=DATA_PATH, chunksize=CHUNKSIZE, iqr_method="exact"):
+    sketch = IQR_SKETCHES[iqr_method]()
+    for chunk in pd.read_csv(path, usecols=["Salary in USD"], dtype={"Salary in USD": DTYPES["Salary in USD"]},
+                             chunksize=chunksize):
+        sketch.add(chunk["Salary in USD"].to_numpy())
+    lower, upper = sketch_bounds(sketch)
+
+    parts = {column: [] for column in COLUMNS}
+    # Category ---> Its Code In The Shared Table (In Order of First Appearance)
+    tables = {column: {} for column in CATEGORY_COLUMNS}
+    for chunk in pd.read_csv(path, usecols=list(DTYPES), dtype=DTYPES, chunksize=chunksize):
+        chunk.columns = chunk.columns.str.replace(" ", "_")
+        salary = chunk["Salary_in_USD"].to_numpy()
+        keep = (salary >= lower) & (salary < upper)
+
+        for column in COLUMNS:
+            values = chunk[column]
+            if column in tables:
+                # The Chunk's Own (Small) Codes + Where Each of Its Categories Is In The Table
+                table = tables[column]
+                lookup = np.array([table.setdefault(category, len(table)) for category in values.cat.categories],
+                                  dtype=np.int64)
+                parts[column].append((values.cat.codes.to_numpy()[keep], lookup))
+            else:
+                parts[column].append(values.to_numpy()[keep])
+
+    # The RENAMES Are Applied To The Tables (Merged Categories Share a Code)
+    aliases = {column: {} for column in CATEGORY_COLUMNS}
+    for column, old, new in RENAMES:
+        table = tables[column]
+        if old in table:
+            code = table.pop(old)
+            if new in table:
+                aliases[column][code] = table[new]
+            else:
+                table[new] = code
+
+    columns = {}
+    for column in COLUMNS:
+        if column in tables:
+            categories = sorted(tables[column])
+            # Table Code ---> Code In The Sorted Categories
+            remap = np.empty(len(categories) + len(aliases[column]), dtype=np.int64)
+            remap[[tables[column][category] for category in categories]] = np.arange(len(categories))
+            for code, target in aliases[column].items():
+                remap[code] = remap[target]
+
+            dtype = pd.Categorical.from_codes([], categories=categories).codes.dtype
+            codes = np.empty(sum(len(part) for part, _ in parts[column]), dtype=dtype)
+            start = 0
+            for part, lookup in parts.pop(column):
+                # Code -1 (Missing Value) Stays -1
+                chunk_remap = np.append(remap[lookup], -1).astype(dtype)
+                codes[start:start + len(part)] = chunk_remap[part]
+                start += len(part)
+            values = pd.Categorical.from_codes(codes, categories=categories, validate=False)
+        else:
+            values = np.concatenate(parts.pop(column))
+        columns[column] = values
+
+    return pd.DataFrame(columns, copy=False)
+
+
+def load_data(path=DATA_PATH, snapshot=True, chunksize=None, iqr_method="exact", mmap_mode=None):
+    # chunksize=None --> the whole file at once, unless the IQR is sketched
+    # mmap_mode="r"  --> the columns stay in the snapshot files, mapped read-only
+    #                    (one copy in the page cache, shared by every process)
+    def read():
+        if chunksize or iqr_method != "exact":
+            return read_chunked(path, chunksize or CHUNKSIZE, iqr_method)
+        return read_and_clean(path)
+
+    if not snapshot:
+        return read()
+
+    key = snapshot_key(path, iqr_method)
+    df = read_snapshot(path, key, mmap_mode)
+    if df is None:
+        df = read()
+        write_snapshot(df, path, key)
+        # Mapped From The New Snapshot (Read-Only Data Folder --> The Frame Built Here)
+        mapped = read_snapshot(path, key, mmap_mode) if mmap_mode else None
+        if mapped is not None:
+            df = mapped
+
+    return df
+
+
+# *************************************************************************
+# ** Binary Snapshot of The Cleaned Frame (Fast Cold Start)             **
+# *************************************************************************
+# The cleaned frame is saved next to the CSV as a folder of .npy files:
+#   <csv name>.snapshot/meta.json            --> key + column layout
+#   <csv name>.snapshot/<column>.npy         --> values (codes for categories)
+#   <csv name>.snapshot/<column>.categories.npy
+# It is used only while its key matches the CSV (size + mtime) and the
+# cleaning parameters, otherwise the CSV is parsed & cleaned again.
+
+# Bump When The Cleaning Code Changes (Old Snapshots Are Then Ignored)
+SNAPSHOT_VERSION = 1
+
+
+def snapshot_dir(path):
+    return f"{path}.snapshot"
+
+
+def cleaning_params(iqr_method="exact"):
+    # Everything (But The Rows) That Changes The Cleaned Frame
+    return {
+        "version": SNAPSHOT_VERSION,
+        "dtypes": DTYPES,
+        "columns": COLUMNS,
+        "renames": RENAMES,
+        "iqr_factor": IQR_FACTOR,
+        "iqr_method": iqr_method,
+    }
+
+
+def snapshot_key(path, iqr_method="exact"):
+    stat = os.stat(path)
+    params = dict(cleaning_params(iqr_method), source=[os.path.basename(path), stat.st_size, stat.st_mtime_ns])
+    return hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+
+def write_snapshot(df, path, key):
+    folder = snapshot_dir(path)
+    temp_folder = f"{folder}.tmp-{os.getpid()}"
+    layout = []
+
+    try:
+        os.makedirs(temp_folder, exist_ok=True)
+        for column in df.columns:
+            values = df[column]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                categories = np.asarray(values.cat.categories, dtype=str)
+                np.save(os.path.join(temp_folder, f"{column}.categories.npy"), categories)
+                values = values.cat.codes
+                layout.append({"name": column, "kind": "category"})
+            else:
+                layout.append({"name": column, "kind": "values"})
+            np.save(os.path.join(temp_folder, f"{column}.npy"), values.to_numpy())
+
+        # meta.json Is Written Last --> a Snapshot Without It Is Never Read
+        with open(os.path.join(temp_folder, "meta.json"), "w") as f:
+            json.dump({"key": key, "rows": len(df), "columns": layout}, f)
+
+        shutil.rmtree(folder, ignore_errors=True)
+        os.replace(temp_folder, folder)
+
+    except OSError:
+        # Read-only data folder --> just run without a snapshot
+        shutil.rmtree(temp_folder, ignore_errors=True)
+
+
+def read_snapshot(path, key, mmap_mode=None):
+    folder = snapshot_dir(path)
+    try:
+        with open(os.path.join(folder, "meta.json")) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if meta.get("key") != key:
+        return None
+
+    try:
+        columns = {}
+        for column in meta["columns"]:
+            name = column["name"]
+            values = np.load(os.path.join(folder, f"{name}.npy"), mmap_mode=mmap_mode, allow_pickle=False)
+            if column["kind"] == "category":
+                categories = np.load(os.path.join(folder, f"{name}.categories.npy"), allow_pickle=False)
+                # validate=False + The Codes' Own dtype (Saved As pandas Made It) --> The
+                # Categorical Keeps The Mapped Codes, No Copy
+                codes = values
+                values = pd.Categorical.from_codes(codes, dtype=pd.CategoricalDtype(categories.tolist()),
+                                                   validate=False)
+                if mmap_mode and not np.shares_memory(values.codes, codes):
+                    print(f"[snapshot] the {name} codes were copied by this pandas version: only "
+                          f"`gunicorn --preload` shares them between the workers", file=sys.stderr, flush=True)
+            columns[name] = values
+    except (OSError, ValueError, KeyError):
+        return None
+
+    # copy=False --> Mapped Columns Stay Mapped
+    return pd.DataFrame(columns, copy=False)
+
+
+# -------------- Memory Report ------------------ #
+def untyped_memory(df):
+    # What the same frame costs with the default read_csv types
+    untyped = df.astype({c: object for c in CATEGORY_COLUMNS})
+    untyped = untyped.astype({"Salary_in_USD": np.int64, "Year": np.int64})
+    return untyped.memory_usage(deep=True).sum()
+
+
+def memory_report(df):
+    before = untyped_memory(df)
+    after = df.memory_usage(deep=True).sum()
+    return {
+        "rows": len(df),
+        "before_bytes": int(before),
+        "after_bytes": int(after),
+        "ratio": before / after if after else 0.0,
+    }
+
+
+if __name__ == "__main__":
+    report = memory_report(load_data())
+    print(f"Rows          : {report['rows']:,}")
+    print(f"Object Strings: {report['before_bytes'] / 1024:,.1f} KiB")
+    print(f"Typed         : {report['after_bytes'] / 1024:,.1f} KiB")
+    print(f"Saving        : {report['ratio']:0.1f}x")
@@ -0,0 +1,453 @@
+# Importing Toolkit
+import os
+import sys
+import json
+import time
+import shutil
+import hashlib
+import inspect
+import argparse
+import multiprocessing
+import pandas as pd
+import plotly
+
+import app
+from serialization import dumps
+
+# *************************************************************************
+# ** Static Export: The Whole Dashboard As Files (No Python To Serve It)  **
+# *************************************************************************
+# Every view is a function of (page, year, job, group) over the loaded
+# data, so all of them are built once and written as the JSON the server
+# would send; a page (index.html) draws them with plotly.js in the browser:
+#
+#   python export.py site/                  # same SALARY_DATA / DASHBOARD_* as the app
+#   python export.py site/ --processes 4
+#   cd site && python -m http.server        # or any static hosting / CDN
+#
+#   site/index.html, site/plotly.min.js     --> the app shell
+#   site/data/manifest.json                 --> pages, years, jobs of every year
+#   site/data/<chart>/<year>/<job>[/<group>].json  --> one figure
+#   site/data/create_cards/<year>.json      --> the home page cards
+#
+# Rebuilds are incremental: every file has a digest of what it is made of
+# (the rows of the (year, job) slice it reads + the code & plotly version)
+# kept in site/data/digests.json, and only the files whose digest changed
+# are built again. Files of views that no longer exist are removed.
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# The Graphs of Every Page & The Menus Their Figures Depend On
+PAGES = {
+    "/": {
+        "title": "Data Science Salary Analysis",
+        "cards": True,
+        "graphs": [
+            {"id": "top-10-job", "chart": "create_top_job_chart", "args": ["year"], "height": 580},
+            {"id": "high-salary-job", "chart": "create_high_salary_job_chart", "args": ["year"], "height": 580},
+        ],
+    },
+    "/Locations": {
+        "title": "Data Science Jobs & Locations",
+        "graphs": [
+            {"id": "top-location", "chart": "create_top_locations", "args": ["year", "job"], "height": 580},
+            {"id": "top-salary-location", "chart": "create_salary_locations", "args": ["year", "job"], "height": 580},
+        ],
+    },
+    "/experinces": {
+        "title": "Data Science Jobs & Experience Level",
+        "graphs": [
+            {"id": "experience-salary", "chart": "create_bar_experince", "args": ["year", "job"], "height": 600},
+            {"id": "large-company", "chart": "create_pie_experince_popularity", "args": ["year", "job"],
+             "height": 400, "label": "Frequency of Demanded Experience"},
+            {"id": "medium-company", "chart": "create_pie_experties_popularity", "args": ["year", "job"],
+             "height": 400, "label": "Frequency of Demanded Expert Level"},
+        ],
+    },
+    "/TimeSeries": {
+        "title": "Data Science Jobs & Experience Level",
+        "graphs": [
+            {"id": "year-salary", "chart": "create_year_line_chart", "args": ["job"], "height": 600},
+        ],
+    },
+    "/distribution": {
+        "title": "Data Science Salary Distribution",
+        "groups": True,
+        "graphs": [
+            {"id": "salary-histogram", "chart": "create_salary_histogram", "args": ["year", "job", "group"],
+             "height": 580},
+            {"id": "salary-box", "chart": "create_salary_box", "args": ["year", "job", "group"], "height": 580},
+        ],
+    },
+}
+
+# Chart Functions & Output Folder, Shared With The Forked Processes
+_charts = {}
+_folder = None
+
+
+# -------------- What Gets Built ------------------ #
+def job_slug(job):
+    # Job Titles Can Hold "/" or Spaces --> a Short Hash As File Name
+    return hashlib.sha1(job.encode()).hexdigest()[:12]
+
+
+def output_path(name, args, arg_names):
+    parts = [job_slug(value) if arg == "job" else str(value) for arg, value in zip(arg_names, args)]
+    return "/".join(["data", name] + parts) + ".json"
+
+
+def arg_values(arg_names, data):
+    # Every (year, job, group) The Menus Can Show, Without The Missing Jobs
+    # (Those Get The Warning, No Figure)
+    years = ["all"] + data.years if "year" in arg_names else ["all"]
+    jobs = data.jobs_title if "job" in arg_names else ["All"]
+    groups = list(app.DISTRIBUTION_GROUPS) if "group" in arg_names else [None]
+    for year in years:
+        for job in jobs:
+            if not app.job_exists(year, job):
+                continue
+            for group in groups:
+                values = {"year": year, "job": job, "group": group}
+                yield tuple(values[arg] for arg in arg_names)
+
+
+def export_tasks(data):
+    # [(chart, args, arg names), ...]
+    tasks = []
+    for page in PAGES.values():
+        for graph in page["graphs"]:
+            tasks += [(graph["chart"], args, graph["args"]) for args in arg_values(graph["args"], data)]
+        if page.get("cards"):
+            tasks += [("create_cards", (year,), ["year"]) for year in ["all"] + data.years]
+    return tasks
+
+
+# -------------- Digests (Incremental Rebuilds) ------------------ #
+def code_version():
+    # Any Change To The Code or To plotly --> Everything Is Rebuilt
+    digest = hashlib.sha1(plotly.__version__.encode())
+    for name in sorted(os.listdir(ROOT)):
+        if name.endswith(".py"):
+            with open(os.path.join(ROOT, name), "rb") as f:
+                digest.update(name.encode() + f.read())
+    return digest.hexdigest()
+
+
+def slice_digests(data):
+    # Digest of The Rows (In Order) of a (Year, Job) Slice, Computed Once Per Slice
+    row_hashes = pd.util.hash_pandas_object(data.df, index=False).to_numpy()
+    digests = {}
+
+    def digest(year, job):
+        if (year, job) not in digests:
+            rows = data.row_index.rows(year, job)
+            hashes = row_hashes if rows is None else row_hashes[rows]
+            digests[(year, job)] = hashlib.sha1(hashes.tobytes()).hexdigest()
+        return digests[(year, job)]
+
+    return digest
+
+
+def task_digest(task, slice_digest, version):
+    name, args, arg_names = task
+    values = dict(zip(arg_names, args))
+    slice_key = slice_digest(values.get("year", "all"), values.get("job", "All"))
+    return hashlib.sha1(json.dumps([version, name, [str(arg) for arg in args], slice_key]).encode()).hexdigest()
+
+
+# -------------- Writing ------------------ #
+def write_file(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(temp_path, path)
+
+
+def _export(task):
+    name, args, arg_names = task
+    path = output_path(name, args, arg_names)
+    write_file(os.path.join(_folder, path), dumps(_charts[name](*args)))
+    return path
+
+
+def read_digests(folder):
+    try:
+        with open(os.path.join(folder, "data", "digests.json")) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def manifest(data, build):
+    jobs = app.jobs_store().data
+    return {
+        "build": build,
+        "sidebar": [[name, route] for name, route in app.pages_dict.items()],
+        "pages": PAGES,
+        "years": data.years,
+        "jobs": jobs,
+        "slugs": {job: job_slug(job) for job in data.jobs_title},
+        "groups": [[group, label] for group, label in app.DISTRIBUTION_GROUPS.items()],
+    }
+
+
+def export(folder, processes=None, force=False, progress=True):
+    global _folder
+    data = app.live.current
+    if not hasattr(data, "df"):
+        raise SystemExit("The export reads the rows: use SALARY_DATA, not SALARY_PARTITIONS")
+    missing = set(app.pages_layout) - set(PAGES)
+    if missing:
+        raise SystemExit(f"Pages without an export entry in PAGES: {sorted(missing)}")
+
+    start_time = time.perf_counter()
+    version = code_version()
+    slice_digest = slice_digests(data)
+    tasks = export_tasks(data)
+    digests = {output_path(*task): task_digest(task, slice_digest, version) for task in tasks}
+
+    # Only The Files Whose Inputs Changed (Or Missing On Disk)
+    old_digests = {} if force else read_digests(folder)
+    todo = [task for task in tasks
+            if old_digests.get(output_path(*task)) != digests[output_path(*task)]
+            or not os.path.exists(os.path.join(folder, output_path(*task)))]
+
+    _charts.clear()
+    # The Bare Chart Functions: Under The Figure Cache & The Metrics Decorators
+    _charts.update({name: inspect.unwrap(getattr(app, name))
+                    for name in {task[0] for task in todo}})
+    _folder = folder
+    # Templates Drawn Once Here, Not By Every Process
+    app.figures.load_templates()
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    fork = "fork" in multiprocessing.get_all_start_methods()
+    pool = multiprocessing.get_context("fork").Pool(processes) if fork and processes > 1 and todo else None
+    try:
+        results = pool.imap_unordered(_export, todo, chunksize=32) if pool else map(_export, todo)
+        for done, _ in enumerate(results, 1):
+            if progress and (done % max(len(todo) // 10, 1) == 0 or done == len(todo)):
+                print(f"[export] {done}/{len(todo)} files", file=sys.stderr, flush=True)
+    finally:
+        if pool:
+            pool.terminate()
+            pool.join()
+
+    # Views That No Longer Exist
+    removed = [path for path in old_digests if path not in digests]
+    for path in removed:
+        try:
+            os.remove(os.path.join(folder, path))
+        except OSError:
+            pass
+
+    # Shell & Manifest (The Build Digest Makes The Browser Skip Stale Cached Files)
+    build = hashlib.sha1(json.dumps(digests, sort_keys=True).encode()).hexdigest()[:16]
+    write_file(os.path.join(folder, "data", "manifest.json"), json.dumps(manifest(data, build)))
+    write_file(os.path.join(folder, "index.html"), SHELL_HTML.replace("__THEME__", app.dbc.themes.VAPOR))
+    shutil.copyfile(os.path.join(os.path.dirname(plotly.__file__), "package_data", "plotly.min.js"),
+                    os.path.join(folder, "plotly.min.js"))
+    # Written Last: An Interrupted Export Rebuilds What It Didn't Finish
+    write_file(os.path.join(folder, "data", "digests.json"), json.dumps(digests))
+
+    return {
+        "files": len(tasks),
+        "built": len(todo),
+        "unchanged": len(tasks) - len(todo),
+        "removed": len(removed),
+        "processes": processes if pool else 1,
+        "seconds": time.perf_counter() - start_time,
+    }
+
+
+# ****************************************************************************
+# ******************************** App Shell *********************************
+# ****************************************************************************
+# Same sidebar, menus, cards & warnings as the Dash app, drawn from
+# data/manifest.json; the figures are fetched as the menus change.
+SHELL_HTML = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Data Science Salary Analysis</title>
+<link rel="stylesheet" href="__THEME__">
+<script src="plotly.min.js"></script>
+<style>
+  #sidebar {position: fixed; width: 16rem; height: 100vh; top: 0; bottom: 0; left: 0; padding: 20px;
+            background-color: #111; overflow-y: auto;}
+  #sidebar h1 {font: bold 35px tahoma; margin-top: 30px; margin-bottom: 20px; color: #fefefe; text-align: center;}
+  #sidebar .nav-link {margin-bottom: 20px;}
+  #sidebar select {display: block; width: 100%; color: white; border: 0; font-family: tahoma;
+                   margin-bottom: 15px; padding: 8px; background-color: black;}
+  #content {margin-left: 16rem; padding: 20px;}
+  .page-title {font: bold 40px tahoma; text-align: center; margin: 1.5rem 0;}
+  .kpi {background-color: #000; text-align: center; border: 1px solid purple; border-radius: 10px;
+        margin-bottom: 5px; padding: 1rem;}
+  .kpi h3:first-child {color: #FFA1F5;}
+  .groups {font: bold 18px tahoma; text-align: center; margin-bottom: 1rem;}
+  .groups label {margin: 0 0.75rem;}
+  .graph-label {text-align: center; margin-top: 10px;}
+</style>
+</head>
+<body>
+<div class="container-fluid">
+  <div id="sidebar">
+    <h1>Sidebar</h1>
+    <hr>
+    <nav id="pages" class="nav nav-pills flex-column"></nav>
+    <br>
+    <select id="year-menu"></select>
+    <select id="job-menu"></select>
+  </div>
+  <div id="content"></div>
+</div>
+<script>
+const state = {route: "/", year: "all", job: "All", group: null};
+let manifest = null;
+let renderId = 0;
+
+function getJSON(path) {
+  return fetch(path + "?v=" + manifest.build).then(response => {
+    if (!response.ok) throw new Error(path + ": " + response.status);
+    return response.json();
+  });
+}
+
+function currentRoute() {
+  const route = decodeURIComponent(location.hash.slice(1)) || "/";
+  return route in manifest.pages ? route : "/";
+}
+
+function menus(page) {
+  const args = new Set(page.graphs.flatMap(graph => graph.args));
+  return {year: args.has("year"), job: args.has("job")};
+}
+
+function fillMenu(menu, options, value) {
+  menu.replaceChildren(...options.map(([label, optionValue]) => {
+    const option = document.createElement("option");
+    option.textContent = label;
+    option.value = String(optionValue);
+    option.selected = String(optionValue) === String(value);
+    return option;
+  }));
+}
+
+function figurePath(chart, args) {
+  const parts = args.map(arg => arg === "job" ? manifest.slugs[state.job] : String(arg === "year" ? state.year : state.group));
+  return ["data", chart].concat(parts).join("/") + ".json";
+}
+
+function pageHTML(page) {
+  let html = '<div id="page-alert"></div><div id="page-graphs"><h1 class="page-title">' + page.title + "</h1>";
+  if (page.cards) {
+    html += '<div class="row">' + [["Availbale Jobs", "availbale-job-crd"], ["Average Salary per Job", "salary-job-crd"],
+      ["Median Salary", "median-salary-crd"]].map(([title, id]) =>
+      '<div class="col"><div class="kpi"><h3>' + title + '</h3><h3 id="' + id + '"></h3>' +
+      (id === "median-salary-crd" ? '<p id="middle-salary-crd" style="margin-bottom: 0"></p>' : "") +
+      "</div></div>").join("") + "</div><br>";
+  }
+  if (page.groups) {
+    html += '<div class="groups">' + manifest.groups.map(([group, label]) =>
+      '<label><input type="radio" name="group" value="' + group + '"' + (group === state.group ? " checked" : "") +
+      "> " + label + "</label>").join("") + "</div>";
+  }
+  html += page.graphs.map(graph => (graph.label ? '<h4 class="graph-label">' + graph.label + "</h4>" : "") +
+    '<div id="' + graph.id + '" style="height: ' + graph.height + 'px; margin-bottom: 10px"></div>').join("<hr>");
+  return html + "</div>";
+}
+
+function escapeHTML(text) {
+  const element = document.createElement("span");
+  element.textContent = String(text);
+  return element.innerHTML;
+}
+
+function alertHTML() {
+  return '<div class="alert alert-danger"><h2 style="font: bold 30px tahoma">Warning</h2>' +
+    '<p style="font: bold 22px consolas">The Job ' + escapeHTML(state.job) + " Did Not Exist In " + state.year + " !!\\u{1F614}\\u{1F614}</p>" +
+    '<hr><p class="mb-0" style="font: bold 20px arial">Choose Another Job</p></div>';
+}
+
+function render(rebuildPage) {
+  const id = ++renderId;
+  const page = manifest.pages[state.route];
+  const shown = menus(page);
+  const yearMenu = document.getElementById("year-menu");
+  const jobMenu = document.getElementById("job-menu");
+  yearMenu.style.display = shown.year ? "block" : "none";
+  jobMenu.style.display = shown.job ? "block" : "none";
+
+  // Time Series Page Shows All The Years
+  const year = shown.year ? state.year : "all";
+  const jobs = manifest.jobs[String(year)];
+  fillMenu(jobMenu, ["All"].concat(jobs).map(job => [job, job]), state.job);
+
+  const content = document.getElementById("content");
+  if (rebuildPage) {
+    content.innerHTML = pageHTML(page);
+    content.querySelectorAll('input[name="group"]').forEach(input =>
+      input.addEventListener("change", () => { state.group = input.value; render(false); }));
+  }
+
+  const missing = shown.job && state.job !== "All" && !jobs.includes(state.job);
+  document.getElementById("page-alert").innerHTML = missing ? alertHTML() : "";
+  document.getElementById("page-graphs").style.display = missing ? "none" : "block";
+
+  if (page.cards) {
+    getJSON("data/create_cards/" + state.year + ".json").then(cards => {
+      if (id !== renderId) return;
+      ["availbale-job-crd", "salary-job-crd", "median-salary-crd", "middle-salary-crd"].forEach((cardId, i) =>
+        document.getElementById(cardId).textContent = cards[i]);
+    });
+  }
+  if (missing) return;
+
+  for (const graph of page.graphs) {
+    getJSON(figurePath(graph.chart, graph.args)).then(figure => {
+      // a Newer Choice Was Made Meanwhile
+      if (id !== renderId) return;
+      Plotly.react(graph.id, figure.data, figure.layout, {responsive: true});
+    });
+  }
+}
+
+fetch("data/manifest.json", {cache: "no-cache"}).then(response => response.json()).then(data => {
+  manifest = data;
+  state.group = manifest.groups[0][0];
+  document.getElementById("pages").innerHTML = manifest.sidebar.map(([name, route]) =>
+    '<a class="nav-link btn" href="#' + route + '">' + name + "</a>").join("");
+
+  const yearMenu = document.getElementById("year-menu");
+  fillMenu(yearMenu, [["All Years", "all"]].concat(manifest.years.map(year => [year, year])), state.year);
+  yearMenu.addEventListener("change", () => { state.year = yearMenu.value; render(false); });
+  const jobMenu = document.getElementById("job-menu");
+  jobMenu.addEventListener("change", () => { state.job = jobMenu.value; render(false); });
+
+  const showRoute = () => {
+    state.route = currentRoute();
+    document.querySelectorAll("#pages .nav-link").forEach(link =>
+      link.classList.toggle("active", link.getAttribute("href") === "#" + state.route));
+    render(true);
+  };
+  window.addEventListener("hashchange", showRoute);
+  showRoute();
+});
+</script>
+</body>
+</html>
+"""
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export every view of the dashboard as static files.")
+    parser.add_argument("folder", help="Output folder (created if needed)")
+    parser.add_argument("--processes", type=int, help="Processes building the figures (default: all cores)")
+    parser.add_argument("--force", action="store_true", help="Rebuild every file, not only the changed ones")
+    args = parser.parse_args()
+
+    report = export(args.folder, processes=args.processes, force=args.force)
+    print(f"[export] {report}")
@@ -0,0 +1,133 @@
+# Importing Toolkit
+import json
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+from plotly.utils import PlotlyJSONEncoder
+
+# *************************************************************************
+# ** Bounded LRU Cache of The Chart Figures                              **
+# *************************************************************************
+# The chart functions only depend on (chart, year, job) and the dataset,
+# so their figures are cached as plain dicts (what dcc.Graph receives).
+#
+#   key = (dataset version, chart name, *arguments)
+#
+# When the dataset version changes every cached figure is dropped, except
+# the ones the caller says the change did not touch.
+#
+# With a `shared` cache (see shared_cache.py) the figures are also stored as
+# JSON where the other workers find them: a miss here is looked up there
+# before the figure is built.
+
+
+def shared_key(key):
+    # ("v1", "create_top_locations", 2022, "All") --> "figure:v1:create_top_locations:2022:All"
+    return "figure:" + ":".join(str(part) for part in key)
+
+
+class FigureCache:
+    def __init__(self, maxsize=4096, version=None, shared=None):
+        self.maxsize = maxsize
+        self.version = version
+        self.shared = shared
+        self._figures = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.shared_hits = 0
+        self.shared_misses = 0
+
+    def set_version(self, version, keep=None):
+        # keep(key) --> True For The Figures Still Right With The New Data
+        with self._lock:
+            if version != self.version:
+                self.version = version
+                kept = [(key, figure) for key, figure in self._figures.items() if keep and keep(key)]
+                self._figures = OrderedDict(((version, *key[1:]), figure) for key, figure in kept)
+
+    def key(self, chart_name, *args):
+        return (self.version, chart_name, *args)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._figures)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._figures
+
+    def get(self, key):
+        with self._lock:
+            figure = self._figures.get(key)
+            if figure is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._figures.move_to_end(key)
+            return figure
+
+    def put(self, key, figure, share=True):
+        with self._lock:
+            # Built for an older dataset --> don't keep it
+            if key[0] != self.version:
+                return
+
+            self._figures[key] = figure
+            self._figures.move_to_end(key)
+            while len(self._figures) > self.maxsize:
+                self._figures.popitem(last=False)
+                self.evictions += 1
+
+        if share and self.shared is not None:
+            self.shared.set(shared_key(key), json.dumps(figure, cls=PlotlyJSONEncoder).encode())
+
+    def get_shared(self, key):
+        if self.shared is None:
+            return None
+
+        value = self.shared.get(shared_key(key))
+        with self._lock:
+            if value is None:
+                self.shared_misses += 1
+                return None
+            self.shared_hits += 1
+
+        figure = json.loads(value)
+        self.put(key, figure, share=False)
+        return figure
+
+    def clear(self):
+        with self._lock:
+            self._figures.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "version": self.version,
+                "size": len(self._figures),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "shared_hits": self.shared_hits,
+                "shared_misses": self.shared_misses,
+            }
+
+    def memoize(self, create_chart):
+        @wraps(create_chart)
+        def cached_chart(*args):
+            key = self.key(create_chart.__name__, *args)
+            figure = self.get(key)
+            if figure is None:
+                figure = self.get_shared(key)
+            if figure is None:
+                figure = create_chart(*args)
+                if not isinstance(figure, dict):
+                    figure = figure.to_dict()
+                self.put(key, figure)
+            return figure
+
+        return cached_chart
@@ -0,0 +1,707 @@
+# Importing Toolkit
+import threading
+import pandas as pd
+import numpy as np
+
+try:
+    # plotly >= 6 Sends Numeric Arrays As Base64 Typed Arrays
+    from _plotly_utils.utils import to_typed_array_spec
+except ImportError:
+    def to_typed_array_spec(values):
+        return values
+
+# *************************************************************************
+# ** Figure Factory: Chart Styles Built Once, Only The Data Per Request  **
+# *************************************************************************
+# Plotly Express validates every argument and merges the whole plotly_dark
+# template on each call. The charts always look the same, so every chart is
+# drawn once with Plotly Express on a tiny sample (px_* functions below),
+# and its layout & trace styling are kept as a template. A request then
+# only puts its x / y / text / values arrays into a copy of the template
+# traces and returns the figure dict directly.
+
+# plotly.express Is Only Imported When a px_* Function Runs (Building The
+# Templates, The Benchmarks): Serving The Charts Doesn't Need It
+class LazyExpress:
+    def __getattr__(self, name):
+        import plotly.express
+        return getattr(plotly.express, name)
+
+
+px = LazyExpress()
+
+# Stands For The Category Name In The Sample Figures
+PLACEHOLDER = "__category__"
+# Stands For The Name of The Grouping Column (Distribution Charts)
+DIMENSION_PLACEHOLDER = "__dimension__"
+
+SCATTER_COLORS = ["#FCDDB0", "#FF9F9F", "#EDD2F3"]
+EXPERIENCE_COLORS = ["#C0DEFF", "#FCDDB0", "#FF9F9F", "#EDD2F3"]
+PIE_COLORS = ["#ADA2FF", "#C0DEFF", "#FCDDB0", "#FF9F9F", "#EDD2F3"]
+DISTRIBUTION_COLORS = ["#C0DEFF", "#FCDDB0", "#FF9F9F", "#EDD2F3", "#ADA2FF", "#A31ACB", "#FF55BB", "#9336B4",
+                       "#C32BAD", "#FCE2DB"]
+
+# px Default --> sizeref = max(size) / size_max ** 2
+SIZE_MAX = 20
+
+
+# ****************************************************************************
+# ************************ Plotly Express Chart Styles ***********************
+# ****************************************************************************
+# Every px_* function draws one chart from its already aggregated Series.
+# They are used to build the templates (and by benchmarks/bench_figures.py).
+
+# ---------------- Home Page Graphs ----------------
+def px_top_job_chart(df_filtered):
+    # Bar Chart of Wanted Job
+    fig_wanted_job = px.bar(df_filtered,
+                 orientation="h",
+                 y = df_filtered.index ,
+                 x = (df_filtered / sum(df_filtered)) * 100,
+                 # color = df_filtered.index,
+                 color_discrete_sequence=["#A31ACB"],
+                 title= "Top Demanded Job",
+                 labels={"x": "Popularity of Jobs(%)", "Job_Title": "Job Title"},
+                 template="plotly_dark",
+                 text = df_filtered.apply(lambda x: f"{(x / sum(df_filtered)) * 100:0.2f}%")
+                 )
+
+    fig_wanted_job.update_layout(
+        showlegend= False,
+        title={
+            "font": {
+                "size": 35,
+                "family": "tahoma",
+            }
+        }
+    )
+
+    fig_wanted_job.update_traces(
+        textfont = {
+                   "family": "consolas",
+                   "size": 14,
+                    "color":"white"
+                   },
+        hovertemplate="Job Title: %{label}<br>Popularity (%): %{value}",
+    )
+
+    return fig_wanted_job
+
+def px_high_salary_job_chart(df_filtered):
+    # Bar Chart of Wanted Job
+    fig_wanted_job = px.bar(df_filtered,
+                 y = df_filtered.index ,
+                 x = df_filtered ,
+                 orientation="h",
+                 color_discrete_sequence = ["#C32BAD"],
+                 title= "Jobs of the Highest Average Salary",
+                 labels={"Job_Title": "Job Title", "x": "AVG Salary (USD)"},
+                 template="plotly_dark",
+                 text_auto = "0.3s"
+                 )
+
+    fig_wanted_job.update_layout(
+        showlegend= False,
+        title={
+            "font": {
+                "size": 35,
+                "family": "tahoma",
+            }
+        }
+    )
+
+    fig_wanted_job.update_traces(
+        textfont = {
+                   "family": "consolas",
+                   "size": 15,
+                    "color":"white"
+                   },
+        hovertemplate="Job Title: %{label}<br>AVG Salary: %{value}",
+    )
+
+    return fig_wanted_job
+
+
+# *************** Locations Graphs *************
+def px_top_locations(df_filtered):
+    chart_title = "Top Location of Jobs"
+
+    if len(df_filtered) > 0 and len(df_filtered) <3:
+        fig_wanted_job = px.scatter(df_filtered,
+                                    x=df_filtered.index,
+                                    y=df_filtered,
+                                    color=df_filtered.index,
+                                    size=df_filtered,
+                                    color_discrete_sequence=["#FCDDB0", "#FF9F9F", "#EDD2F3"],
+                                    template="plotly_dark",
+                                    labels={"y": "Popularity",
+                                            "Company_Location": "Company Location"},
+                                    title=chart_title,
+                                    opacity=0.8,
+                                    )
+
+    else:
+        # Bar Chart of Wanted Job
+        fig_wanted_job = px.bar(df_filtered,
+                     # orientation="h",
+                     x = df_filtered.index ,
+                     y = (df_filtered / sum(df_filtered)) * 100,
+                     color_discrete_sequence = ["#A31ACB"],
+                     title=chart_title,
+                     labels={"y": "Popularity of Jobs(%)", "Company_Location": "Company Location"},
+                     template="plotly_dark",
+                     text = df_filtered.apply(lambda x: f"{x}\n({(x / sum(df_filtered)) * 100:0.2f}%)")
+                     )
+        fig_wanted_job.update_traces(
+            textfont = {
+                       "family": "consolas",
+                       "size": 15,
+                        "color":"white"
+                       },
+            hovertemplate="Company Location: %{label}<br>Popularity (%): %{text}",
+        )
+
+    fig_wanted_job.update_layout(
+        showlegend= False,
+        title={
+            "font": {
+                "size": 35,
+                "family": "tahoma",
+            }
+        },
+        hoverlabel={
+            "bgcolor": "#C32BAD",
+            "font_size": 16,
+            "font_family": "tahoma"
+        }
+    )
+
+    return fig_wanted_job
+
+def px_salary_locations(df_filtered):
+    chart_title = "Top Comapny Location and AVG Salary Per Job"
+
+    if len(df_filtered) > 0 and len(df_filtered) < 4:
+        fig_salary_job_loc = px.scatter(df_filtered,
+                                        x = df_filtered.index,
+                                        y = df_filtered,
+                                        color=df_filtered.index,
+                                        size=df_filtered,
+                                        color_discrete_sequence=["#FCDDB0", "#FF9F9F", "#EDD2F3"],
+                                        template="plotly_dark",
+                                        labels={"y": "AVG Salary(USD)",
+                                               "Company_Location": "Company Location"},
+                                        title=chart_title ,opacity=0.8
+
+                                        )
+        fig_salary_job_loc.update_layout(
+            title={
+                "font": {
+                    "size": 35,
+                    "family": "tahoma",
+                }
+            },
+            hoverlabel = {
+                "bgcolor":"#222",
+                "font_size":14,
+                "font_family":"Rockwell"
+            }
+        )
+
+    else:
+        fig_salary_job_loc = px.bar(df_filtered,
+                             orientation="h",
+                             x = df_filtered,
+                             y=df_filtered.index,
+                             color_discrete_sequence = ["#C32BAD"],
+                             title= chart_title,
+                             labels={"x": "AVG Salary(USD)", "Company_Location": "Company Location"},
+                             template="plotly_dark",
+                             text_auto = "0.3s"
+                     )
+
+        fig_salary_job_loc.update_traces(
+            textfont = {
+                       "family": "consolas",
+                       "size": 15,
+                        "color":"white"
+                       },
+            hovertemplate="Company Location: %{label}<br>AVG Salary: %{value}",
+        )
+
+    fig_salary_job_loc.update_layout(
+        showlegend= False,
+        title={
+            "font": {
+                "size": 35,
+                "family": "tahoma",
+            }
+        },
+        hoverlabel={
+            "bgcolor": "#C32BAD",
+            "font_size": 16,
+            "font_family": "tahoma"
+        }
+    )
+
+    return fig_salary_job_loc
+
+
+# ================ Experience Graphs ================
+def px_bar_experince(df_filtered):
+    chart_title = "Expected Salary Per Experience Level"
+
+    if len(df_filtered) > 0 and len(df_filtered) < 3:
+        fig_experience = px.scatter(df_filtered,
+                                    x=df_filtered.index,
+                                    y=df_filtered,
+                                    color=df_filtered.index,
+                                    size=df_filtered,
+                                    color_discrete_sequence=["#FCDDB0", "#FF9F9F", "#EDD2F3"],
+                                    template="plotly_dark",
+                                    labels={"y": "AVG Salary",
+                                            "Experience_Level": "Experience Level"},
+                                    title=chart_title,
+                                    opacity=0.8,
+                                    )
+
+    else:
+        fig_experience = px.bar(df_filtered,
+                                x = df_filtered.index,
+                                y = df_filtered,
+                                color=df_filtered.index,
+                               color_discrete_sequence=["#C0DEFF", "#FCDDB0", "#FF9F9F", "#EDD2F3"],
+                               template="plotly_dark",
+                               title=chart_title,
+                                labels={"Experience_Level": "Experience Level", "y":"AVG Salary"},
+                                text_auto="0.3s"
+                       )
+
+        fig_experience.update_traces(
+            textfont = {
+                       "family": "consolas",
+                       "size": 18,
+                        "color":"#111"
+                       },
+            hovertemplate="Experience Level: %{label}<br>AVG Salary: %{value}",
+        )
+
+    fig_experience.update_layout(
+        showlegend=False,
+        title={
+            "font": {
+                "size": 28,
+                "family": "tahoma",
+            }
+        },
+        hoverlabel={
+            "bgcolor": "#000",
+            "font_size": 16,
+            "font_family": "tahoma"
+        },
+        xaxis={
+            "tickfont": {
+                "family": "arial",
+                "size": 15,
+            }
+        }
+    )
+
+    return fig_experience
+
+def px_pie_experince_popularity(df_filtered):
+    fig_pie_chart = px.pie(values=df_filtered,
+                           names=df_filtered.index,
+                           hole=0.40, template="plotly_dark",
+                           color=df_filtered.index,
+                           color_discrete_sequence=["#ADA2FF", "#C0DEFF", "#FCDDB0", "#FF9F9F", "#EDD2F3"],
+                           )
+
+
+    fig_pie_chart.update_traces(
+        textinfo="percent+label",
+        textposition="outside",
+        textfont = {
+                   "family": "consolas",
+                   "size": 14,
+                    "color":"white"
+                   },
+        hovertemplate="Experience Level: %{label}<br>Frequency: %{value}",
+        marker=dict(line=dict(color='#111', width=2))
+    )
+
+    fig_pie_chart.update_layout(
+        title={
+            "font": {
+                "size": 28,
+                "family": "tahoma",
+            }
+        },
+        hoverlabel={
+            "bgcolor": "#000",
+            "font_size": 16,
+            "font_family": "tahoma"
+        },
+    )
+
+    return fig_pie_chart
+
+def px_pie_experties_popularity(df_filtered):
+    fig_pie_chart = px.pie(values=df_filtered,
+                           names=df_filtered.index,
+                           hole=0.38, template="plotly_dark",
+                           color=df_filtered.index,
+                           color_discrete_sequence=["#ADA2FF", "#C0DEFF", "#FCDDB0", "#FF9F9F", "#EDD2F3"],
+                           )
+
+    fig_pie_chart.update_traces(
+        textinfo="percent+label",
+        textposition="outside",
+        textfont={
+            "family": "consolas",
+            "size": 14,
+            "color": "white"
+        },
+        hovertemplate="Experience Level: %{label}<br>Frequency: %{value}",
+        marker=dict(line=dict(color='#111', width=2))
+    )
+
+    fig_pie_chart.update_layout(
+        title={
+            "font": {
+                "size": 28,
+                "family": "tahoma",
+            }
+        },
+        hoverlabel={
+            "bgcolor": "#000",
+            "font_size": 16,
+            "font_family": "tahoma"
+        },
+    )
+
+    return fig_pie_chart
+
+# ================== Time Series ===============
+def px_year_line_chart(df_filtered, job):
+    fig = px.line(df_filtered,
+                  x=list(map(lambda x: str(x), df_filtered.index)),
+                  y="Salary_in_USD",
+                  markers=True,
+                  color_discrete_sequence=["#FF55BB"],
+                  labels={"x": "Year", "Salary_in_USD": "AVG Salary (USD)"},
+                  template="plotly_dark",
+                  title=f"{job} Evolution of The Salary",
+                  )
+
+    fig.update_traces(marker=dict(size=12,
+                                  line=dict(width=2,
+                                            color='#9336B4')))
+
+
+    fig.update_layout(
+        title={
+            "font": {
+                "size": 28,
+                "family": "tahoma",
+            }
+        },
+        hoverlabel={
+            "bgcolor": "#C32BAD",
+            "font_size": 16,
+            "font_family": "tahoma"
+        }
+    )
+
+    return fig
+
+# ================== Salary Distribution ===============
+# df_filtered: bin centres (index) x group values (columns, named like "Company Size")
+def px_salary_histogram(df_filtered):
+    fig = px.bar(df_filtered,
+                 color_discrete_sequence=DISTRIBUTION_COLORS,
+                 labels={"Salary_in_USD": "Salary (USD)", "value": "Number of Jobs"},
+                 template="plotly_dark",
+                 title="Salary Distribution",
+                 )
+
+    fig.update_layout(
+        bargap=0.05,
+        title={
+            "font": {
+                "size": 28,
+                "family": "tahoma",
+            }
+        },
+        hoverlabel={
+            "bgcolor": "#000",
+            "font_size": 16,
+            "font_family": "tahoma"
+        }
+    )
+
+    return fig
+
+# df_filtered: group values (index) x q1 / median / q3 / lowerfence / upperfence / mean
+def px_salary_box(df_filtered):
+    # Plotly Express Only Draws Boxes From The Raw Values --> graph_objects
+    # With The Quartiles Already Computed
+    import plotly.graph_objects as go
+
+    fig = go.Figure([
+        go.Box(name=str(name), x=[str(name)], marker_color=DISTRIBUTION_COLORS[i % len(DISTRIBUTION_COLORS)],
+               **{stat: [df_filtered[stat].iloc[i]] for stat in df_filtered.columns})
+        for i, name in enumerate(df_filtered.index)
+    ])
+
+    fig.update_layout(
+        template="plotly_dark",
+        showlegend=False,
+        title={
+            "text": f"Salary Range Per {df_filtered.index.name}",
+            "font": {
+                "size": 28,
+                "family": "tahoma",
+            }
+        },
+        yaxis={"title": {"text": "Salary (USD)"}},
+        hoverlabel={
+            "bgcolor": "#000",
+            "font_size": 16,
+            "font_family": "tahoma"
+        }
+    )
+
+    return fig
+
+
+# ****************************************************************************
+# ****************************** Chart Templates *****************************
+# ****************************************************************************
+class ChartTemplate:
+    # Layout & First Trace of a px Figure (Validated By Plotly Once)
+    def __init__(self, figure):
+        figure = figure.to_dict()
+        self.layout = figure["layout"]
+        self.trace = figure["data"][0]
+
+    def figure(self, traces, layout=None):
+        return {"data": traces, "layout": self.layout if layout is None else layout}
+
+    # One Trace Holding All The Categories
+    def single_trace(self, **arrays):
+        return self.figure([{**self.trace, **arrays}])
+
+    # One Trace Per Category (px `color=` Charts)
+    def trace_per_category(self, names, values, colors):
+        marker = self.trace["marker"]
+        if "size" in marker:
+            sizeref = values.max() / SIZE_MAX ** 2 if len(values) else 1
+
+        traces = []
+        for i, name in enumerate(names):
+            value = to_typed_array_spec(values[i:i + 1])
+            trace_marker = {**marker, "color": colors[i % len(colors)]}
+            if "size" in marker:
+                trace_marker["size"] = value
+                trace_marker["sizeref"] = sizeref
+
+            traces.append({
+                **self.trace,
+                "name": name,
+                "legendgroup": name,
+                "hovertemplate": self.trace["hovertemplate"].replace(PLACEHOLDER, name),
+                "marker": trace_marker,
+                "x": [name],
+                "y": value,
+            })
+
+        return self.figure(traces)
+
+    # One Trace Per Series of Several Points (Histogram Bars, Boxes)
+    def trace_per_series(self, names, arrays, colors):
+        traces = []
+        for i, name in enumerate(names):
+            trace = {**self.trace, "name": name,
+                     "marker": {**self.trace["marker"], "color": colors[i % len(colors)]}, **arrays[i]}
+            if "legendgroup" in self.trace:
+                trace["legendgroup"] = name
+            if "hovertemplate" in self.trace:
+                trace["hovertemplate"] = self.trace["hovertemplate"].replace(PLACEHOLDER, name)
+            traces.append(trace)
+
+        return self.figure(traces)
+
+
+def sample(index_name, name, size=3):
+    return pd.Series(np.arange(1, size + 1, dtype=np.int64),
+                     index=pd.Index([PLACEHOLDER] * size, name=index_name), name=name)
+
+
+def build_templates():
+    line_sample = sample("Year", "Salary_in_USD").astype(float).to_frame()
+    histogram_sample = pd.DataFrame({PLACEHOLDER: [1, 2, 3]}, index=pd.Index([2500.0, 7500.0, 12500.0], name="Salary_in_USD"),
+                                    ).rename_axis(columns=DIMENSION_PLACEHOLDER)
+    box_sample = pd.DataFrame({stat: [1.0] for stat in ["q1", "median", "q3", "lowerfence", "upperfence", "mean"]},
+                              index=pd.Index([PLACEHOLDER], name=DIMENSION_PLACEHOLDER))
+    return {
+        "top_job": ChartTemplate(px_top_job_chart(sample("Job_Title", "count"))),
+        "high_salary_job": ChartTemplate(px_high_salary_job_chart(sample("Job_Title", "Salary_in_USD"))),
+        "top_locations_scatter": ChartTemplate(px_top_locations(sample("Company_Location", "count", 1))),
+        "top_locations_bar": ChartTemplate(px_top_locations(sample("Company_Location", "count"))),
+        "salary_locations_scatter": ChartTemplate(px_salary_locations(sample("Company_Location", "Salary_in_USD", 1))),
+        "salary_locations_bar": ChartTemplate(px_salary_locations(sample("Company_Location", "Salary_in_USD", 4))),
+        "experience_scatter": ChartTemplate(px_bar_experince(sample("Experience_Level", "Salary_in_USD", 1))),
+        "experience_bar": ChartTemplate(px_bar_experince(sample("Experience_Level", "Salary_in_USD"))),
+        "pie_experince": ChartTemplate(px_pie_experince_popularity(sample("Experience_Level", "count"))),
+        "pie_experties": ChartTemplate(px_pie_experties_popularity(sample("Expertise_Level", "count"))),
+        "year_line": ChartTemplate(px_year_line_chart(line_sample, PLACEHOLDER)),
+        "salary_histogram": ChartTemplate(px_salary_histogram(histogram_sample)),
+        "salary_box": ChartTemplate(px_salary_box(box_sample)),
+    }
+
+
+# Drawn On First Use (About 1 s) Unless load_templates() Ran At Startup
+_templates = None
+_templates_lock = threading.Lock()
+
+
+def load_templates():
+    global _templates
+    if _templates is None:
+        with _templates_lock:
+            if _templates is None:
+                _templates = build_templates()
+    return _templates
+
+
+# ****************************************************************************
+# ************************ Charts From The Templates *************************
+# ****************************************************************************
+# Same figures as the px_* functions, as dicts ready for dcc.Graph.
+
+def percent_of_total(values):
+    return (values / values.sum()) * 100
+
+
+# ---------------- Home Page Graphs ----------------
+def top_job_chart(df_filtered):
+    counts = df_filtered.to_numpy()
+    percent = percent_of_total(counts)
+    return load_templates()["top_job"].single_trace(
+        x=to_typed_array_spec(percent),
+        y=df_filtered.index.tolist(),
+        text=[f"{p:0.2f}%" for p in percent],
+    )
+
+def high_salary_job_chart(df_filtered):
+    return load_templates()["high_salary_job"].single_trace(
+        x=to_typed_array_spec(df_filtered.to_numpy()),
+        y=df_filtered.index.tolist(),
+    )
+
+
+# *************** Locations Graphs *************
+def top_locations(df_filtered):
+    names = df_filtered.index.tolist()
+    counts = df_filtered.to_numpy()
+
+    if len(counts) > 0 and len(counts) < 3:
+        return load_templates()["top_locations_scatter"].trace_per_category(names, counts, SCATTER_COLORS)
+
+    percent = percent_of_total(counts)
+    return load_templates()["top_locations_bar"].single_trace(
+        x=names,
+        y=to_typed_array_spec(percent),
+        text=[f"{count}\n({p:0.2f}%)" for count, p in zip(counts.tolist(), percent)],
+    )
+
+def salary_locations(df_filtered):
+    names = df_filtered.index.tolist()
+    salaries = df_filtered.to_numpy()
+
+    if len(salaries) > 0 and len(salaries) < 4:
+        return load_templates()["salary_locations_scatter"].trace_per_category(names, salaries, SCATTER_COLORS)
+
+    return load_templates()["salary_locations_bar"].single_trace(x=to_typed_array_spec(salaries), y=names)
+
+
+# ================ Experience Graphs ================
+def bar_experince(df_filtered):
+    names = df_filtered.index.tolist()
+    salaries = df_filtered.to_numpy()
+
+    if len(salaries) > 0 and len(salaries) < 3:
+        return load_templates()["experience_scatter"].trace_per_category(names, salaries, SCATTER_COLORS)
+
+    return load_templates()["experience_bar"].trace_per_category(names, salaries, EXPERIENCE_COLORS)
+
+def pie_chart(template, df_filtered):
+    names = df_filtered.index.tolist()
+    return template.single_trace(
+        labels=names,
+        values=to_typed_array_spec(df_filtered.to_numpy()),
+        customdata=[[name] for name in names],
+        marker={**template.trace["marker"], "colors": [PIE_COLORS[i % len(PIE_COLORS)] for i in range(len(names))]},
+    )
+
+def pie_experince_popularity(df_filtered):
+    return pie_chart(load_templates()["pie_experince"], df_filtered)
+
+def pie_experties_popularity(df_filtered):
+    return pie_chart(load_templates()["pie_experties"], df_filtered)
+
+
+# ================== Time Series ===============
+def year_line_chart(df_filtered, job):
+    template = load_templates()["year_line"]
+    layout = {**template.layout, "title": {**template.layout["title"], "text": f"{job} Evolution of The Salary"}}
+    return template.figure(
+        [{**template.trace, "x": [str(year) for year in df_filtered.index], "y": to_typed_array_spec(df_filtered["Salary_in_USD"].to_numpy())}],
+        layout,
+    )
+
+
+# ================== Salary Distribution ===============
+def salary_histogram(df_filtered):
+    template = load_templates()["salary_histogram"]
+    dimension = df_filtered.columns.name
+    names = [str(name) for name in df_filtered.columns]
+    x = to_typed_array_spec(df_filtered.index.to_numpy())
+    counts = df_filtered.to_numpy()
+    arrays = [{"x": x, "y": to_typed_array_spec(counts[:, i].copy())} for i in range(len(names))]
+
+    figure = template.trace_per_series(names, arrays, DISTRIBUTION_COLORS)
+    for trace in figure["data"]:
+        trace["hovertemplate"] = trace["hovertemplate"].replace(DIMENSION_PLACEHOLDER, dimension)
+    legend = template.layout["legend"]
+    figure["layout"] = {**template.layout, "legend": {**legend, "title": {**legend["title"], "text": dimension}}}
+    return figure
+
+def salary_box(df_filtered):
+    template = load_templates()["salary_box"]
+    names = [str(name) for name in df_filtered.index]
+    # One Box Per Trace --> One Value Per Statistic (Plain Lists Are Shorter)
+    stats = {stat: df_filtered[stat].tolist() for stat in df_filtered.columns}
+    arrays = [{"x": [name], **{stat: [values[i]] for stat, values in stats.items()}}
+              for i, name in enumerate(names)]
+
+    figure = template.trace_per_series(names, arrays, DISTRIBUTION_COLORS)
+    title = template.layout["title"]["text"].replace(DIMENSION_PLACEHOLDER, df_filtered.index.name)
+    figure["layout"] = {**template.layout, "title": {**template.layout["title"], "text": title}}
+    return figure
+
+
+# px Function & Template Function of Every Chart
+CHARTS = {
+    "top_job_chart": (px_top_job_chart, top_job_chart),
+    "high_salary_job_chart": (px_high_salary_job_chart, high_salary_job_chart),
+    "top_locations": (px_top_locations, top_locations),
+    "salary_locations": (px_salary_locations, salary_locations),
+    "bar_experince": (px_bar_experince, bar_experince),
+    "pie_experince_popularity": (px_pie_experince_popularity, pie_experince_popularity),
+    "pie_experties_popularity": (px_pie_experties_popularity, pie_experties_popularity),
+    "year_line_chart": (px_year_line_chart, year_line_chart),
+    "salary_histogram": (px_salary_histogram, salary_histogram),
+    "salary_box": (px_salary_box, salary_box),
+}
@@ -0,0 +1,206 @@
+# Importing Toolkit
+import numpy as np
+
+from code_engine import ColumnCodes
+from kpi_engine import sort_within_cells
+
+# *************************************************************************
+# ** Salary Histograms: Binned Salaries Per (Year, Job, Dimension) Cell  **
+# *************************************************************************
+# The distribution charts never get the salaries themselves, only how many
+# fall in each fixed SALARY_BIN_WIDTH bin, so a figure has the same size for
+# 5 thousand or 5 million rows:
+#
+#   histograms[(year, job, dimension)] -> SalaryHistogram
+#       labels            --> the dimension values (sorted)
+#       counts[label, b]  --> rows of that value in bin first_bin + b
+#       sums / mins / maxs --> exact, per value (means & whisker ends)
+#
+# The bins are the same for every cell (bin = salary // width), so cells
+# merge by adding their counts: the new rows folded in by live_data.py and
+# the "all" cells of a partitioned folder are merged, not recomputed.
+# The box plot quartiles are read from the bins (the rows of a bin spread
+# evenly over it), so they are within one bin width of the exact values.
+
+ALL_YEARS = "all"
+ALL_JOBS = "All"
+
+SALARY_BIN_WIDTH = 5_000
+
+HISTOGRAM_DIMENSIONS = ["Experience_Level", "Company_Size", "Job_Title"]
+
+# Tukey's Whiskers: 1.5 IQR Past The Quartiles (Cut At The Real Min / Max)
+WHISKER_IQR = 1.5
+
+
+class SalaryHistogram:
+    def __init__(self, labels, first_bin, counts, sums, mins, maxs):
+        self.labels = labels
+        self.first_bin = first_bin
+        self.counts = counts
+        self.sums = sums
+        self.mins = mins
+        self.maxs = maxs
+
+    def edges(self):
+        # Left Edge of Every Bin (USD)
+        return (self.first_bin + np.arange(self.counts.shape[1])) * SALARY_BIN_WIDTH
+
+    def sizes(self):
+        return self.counts.sum(axis=1)
+
+    def pooled(self):
+        # Every Label Added Up In One (e.g. All The Jobs of a Cell)
+        return SalaryHistogram([ALL_JOBS], self.first_bin, self.counts.sum(axis=0, keepdims=True),
+                               self.sums.sum(keepdims=True), self.mins.min(keepdims=True),
+                               self.maxs.max(keepdims=True))
+
+    def take(self, positions):
+        # Only Some Labels (e.g. The Most Common Jobs), Bins Kept
+        positions = np.asarray(positions, dtype=np.int64)
+        return SalaryHistogram([self.labels[i] for i in positions], self.first_bin, self.counts[positions],
+                               self.sums[positions], self.mins[positions], self.maxs[positions])
+
+    def order_statistics(self, ranks):
+        # The Salary of Rank k (0 = Smallest) of Every Label, Placed Evenly
+        # Inside Its Bin; The Smallest & Largest Are The Exact Min & Max
+        cumulative = np.cumsum(self.counts, axis=1)
+        bins = np.minimum((cumulative <= ranks[:, None]).sum(axis=1), self.counts.shape[1] - 1)
+        rows = np.arange(len(self.labels))
+        in_bin = self.counts[rows, bins]
+        before = cumulative[rows, bins] - in_bin
+        inside = np.divide(ranks - before + 0.5, in_bin, out=np.zeros(len(rows)), where=in_bin > 0)
+        values = np.clip((self.first_bin + bins + inside) * SALARY_BIN_WIDTH, self.mins, self.maxs)
+        values = np.where(ranks <= 0, self.mins, values)
+        return np.where(ranks >= self.sizes() - 1, self.maxs, values)
+
+    def quantiles(self, q):
+        # Like pandas' quantile: Between The Ranks Around (n - 1) * q
+        position = (np.maximum(self.sizes(), 1) - 1) * q
+        lower = np.floor(position).astype(np.int64)
+        low_values = self.order_statistics(lower)
+        high_values = self.order_statistics(lower + 1)
+        return low_values + (high_values - low_values) * (position - lower)
+
+    def box_summary(self):
+        q1, median, q3 = self.quantiles(0.25), self.quantiles(0.5), self.quantiles(0.75)
+        iqr = q3 - q1
+        return {
+            "q1": q1,
+            "median": median,
+            "q3": q3,
+            "lowerfence": np.maximum(self.mins, q1 - WHISKER_IQR * iqr),
+            "upperfence": np.minimum(self.maxs, q3 + WHISKER_IQR * iqr),
+            "mean": self.sums / np.maximum(self.sizes(), 1),
+        }
+
+
+def merge_histograms(histogram, delta):
+    # Labels Kept Sorted, Bins Widened To Cover Both
+    labels = sorted(set(histogram.labels) | set(delta.labels))
+    first_bin = min(histogram.first_bin, delta.first_bin)
+    n_bins = max(histogram.first_bin + histogram.counts.shape[1], delta.first_bin + delta.counts.shape[1]) - first_bin
+
+    counts = np.zeros((len(labels), n_bins), dtype=np.int64)
+    sums = np.zeros(len(labels), dtype=np.int64)
+    mins = np.full(len(labels), np.iinfo(np.int64).max)
+    maxs = np.full(len(labels), np.iinfo(np.int64).min)
+    positions = {label: i for i, label in enumerate(labels)}
+    for part in [histogram, delta]:
+        rows = np.array([positions[label] for label in part.labels], dtype=np.int64)
+        offset = part.first_bin - first_bin
+        counts[rows, offset:offset + part.counts.shape[1]] += part.counts
+        sums[rows] += part.sums
+        mins[rows] = np.minimum(mins[rows], part.mins)
+        maxs[rows] = np.maximum(maxs[rows], part.maxs)
+
+    return SalaryHistogram(labels, first_bin, counts, sums, mins, maxs)
+
+
+def merge_histogram_cubes(histograms, delta):
+    merged = dict(histograms)
+    for key, histogram in delta.items():
+        merged[key] = merge_histograms(merged[key], histogram) if key in merged else histogram
+    return merged
+
+
+def get_histogram(histograms, year, job, dimension):
+    # Missing Cell --> The Job Did Not Exist In That Year
+    histogram = histograms.get((year, job, dimension))
+    if histogram is None:
+        empty = np.zeros(0, dtype=np.int64)
+        histogram = SalaryHistogram([], 0, np.zeros((0, 0), dtype=np.int64), empty, empty, empty)
+    return histogram
+
+
+# -------------- Building The Cells ------------------ #
+def _add_dimension(histograms, cells, codes, salary, column, cell_key):
+    # cells / codes / salary: One Entry Per (Row, Cell) --> Code -1 Is Left Out
+    present = codes >= 0
+    groups = cells[present] * column.n_groups + codes[present]
+    if not len(groups):
+        return
+
+    # One Sort: By (Cell, Value), Then By Salary
+    sorted_salaries = sort_within_cells(groups, salary[present], int(groups.max()) + 1).astype(np.int64)
+    group_codes, group_sizes = np.unique(groups, return_counts=True)
+    starts = np.concatenate([[0], np.cumsum(group_sizes)[:-1]])
+
+    mins = sorted_salaries[starts]
+    maxs = sorted_salaries[starts + group_sizes - 1]
+    sums = np.add.reduceat(sorted_salaries, starts)
+
+    # Bin Counts: The Sorted Salaries Are Runs of The Same (Group, Bin)
+    bins = sorted_salaries // SALARY_BIN_WIDTH
+    row_groups = np.repeat(np.arange(len(group_codes)), group_sizes)
+    run_starts = np.flatnonzero(np.diff(row_groups * (int(bins.max()) + 1) + bins, prepend=-1))
+    run_groups = row_groups[run_starts]
+    run_bins = bins[run_starts]
+    run_counts = np.diff(np.append(run_starts, len(bins)))
+
+    # One SalaryHistogram Per (Year, Job) Cell (The Groups Are Sorted By Cell)
+    group_cells = group_codes // column.n_groups
+    cell_starts = np.flatnonzero(np.diff(group_cells, prepend=-1))
+    cell_ends = np.append(cell_starts[1:], len(group_codes))
+    run_bounds = np.append(np.searchsorted(run_groups, cell_starts), len(run_groups))
+    for i, (start, end) in enumerate(zip(cell_starts.tolist(), cell_ends.tolist())):
+        runs = slice(run_bounds[i], run_bounds[i + 1])
+        first_bin = int(run_bins[runs].min())
+        counts = np.zeros((end - start, int(run_bins[runs].max()) - first_bin + 1), dtype=np.int64)
+        counts[run_groups[runs] - start, run_bins[runs] - first_bin] = run_counts[runs]
+
+        labels = [column.labels[code] for code in (group_codes[start:end] % column.n_groups).tolist()]
+        histograms[cell_key(int(group_cells[start])) + (column.name,)] = SalaryHistogram(
+            labels, first_bin, counts, sums[start:end], mins[start:end], maxs[start:end])
+
+
+def build_histograms(df, dimensions=HISTOGRAM_DIMENSIONS):
+    years = ColumnCodes(df["Year"])
+    jobs = ColumnCodes(df["Job_Title"])
+    salary = np.tile(df["Salary_in_USD"].to_numpy(), 4)
+
+    # Same 4 Cells Per Row As The KPI Table: (year, job), (year, "All"),
+    # ("all", job), ("all", "All") --> The Rollups Come From The Same Pass
+    n_jobs = jobs.n_groups + 1
+    all_year, all_job = years.n_groups, jobs.n_groups
+    cells = np.concatenate([years.codes * n_jobs + jobs.codes,
+                            years.codes * n_jobs + all_job,
+                            all_year * n_jobs + jobs.codes,
+                            np.full(len(df), all_year * n_jobs + all_job)])
+    # Rows Without a Year or Job Are Left Out, Like groupby Does
+    missing = np.tile((years.codes < 0) | (jobs.codes < 0), 4)
+
+    year_labels = years.labels + [ALL_YEARS]
+    job_labels = jobs.labels + [ALL_JOBS]
+
+    def cell_key(cell):
+        return year_labels[cell // n_jobs], job_labels[cell % n_jobs]
+
+    histograms = {}
+    for dimension in dimensions:
+        column = ColumnCodes(df[dimension])
+        codes = np.tile(column.codes, 4)
+        codes[missing] = -1
+        _add_dimension(histograms, cells, codes, salary, column, cell_key)
+
+    return histograms
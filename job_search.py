@@ -0,0 +1,80 @@
+# Importing Toolkit
+import re
+import bisect
+import numpy as np
+
+# *************************************************************************
+# ** Job Title Search Index (Server-Side Search of The Job Menu)         **
+# *************************************************************************
+# Built once per dataset from the jobs of every year and their row counts:
+#   - every word of every title, sorted, with the title it comes from
+#     --> the titles having a word starting with "sc" are one bisect range
+#   - the lowercased titles, sorted --> titles starting with the query
+#   - one mask per year --> only the jobs of the selected year
+#
+# A query matches a title when each of its words starts a word of the title.
+# Results: titles starting with the query first, then the most common jobs
+# of the year, then alphabetical.
+
+WORD = re.compile(r"\w+")
+
+# Limits of The Packed Sort Key (2M Titles, 2^40 Rows Per Job)
+MAX_ROWS = (1 << 40) - 1
+
+
+def words(text):
+    return WORD.findall(text.lower())
+
+
+class JobSearchIndex:
+    def __init__(self, job_counts):
+        # job_counts: {year or "all": {title: rows}}
+        self.titles = sorted({title for counts in job_counts.values() for title in counts})
+        ids = {title: i for i, title in enumerate(self.titles)}
+
+        pairs = sorted((word, ids[title]) for title in self.titles for word in set(words(title)))
+        self.words = [word for word, _ in pairs]
+        self.word_ids = np.array([i for _, i in pairs], dtype=np.int64)
+
+        lowered = [title.lower() for title in self.titles]
+        self.lower_order = np.array(sorted(range(len(lowered)), key=lowered.__getitem__), dtype=np.int64)
+        self.lower_titles = [lowered[i] for i in self.lower_order]
+
+        self.counts = {}
+        for year, counts in job_counts.items():
+            year_counts = np.zeros(len(self.titles), dtype=np.int64)
+            for title, rows in counts.items():
+                year_counts[ids[title]] = rows
+            self.counts[year] = year_counts
+
+    def _prefix_range(self, keys, prefix):
+        return bisect.bisect_left(keys, prefix), bisect.bisect_left(keys, prefix + "\uffff")
+
+    def search(self, query, year="all", limit=20):
+        counts = self.counts.get(year)
+        if counts is None:
+            return []
+        mask = counts > 0
+
+        query = (query or "").strip().lower()
+        for word in words(query):
+            start, end = self._prefix_range(self.words, word)
+            has_word = np.zeros(len(self.titles), dtype=bool)
+            has_word[self.word_ids[start:end]] = True
+            mask &= has_word
+
+        candidates = np.flatnonzero(mask)
+        if len(candidates) == 0:
+            return []
+
+        starts = np.zeros(len(self.titles), dtype=bool)
+        if query:
+            start, end = self._prefix_range(self.lower_titles, query)
+            starts[self.lower_order[start:end]] = True
+
+        # One Sort Key: Prefix Match (Bit 61), Fewer Rows (Bits 21-60), Name (Bits 0-20)
+        keys = ((~starts[candidates]).astype(np.int64) << 61) | ((MAX_ROWS - counts[candidates]) << 21) | candidates
+        if len(keys) > limit:
+            keys = keys[np.argpartition(keys, limit)[:limit]]
+        keys.sort()
+        return [self.titles[i] for i in (keys & ((1 << 21) - 1)).tolist()]
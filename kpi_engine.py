@@ -0,0 +1,131 @@
+# Importing Toolkit
+import numpy as np
+
+from code_engine import ColumnCodes, count_sum
+
+# *************************************************************************
+# ** KPI Table: The Card Numbers of Every (Year, Job) Cell               **
+# *************************************************************************
+# Every row belongs to 4 cells: (year, job), (year, "All"), ("all", job) and
+# ("all", "All"). The salaries are repeated once per cell, then ONE sort by
+# (cell, salary) leaves each cell's salaries sorted next to each other:
+#   - count, sum, mean   --> np.bincount over the cell codes
+#   - the KPI_QUANTILES  --> read at their position in the cell's slice
+#   - distinct locations / jobs --> distinct (cell, code) pairs
+# The percentiles interpolate like pandas' Series.quantile (linear). Only
+# these values are kept, not the sorted salaries.
+#
+#   kpis.get(year, job) -> {"count": ..., "median": ..., ...} or None
+#
+# A new card only needs a new column in KPI_QUANTILES / build_kpis.
+# kpi_table(rows) makes a table of given values (the summary of a
+# partitioned folder, see partitions.py).
+
+ALL_YEARS = "all"
+ALL_JOBS = "All"
+
+KPI_QUANTILES = {"p25": 0.25, "median": 0.5, "p75": 0.75, "p90": 0.9}
+
+# Distinct Counts With a (Cell x Code) Presence Grid Up To This Many Cells,
+# With np.unique Above
+DISTINCT_GRID_LIMIT = 50_000_000
+
+
+def positions_quantile(salaries, starts, counts, q):
+    # Linear Interpolation Between The Two Closest Ranks (Vectorized Over Cells)
+    position = (counts - 1) * q
+    lower = np.floor(position).astype(np.int64)
+    upper = np.minimum(lower + 1, counts - 1)
+    low_values = salaries[starts + lower].astype(np.float64)
+    high_values = salaries[starts + upper].astype(np.float64)
+    return low_values + (high_values - low_values) * (position - lower)
+
+
+def sort_within_cells(cells, salaries, n_cells):
+    # Salaries Sorted By (Cell, Salary): Both Packed In One Integer When They
+    # Fit (One Plain Sort), Else np.lexsort
+    if np.issubdtype(salaries.dtype, np.integer) and len(salaries):
+        low = int(salaries.min())
+        span = int(salaries.max()) - low + 1
+        if n_cells * span < 2 ** 62:
+            packed = np.sort(cells * span + (salaries.astype(np.int64) - low))
+            return (packed % span + low).astype(salaries.dtype)
+    return salaries[np.lexsort((salaries, cells))]
+
+
+def distinct_per_cell(cells, codes, n_codes, n_cells):
+    present = codes >= 0
+    pairs = cells[present] * n_codes + codes[present]
+    if n_cells * n_codes <= DISTINCT_GRID_LIMIT:
+        seen = np.zeros(n_cells * n_codes, dtype=bool)
+        seen[pairs] = True
+        return seen.reshape(n_cells, n_codes).sum(axis=1)
+    return np.bincount(np.unique(pairs) // n_codes, minlength=n_cells)
+
+
+class KpiTable:
+    def __init__(self, keys, columns):
+        # keys: {(year, job): position} --> row of every column array
+        self.keys = keys
+        self.columns = columns
+
+    def get(self, year=ALL_YEARS, job=ALL_JOBS):
+        # None --> The Job Has No Rows In That Year
+        position = self.keys.get((year, job))
+        if position is None:
+            return None
+        return {name: values[position].item() for name, values in self.columns.items()}
+
+
+def build_kpis(df):
+    years = ColumnCodes(df["Year"])
+    jobs = ColumnCodes(df["Job_Title"])
+    locations = ColumnCodes(df["Company_Location"])
+    salary = df["Salary_in_USD"].to_numpy()
+
+    # Rows Without a Year or Job Are Left Out, Like groupby Does
+    if (years.codes < 0).any() or (jobs.codes < 0).any():
+        keep = (years.codes >= 0) & (jobs.codes >= 0)
+        years.codes, jobs.codes, locations.codes = years.codes[keep], jobs.codes[keep], locations.codes[keep]
+        salary = salary[keep]
+
+    # Cell Code = Year Code * (Jobs + 1) + Job Code, Where The Extra Year /
+    # Job Code Stands For "all" / "All"
+    n_jobs = jobs.n_groups + 1
+    n_cells = (years.n_groups + 1) * n_jobs
+    all_year, all_job = years.n_groups, jobs.n_groups
+    cells = np.concatenate([years.codes * n_jobs + jobs.codes,
+                            years.codes * n_jobs + all_job,
+                            all_year * n_jobs + jobs.codes,
+                            np.full(len(salary), all_year * n_jobs + all_job)])
+    cell_salary = np.tile(salary, 4)
+
+    # The One Sort: By Cell, Then By Salary Inside Each Cell
+    sorted_salaries = sort_within_cells(cells, cell_salary, n_cells)
+
+    counts, sums = count_sum(cells, cell_salary, n_cells)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+
+    # Only The Cells With Rows
+    present = np.flatnonzero(counts)
+    year_labels = years.labels + [ALL_YEARS]
+    job_labels = jobs.labels + [ALL_JOBS]
+    keys = {(year_labels[cell // n_jobs], job_labels[cell % n_jobs]): position
+            for position, cell in enumerate(present.tolist())}
+
+    counts, sums, starts = counts[present], sums[present], starts[present]
+    columns = {"count": counts, "sum": sums, "mean": sums / counts}
+    for name, q in KPI_QUANTILES.items():
+        columns[name] = positions_quantile(sorted_salaries, starts, counts, q)
+    columns["locations"] = distinct_per_cell(cells, np.tile(locations.codes, 4), locations.n_groups, n_cells)[present]
+    columns["jobs"] = distinct_per_cell(cells, np.tile(jobs.codes, 4), jobs.n_groups, n_cells)[present]
+
+    return KpiTable(keys, columns)
+
+
+def kpi_table(rows):
+    # rows: {(year, job): {column: value}} --> Same get() As a Built Table
+    keys = {key: position for position, key in enumerate(rows)}
+    names = next(iter(rows.values()), {})
+    columns = {name: np.array([row[name] for row in rows.values()]) for name in names}
+    return KpiTable(keys, columns)
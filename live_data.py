@@ -0,0 +1,253 @@
+# Importing Toolkit
+import io
+import os
+import sys
+import copy
+import json
+import time
+import hashlib
+import threading
+import numpy as np
+import pandas as pd
+
+from data_loader import DTYPES, COLUMNS, CATEGORY_COLUMNS, RENAMES, IQR_SKETCHES, rename_category, \
+    sketch_bounds, cleaning_params
+from quantile_sketch import ValueCounts
+from row_index import RowIndex
+from aggregates import build_cube, merge_cubes
+from kpi_engine import build_kpis
+from histograms import build_histograms, merge_histogram_cubes
+
+# *************************************************************************
+# ** Live Data: New Salary Rows Folded In While The Server Runs          **
+# *************************************************************************
+# Everything the callbacks read (frame, row index, cube, KPIs, histograms,
+# version) is one DataState. A refresh builds a new DataState next to the
+# current one and swaps it in with a single assignment, so a reader that takes
+# `live.current` once always sees one consistent dataset.
+#
+# Sources: the CSV (rows appended at its end) + the CSV files dropped in an
+# append folder (read in name order). New rows are folded in:
+#   - the raw salary counts get the new salaries --> new Q1 / Q3 bounds
+#   - if the new bounds keep / drop the same old rows, the new kept rows
+#     are appended and their cube & histograms are added to the old ones
+#     cell by cell
+#   - otherwise (or when the CSV was rewritten) everything is re-read
+# Rows are only folded in where a full read puts them (the CSV first, then
+# the append files in name order): new CSV rows after an append file was
+# read, or a file named before one already read, mean everything is re-read.
+# The version hashes the bytes read in that same order (+ the cleaning
+# settings), so the same rows give the same version, folded in or re-read.
+
+
+class DataState:
+    def __init__(self, df, version, row_index=None, cube=None, salaries=None, sketch=None, kpis=None,
+                 histograms=None):
+        self.df = df
+        self.version = version
+        self.row_index = row_index if row_index is not None else RowIndex(df)
+        self.cube = cube if cube is not None else build_cube(df, self.row_index)
+        # Card Numbers (Percentiles Don't Add Up --> Rebuilt In One Pass When Rows Are Folded In)
+        self.kpis = kpis if kpis is not None else build_kpis(df)
+        self.histograms = histograms if histograms is not None else build_histograms(df)
+        # Raw Salaries (Outliers Included) --> Needed To Fold New Rows In
+        self.salaries = salaries
+        self.sketch = sketch
+        self.years = sorted(self.row_index.years)
+        self.rows = len(df)
+        self.jobs_title = ["All"] + sorted(self.row_index.jobs)
+
+
+def read_raw(data):
+    # CSV Bytes (With Header) --> Typed Frame With The Raw Column Names
+    return pd.read_csv(io.BytesIO(data), usecols=list(DTYPES), dtype=DTYPES)
+
+
+def concat_raw(raws):
+    raw = pd.concat(raws, ignore_index=True)
+    # Different Categories Per File --> Back To Sorted Categories
+    return raw.astype({column.replace("_", " "): "category" for column in CATEGORY_COLUMNS})
+
+
+def clean_rows(raw, lower, upper):
+    # Same Cleaning As data_loader.clean_data, With Given IQR Bounds
+    raw = raw.rename(columns=lambda column: column.replace(" ", "_"))
+    for column, old, new in RENAMES:
+        raw[column] = rename_category(raw[column], old, new)
+
+    salary = raw["Salary_in_USD"]
+    return raw[(salary >= lower) & (salary < upper)].reset_index(drop=True)[COLUMNS]
+
+
+def kept(values, bounds):
+    return (values >= bounds[0]) & (values < bounds[1])
+
+
+def fold(state, raw, version):
+    # New DataState + The (Year, Job) Pairs of The New Rows, or None When
+    # The New Bounds Change Which Old Rows Are Outliers
+    new_salaries = raw["Salary in USD"].to_numpy()
+    salaries = copy.deepcopy(state.salaries).add(new_salaries)
+    sketch = salaries if state.sketch is state.salaries else copy.deepcopy(state.sketch).add(new_salaries)
+
+    old_bounds, bounds = sketch_bounds(state.sketch), sketch_bounds(sketch)
+    values = np.array(list(state.salaries.counts))
+    if (kept(values, old_bounds) != kept(values, bounds)).any():
+        return None
+
+    rows = clean_rows(raw, *bounds)
+
+    # Sorted Categories of Old + New Rows (Old Codes Only Change If Needed)
+    df = state.df
+    dtypes = {}
+    for column in CATEGORY_COLUMNS:
+        categories = set(df[column].cat.categories) | set(rows[column].cat.categories)
+        dtypes[column] = pd.CategoricalDtype(sorted(categories))
+    changed = {column: dtype for column, dtype in dtypes.items() if dtype != df[column].dtype}
+    if changed:
+        df = df.astype(changed)
+    rows = rows.astype(dtypes)
+
+    rows_index = RowIndex(rows)
+    state = DataState(
+        pd.concat([df, rows], ignore_index=True),
+        version,
+        row_index=state.row_index.extended(rows_index),
+        cube=merge_cubes(state.cube, build_cube(rows, rows_index), changed),
+        histograms=merge_histogram_cubes(state.histograms, build_histograms(rows)),
+        salaries=salaries,
+        sketch=sketch,
+    )
+    touched = set(zip(rows["Year"].tolist(), rows["Job_Title"].tolist()))
+    return state, touched
+
+
+class LiveDataset:
+    def __init__(self, state=None):
+        self.current = state
+        self.path = None
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._watcher_pid = None
+
+    def on_swap(self, listener):
+        # listener(old state, new state, touched (year, job) pairs or None For All)
+        self._listeners.append(listener)
+
+    def swap(self, state, touched=None):
+        old, self.current = self.current, state
+        for listener in self._listeners:
+            listener(old, state, touched)
+
+    # -------------- Sources ------------------ #
+    def follow(self, path, append_dir=None, iqr_method="exact"):
+        self.path = path
+        self.append_dir = append_dir
+        self.iqr_method = iqr_method
+        with self._lock:
+            self.rebuild()
+
+    def append_files(self, seen=()):
+        if not self.append_dir or not os.path.isdir(self.append_dir):
+            return []
+        names = sorted(name for name in os.listdir(self.append_dir) if name.endswith(".csv"))
+        return [os.path.join(self.append_dir, name) for name in names if name not in seen]
+
+    def rebuild(self):
+        # Everything Re-Read From The Sources
+        with open(self.path, "rb") as f:
+            data = f.read()
+        # Only Complete Lines: The Rest Is Read By refresh() Once Written
+        data = data[:data.rfind(b"\n") + 1]
+        files = self.append_files()
+
+        digest = hashlib.sha1(json.dumps(cleaning_params(self.iqr_method), sort_keys=True).encode())
+        digest.update(data)
+        raws = [read_raw(data)]
+        for file in files:
+            with open(file, "rb") as f:
+                file_data = f.read()
+            digest.update(os.path.basename(file).encode() + file_data)
+            raws.append(read_raw(file_data))
+        raw = concat_raw(raws)
+
+        salaries = ValueCounts().add(raw["Salary in USD"].to_numpy())
+        sketch = salaries if self.iqr_method == "exact" else IQR_SKETCHES[self.iqr_method]().add(
+            raw["Salary in USD"].to_numpy())
+        df = clean_rows(raw, *sketch_bounds(sketch))
+
+        self._commit(data[:data.index(b"\n") + 1], len(data), data[-4096:], {os.path.basename(f) for f in files},
+                     digest)
+        self.swap(DataState(df, digest.hexdigest(), salaries=salaries, sketch=sketch))
+
+    def _commit(self, header, offset, tail, seen, digest):
+        self.header, self.offset, self.tail, self.seen, self.digest = header, offset, tail, seen, digest
+
+    def refresh(self):
+        # True When New Rows Were Found
+        if self.path is None:
+            raise RuntimeError("Call follow() before refresh()")
+
+        with self._lock:
+            size = os.path.getsize(self.path)
+            with open(self.path, "rb") as f:
+                f.seek(self.offset - len(self.tail))
+                rewritten = size < self.offset or f.read(len(self.tail)) != self.tail
+                # Only Complete Lines (a Writer May Be In The Middle of One)
+                data = b"" if rewritten else f.read(size - self.offset)
+                data = data[:data.rfind(b"\n") + 1]
+
+            if rewritten:
+                self.rebuild()
+                return True
+
+            files = self.append_files(self.seen)
+            if not data.strip() and not files:
+                return False
+
+            # Rows That a Full Read Would Not Put At The End --> Re-Read
+            if self.seen and (data.strip() or os.path.basename(files[0]) < max(self.seen)):
+                self.rebuild()
+                return True
+
+            digest = self.digest.copy()
+            raws = []
+            if data.strip():
+                digest.update(data)
+                raws.append(read_raw(self.header + data))
+            for file in files:
+                with open(file, "rb") as f:
+                    file_data = f.read()
+                digest.update(os.path.basename(file).encode() + file_data)
+                raws.append(read_raw(file_data))
+
+            result = fold(self.current, concat_raw(raws), digest.hexdigest())
+            if result is None:
+                self.rebuild()
+                return True
+
+            tail = (self.tail + data)[-4096:]
+            self._commit(self.header, self.offset + len(data), tail,
+                         self.seen | {os.path.basename(f) for f in files}, digest)
+            self.swap(*result)
+            return True
+
+    # -------------- Background Polling ------------------ #
+    def watch(self, interval):
+        # One Polling Thread Per Process (Threads Don't Survive a Fork,
+        # So Every gunicorn Worker Starts Its Own On Its First Request)
+        if self._watcher_pid == os.getpid():
+            return
+        self._watcher_pid = os.getpid()
+
+        def poll():
+            while True:
+                time.sleep(interval)
+                try:
+                    if self.refresh():
+                        print(f"[live data] version {self.current.version[:12]}, {len(self.current.df):,} rows",
+                              file=sys.stderr, flush=True)
+                except Exception as error:  # Keep Serving The Current Data
+                    print(f"[live data] refresh failed: {error!r}", file=sys.stderr, flush=True)
+
+        threading.Thread(target=poll, name="live-data", daemon=True).start()
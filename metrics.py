@@ -0,0 +1,246 @@
+# Importing Toolkit
+import time
+import bisect
+import threading
+from functools import wraps
+from urllib.parse import urlparse
+
+from flask import Response, g, request, has_request_context
+
+from serialization import measure
+
+# *************************************************************************
+# ** Latency & Payload Metrics In Prometheus Text Format (/metrics)      **
+# *************************************************************************
+#   dashboard_callback_seconds{route, callback}    whole /_dash-update-component request
+#   dashboard_callback_compute_seconds{...}        the callback function itself
+#   dashboard_callback_serialize_seconds{...}      JSON encoding + Dash dispatch around it
+#   dashboard_response_bytes{route, callback}      size of the response body
+#   dashboard_figure_build_seconds{chart}          building a figure (figure cache misses)
+#   dashboard_figure_bytes{chart}                  JSON size of a built figure (sampled)
+#   dashboard_figure_encode_seconds{chart}         JSON encoding of a built figure (sampled)
+#   dashboard_rows_scanned_total{chart}            aggregated rows read to build the figures
+#
+# Everything is kept in a few dicts of counts behind one lock. When the
+# metrics are switched off the decorators return the functions unchanged
+# and no request hook or route is registered.
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+SIZE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+CALLBACK_PATH = "/_dash-update-component"
+
+# Figure Size & Encode Time: Only 1 Build In MEASURE_EVERY Is Encoded Once More
+# (The Others Pay No Extra Encoding; The First Build of a Chart Always Is)
+MEASURE_EVERY = 10
+
+
+def format_labels(names, values, extra=""):
+    pairs = [f'{name}="{str(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Histogram:
+    def __init__(self, name, description, label_names, buckets):
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self.buckets = buckets
+        self.series = {}
+
+    def observe(self, labels, value):
+        counts = self.series.get(labels)
+        if counts is None:
+            # One Count Per Bucket + "+Inf", Then The Sum
+            counts = self.series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        for labels, counts in self.series.items():
+            cumulative = 0
+            for bound, count in zip(list(self.buckets) + ["+Inf"], counts[:-1]):
+                cumulative += count
+                le = f'le="{bound}"'
+                lines.append(f"{self.name}_bucket{format_labels(self.label_names, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{format_labels(self.label_names, labels)} {counts[-1]}")
+            lines.append(f"{self.name}_count{format_labels(self.label_names, labels)} {cumulative}")
+        return lines
+
+
+class Counter:
+    def __init__(self, name, description, label_names):
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self.series = {}
+
+    def inc(self, labels, value=1):
+        self.series[labels] = self.series.get(labels, 0) + value
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} counter"]
+        for labels, value in self.series.items():
+            lines.append(f"{self.name}{format_labels(self.label_names, labels)} {value}")
+        return lines
+
+
+class Metrics:
+    def __init__(self, enabled=True, routes=(), measure_every=MEASURE_EVERY):
+        self.enabled = enabled
+        self.routes = set(routes)
+        self.measure_every = measure_every
+        self._builds = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # Extra Lines Computed When /metrics Is Read (e.g. Figure Cache Stats)
+        self._collectors = []
+
+        callback_labels = ("route", "callback")
+        self.callback_seconds = Histogram(
+            "dashboard_callback_seconds", "Latency of a Dash callback request.", callback_labels, LATENCY_BUCKETS)
+        self.compute_seconds = Histogram(
+            "dashboard_callback_compute_seconds", "Time spent inside the callback function.",
+            callback_labels, LATENCY_BUCKETS)
+        self.serialize_seconds = Histogram(
+            "dashboard_callback_serialize_seconds", "JSON encoding and Dash dispatch around the callback.",
+            callback_labels, LATENCY_BUCKETS)
+        self.response_bytes = Histogram(
+            "dashboard_response_bytes", "Size of the callback response body.", callback_labels, SIZE_BUCKETS)
+        self.build_seconds = Histogram(
+            "dashboard_figure_build_seconds", "Time to build a figure (figure cache misses).",
+            ("chart",), LATENCY_BUCKETS)
+        self.figure_bytes = Histogram(
+            "dashboard_figure_bytes", "JSON size of a built figure.", ("chart",), SIZE_BUCKETS)
+        self.encode_seconds = Histogram(
+            "dashboard_figure_encode_seconds", "Time to encode a built figure to JSON.", ("chart",), LATENCY_BUCKETS)
+        self.rows_scanned = Counter(
+            "dashboard_rows_scanned_total", "Aggregated rows read to build the figures.", ("chart",))
+
+        self._metrics = [self.callback_seconds, self.compute_seconds, self.serialize_seconds,
+                         self.response_bytes, self.build_seconds, self.figure_bytes, self.encode_seconds,
+                         self.rows_scanned]
+
+    # -------------- Decorators ------------------ #
+    def track_chart(self, create_chart):
+        if not self.enabled:
+            return create_chart
+
+        labels = (create_chart.__name__,)
+
+        @wraps(create_chart)
+        def tracked_chart(*args):
+            self._local.rows = 0
+            start = time.perf_counter()
+            figure = create_chart(*args)
+            seconds = time.perf_counter() - start
+            with self._lock:
+                builds = self._builds.get(labels, 0)
+                self._builds[labels] = builds + 1
+                self.build_seconds.observe(labels, seconds)
+                self.rows_scanned.inc(labels, self._local.rows)
+
+            # Encoded Once More (Sampled) --> Size & Encode Time Per Chart
+            if builds % self.measure_every == 0:
+                size, encode_seconds = measure(figure)
+                with self._lock:
+                    self.figure_bytes.observe(labels, size)
+                    self.encode_seconds.observe(labels, encode_seconds)
+            return figure
+
+        return tracked_chart
+
+    def count_rows(self, get_rows):
+        # Adds The Length of What `get_rows` Returns To The Current Chart
+        if not self.enabled:
+            return get_rows
+
+        @wraps(get_rows)
+        def counted(*args):
+            rows = get_rows(*args)
+            self._local.rows = getattr(self._local, "rows", 0) + len(rows)
+            return rows
+
+        return counted
+
+    def track_callback(self, callback):
+        if not self.enabled:
+            return callback
+
+        @wraps(callback)
+        def tracked_callback(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return callback(*args, **kwargs)
+            finally:
+                if has_request_context():
+                    g.callback_compute_seconds = time.perf_counter() - start
+
+        return tracked_callback
+
+    def add_collector(self, collect):
+        self._collectors.append(collect)
+
+    # -------------- Flask Hooks & Route ------------------ #
+    def route_label(self):
+        # Dash Sends The Callbacks From The Page --> Its Path Is The Referrer
+        if not request.referrer:
+            return "unknown"
+        path = urlparse(request.referrer).path or "/"
+        return path if path in self.routes else "other"
+
+    def _before_request(self):
+        if request.path == CALLBACK_PATH:
+            g.callback_start = time.perf_counter()
+
+    def _after_request(self, response):
+        start = g.pop("callback_start", None)
+        if start is None:
+            return response
+
+        seconds = time.perf_counter() - start
+        compute = g.pop("callback_compute_seconds", None)
+        body = request.get_json(silent=True) or {}
+        labels = (self.route_label(), str(body.get("output", "unknown")).strip("."))
+
+        with self._lock:
+            self.callback_seconds.observe(labels, seconds)
+            self.response_bytes.observe(labels, response.calculate_content_length() or 0)
+            if compute is not None:
+                self.compute_seconds.observe(labels, compute)
+                self.serialize_seconds.observe(labels, max(seconds - compute, 0.0))
+        return response
+
+    def render(self):
+        with self._lock:
+            lines = [line for metric in self._metrics for line in metric.render()]
+        for collect in self._collectors:
+            lines.extend(collect())
+        return "\n".join(lines) + "\n"
+
+    def register(self, server, path="/metrics"):
+        if not self.enabled:
+            return
+
+        server.before_request(self._before_request)
+        server.after_request(self._after_request)
+        server.add_url_rule(path, "metrics", lambda: Response(self.render(), mimetype="text/plain; version=0.0.4"))
+
+
+def figure_cache_collector(figure_cache):
+    def collect():
+        stats = figure_cache.stats()
+        lines = []
+        for name in ["hits", "misses", "evictions", "shared_hits", "shared_misses"]:
+            lines += [f"# HELP dashboard_figure_cache_{name}_total Figure cache {name.replace('_', ' ')}.",
+                      f"# TYPE dashboard_figure_cache_{name}_total counter",
+                      f"dashboard_figure_cache_{name}_total {stats[name]}"]
+        lines += ["# HELP dashboard_figure_cache_size Figures in the cache.",
+                  "# TYPE dashboard_figure_cache_size gauge",
+                  f"dashboard_figure_cache_size {stats['size']}"]
+        return lines
+
+    return collect
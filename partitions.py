@@ -0,0 +1,270 @@
+# Importing Toolkit
+import os
+import re
+import sys
+import json
+import pickle
+import hashlib
+import threading
+from collections import OrderedDict
+import pandas as pd
+
+from data_loader import DTYPES, COLUMNS, CATEGORY_COLUMNS, RENAMES, IQR_FACTOR, SNAPSHOT_VERSION, sketch_bounds
+from quantile_sketch import ValueCounts
+from row_index import RowIndex
+from aggregates import ALL_YEARS, ALL_JOBS, build_cube, merge_cells
+from live_data import clean_rows
+from kpi_engine import KPI_QUANTILES, build_kpis, kpi_table
+from histograms import build_histograms, merge_histogram_cubes
+
+# *************************************************************************
+# ** Year-Partitioned Data Folder, Loaded Year By Year When Needed       **
+# *************************************************************************
+# The rows are split in one CSV per year (same columns as the big CSV):
+#   <folder>/year=2021.csv, <folder>/year=2022.csv, ...
+#   python partitions.py Latest_Data_Science_Salaries.csv data/   # split a CSV
+#
+# A small summary is computed once (one partition in memory at a time) and
+# saved as <folder>/_summary.pkl:
+#   - the IQR bounds & the categories of all the rows
+#   - every "all" cell of the cube (all years rollups, time series)
+#   - the (year, "All", "Job_Title") cells (home page, jobs of each year)
+#   - the card KPIs (kpi_engine.py) of the "all" cells and of every (year,
+#     "All"), values only: the year ones from their partition, the "all"
+#     ones from the merged cells (percentiles from the histograms: within
+#     one SALARY_BIN_WIDTH)
+#   - the salary histograms of the "all" cells (merged, they add up)
+# The other cells, histograms & KPIs of a year are built from its partition
+# on first use (one load per year, even for concurrent requests); only the
+# `resident` most recently used years are kept in memory.
+#
+# The rows of the "all" cells are in partition (year) order, so ties of
+# the "all" charts may be ordered differently than with the single CSV.
+
+PARTITION_PATTERN = re.compile(r"^year=(\d+)\.csv$")
+SUMMARY_FILE = "_summary.pkl"
+# Bumped When The Summary Gets New Contents --> Old Summaries Are Rebuilt
+SUMMARY_VERSION = 5
+
+
+def partition_files(folder):
+    files = {}
+    for name in os.listdir(folder):
+        match = PARTITION_PATTERN.match(name)
+        if match:
+            files[int(match.group(1))] = os.path.join(folder, name)
+    return dict(sorted(files.items()))
+
+
+def partitions_key(files):
+    params = {
+        "version": SNAPSHOT_VERSION,
+        "summary": SUMMARY_VERSION,
+        "partitions": [[year, os.path.getsize(path), os.stat(path).st_mtime_ns] for year, path in files.items()],
+        "dtypes": DTYPES,
+        "columns": COLUMNS,
+        "renames": RENAMES,
+        "iqr_factor": IQR_FACTOR,
+    }
+    return hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+
+def read_partition(path, bounds, dtypes):
+    raw = pd.read_csv(path, usecols=list(DTYPES), dtype=DTYPES)
+    return clean_rows(raw, *bounds).astype(dtypes)
+
+
+def build_summary(files):
+    # Pass 1: Raw Salaries & Categories of Every Partition
+    salaries = ValueCounts()
+    categories = {column: set() for column in CATEGORY_COLUMNS}
+    for path in files.values():
+        rows = clean_rows(pd.read_csv(path, usecols=list(DTYPES), dtype=DTYPES), float("-inf"), float("inf"))
+        salaries.add(rows["Salary_in_USD"].to_numpy())
+        for column in CATEGORY_COLUMNS:
+            categories[column].update(rows[column].cat.categories)
+
+    bounds = sketch_bounds(salaries)
+    dtypes = {column: pd.CategoricalDtype(sorted(values)) for column, values in categories.items()}
+
+    # Pass 2: Cube of Each Partition --> "all" Cells Added Up, Year Job Lists
+    # & Year KPIs Kept
+    cells = {}
+    rows = 0
+    kpis = {}
+    histograms = {}
+    for year, path in files.items():
+        df = read_partition(path, bounds, dtypes)
+        rows += len(df)
+        year_kpis = build_kpis(df)
+        kpis.update({key: year_kpis.get(*key) for key in year_kpis.keys
+                     if key[0] != ALL_YEARS and key[1] == ALL_JOBS})
+        histograms = merge_histogram_cubes(
+            histograms, {key: histogram for key, histogram in build_histograms(df).items() if key[0] == ALL_YEARS})
+        for key, cell in build_cube(df, RowIndex(df)).items():
+            if key[0] == ALL_YEARS:
+                cells[key] = merge_cells(cells[key], cell) if key in cells else cell
+            elif key[1:] == (ALL_JOBS, "Job_Title"):
+                cells[key] = cell
+
+    for key, histogram in histograms.items():
+        if key[0] == ALL_YEARS and key[2] == "Job_Title":
+            kpis[key[:2]] = all_years_kpis(histogram, cells, key[1])
+
+    return {"bounds": bounds, "dtypes": dtypes, "cells": cells, "rows": rows, "kpis": kpi_table(kpis),
+            "histograms": histograms}
+
+
+def all_years_kpis(histogram, cells, job):
+    # The KPIs of an "all" Cell From Its Merged Cells (Same Columns As build_kpis)
+    pooled = histogram.pooled()
+    count, total = pooled.sizes()[0].item(), pooled.sums[0].item()
+    kpi = {"count": count, "sum": total, "mean": total / count}
+    for name, q in KPI_QUANTILES.items():
+        kpi[name] = pooled.quantiles(q)[0].item()
+    locations = cells[(ALL_YEARS, job, "Company_Location")]
+    kpi["locations"] = int((locations["count"] > 0).sum())
+    kpi["jobs"] = int((histogram.sizes() > 0).sum())
+    return kpi
+
+
+def load_summary(folder, files, key):
+    path = os.path.join(folder, SUMMARY_FILE)
+    try:
+        with open(path, "rb") as f:
+            saved = pickle.load(f)
+        if saved.get("key") == key:
+            return saved["summary"]
+    except (OSError, pickle.UnpicklingError, EOFError, KeyError):
+        pass
+
+    summary = build_summary(files)
+    try:
+        temp_path = f"{path}.tmp-{os.getpid()}"
+        with open(temp_path, "wb") as f:
+            pickle.dump({"key": key, "summary": summary}, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+    except OSError:
+        # Read-only data folder --> the summary is rebuilt on every start
+        pass
+    return summary
+
+
+class PartitionedCube:
+    # Answers cube.get((year, job, dimension)) Like The Cube Dict
+    def __init__(self, files, summary, resident=2):
+        self.files = files
+        self.summary = summary
+        self.resident = resident
+        self._years = OrderedDict()
+        self._lock = threading.Lock()
+        # One Lock Per Year: Held While The Year Is Loaded
+        self._loading = {}
+        self.loads = 0
+
+    def get(self, key, default=None):
+        year, job, dimension = key
+        if year == ALL_YEARS or (job, dimension) == (ALL_JOBS, "Job_Title"):
+            return self.summary["cells"].get(key, default)
+        if year not in self.files:
+            return default
+        return self.year_data(year)["cells"].get(key, default)
+
+    def _resident_year(self, year):
+        # Called With self._lock Held
+        data = self._years.get(year)
+        if data is not None:
+            self._years.move_to_end(year)
+        return data
+
+    def year_data(self, year):
+        # {"cells", "histograms", "kpis"} of One Year, From Its Partition
+        with self._lock:
+            data = self._resident_year(year)
+            if data is not None:
+                return data
+            loading = self._loading.setdefault(year, threading.Lock())
+
+        # Concurrent First Requests For The Year Wait For One Load
+        with loading:
+            with self._lock:
+                data = self._resident_year(year)
+                if data is not None:
+                    return data
+
+            df = read_partition(self.files[year], self.summary["bounds"], self.summary["dtypes"])
+            data = {
+                "cells": {key: cell for key, cell in build_cube(df, RowIndex(df)).items() if key[0] == year},
+                "histograms": {key: histogram for key, histogram in build_histograms(df).items()
+                               if key[0] == year},
+                "kpis": build_kpis(df),
+            }
+
+            with self._lock:
+                self.loads += 1
+                self._years[year] = data
+                self._years.move_to_end(year)
+                while len(self._years) > self.resident:
+                    self._years.popitem(last=False)
+        return data
+
+
+class PartitionedHistograms:
+    # Answers histograms.get((year, job, dimension)) Like The Histogram Dict
+    def __init__(self, cube):
+        self.cube = cube
+
+    def get(self, key, default=None):
+        year = key[0]
+        if year == ALL_YEARS:
+            return self.cube.summary["histograms"].get(key, default)
+        if year not in self.cube.files:
+            return default
+        return self.cube.year_data(year)["histograms"].get(key, default)
+
+
+class PartitionedKpis:
+    # Answers kpis.get(year, job) Like The KPI Table
+    def __init__(self, cube):
+        self.cube = cube
+
+    def get(self, year=ALL_YEARS, job=ALL_JOBS):
+        if year == ALL_YEARS or job == ALL_JOBS:
+            return self.cube.summary["kpis"].get(year, job)
+        if year not in self.cube.files:
+            return None
+        return self.cube.year_data(year)["kpis"].get(year, job)
+
+
+class PartitionedState:
+    # Same Attributes As live_data.DataState That The Callbacks Read
+    def __init__(self, folder, resident=2):
+        files = partition_files(folder)
+        if not files:
+            raise FileNotFoundError(f"No year=<year>.csv partitions in {folder}")
+
+        self.version = partitions_key(files)
+        summary = load_summary(folder, files, self.version)
+        self.cube = PartitionedCube(files, summary, resident)
+        self.kpis = PartitionedKpis(self.cube)
+        self.histograms = PartitionedHistograms(self.cube)
+        self.years = list(files)
+        self.rows = summary["rows"]
+        jobs = summary["cells"][(ALL_YEARS, ALL_JOBS, "Job_Title")].index
+        self.jobs_title = [ALL_JOBS] + sorted(jobs.tolist())
+
+
+# -------------- Splitting a CSV Into Partitions ------------------ #
+def split_csv(path, folder):
+    os.makedirs(folder, exist_ok=True)
+    df = pd.read_csv(path)
+    for year, rows in df.groupby("Year"):
+        rows.to_csv(os.path.join(folder, f"year={year}.csv"), index=False)
+    return sorted(df["Year"].unique().tolist())
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit("Usage: python partitions.py <csv> <folder>")
+    years = split_csv(sys.argv[1], sys.argv[2])
+    print(f"Partitions: {', '.join(str(year) for year in years)} --> {sys.argv[2]}")
@@ -0,0 +1,100 @@
+# Importing Toolkit
+import math
+import numpy as np
+
+# *************************************************************************
+# ** Streaming Quantiles (Fed Chunk By Chunk, Mergeable)                 **
+# *************************************************************************
+#   ValueCounts --> exact: one count per distinct value, quantiles match
+#                   pandas' `quantile` (linear interpolation)
+#   LogSketch   --> approximate: one count per log bucket, every quantile
+#                   is within `relative_error` of the true value and the
+#                   memory does not grow with the distinct values
+#
+# Both have add(values), merge(other), quantile(q) and quantiles(qs).
+
+
+class ValueCounts:
+    def __init__(self):
+        self.counts = {}
+        self.count = 0
+
+    def add(self, values):
+        uniques, counts = np.unique(np.asarray(values), return_counts=True)
+        for value, count in zip(uniques.tolist(), counts.tolist()):
+            self.counts[value] = self.counts.get(value, 0) + count
+        self.count += len(values)
+        return self
+
+    def merge(self, other):
+        for value, count in other.counts.items():
+            self.counts[value] = self.counts.get(value, 0) + count
+        self.count += other.count
+        return self
+
+    def quantile(self, q):
+        if self.count == 0:
+            return math.nan
+
+        values = np.array(sorted(self.counts))
+        ends = np.cumsum([self.counts[value] for value in values.tolist()])
+
+        # Position Among The Sorted Rows, Then The Values At Its 2 Sides
+        position = q * (self.count - 1)
+        below = int(math.floor(position))
+        low = values[np.searchsorted(ends, below, side="right")]
+        high = values[np.searchsorted(ends, min(below + 1, self.count - 1), side="right")]
+        return float(low + (high - low) * (position - below))
+
+    def quantiles(self, qs):
+        return [self.quantile(q) for q in qs]
+
+
+class LogSketch:
+    def __init__(self, relative_error=0.005):
+        self.relative_error = relative_error
+        self.gamma = (1 + relative_error) / (1 - relative_error)
+        self.log_gamma = math.log(self.gamma)
+        self.buckets = {}
+        self.zeros = 0  # Values <= 0 (No Log)
+        self.count = 0
+
+    def add(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        positive = values[values > 0]
+        self.zeros += len(values) - len(positive)
+
+        indexes = np.ceil(np.log(positive) / self.log_gamma).astype(np.int64)
+        uniques, counts = np.unique(indexes, return_counts=True)
+        for index, count in zip(uniques.tolist(), counts.tolist()):
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += len(values)
+        return self
+
+    def merge(self, other):
+        if other.gamma != self.gamma:
+            raise ValueError("Only sketches with the same relative_error can be merged")
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.zeros += other.zeros
+        self.count += other.count
+        return self
+
+    def quantile(self, q):
+        if self.count == 0:
+            return math.nan
+
+        rank = q * (self.count - 1)
+        if rank < self.zeros:
+            return 0.0
+
+        seen = self.zeros
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                # Middle of The Bucket (gamma^(i-1), gamma^i] In Relative Terms
+                return 2 * self.gamma ** index / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+    def quantiles(self, qs):
+        return [self.quantile(q) for q in qs]
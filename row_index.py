@@ -0,0 +1,160 @@
+# Importing Toolkit
+import os
+import json
+import numpy as np
+import pandas as pd
+
+# *************************************************************************
+# ** Row Postings For The Year & Job_Title Filters                       **
+# *************************************************************************
+# Instead of comparing a whole column on every filter, the sorted row
+# positions of every Year, every Job_Title and every (Year, Job_Title) pair
+# are computed once. A filtered view is then one `df.take(rows)`, and
+# selections of several values are unions / intersections of sorted arrays.
+
+ALL_YEARS = "all"
+ALL_JOBS = "All"
+
+EMPTY_ROWS = np.array([], dtype=np.int64)
+
+
+def group_rows(codes, n_groups):
+    # Stable sort --> the rows of each group stay in ascending order
+    order = np.argsort(codes, kind="stable")
+    bounds = np.cumsum(np.bincount(codes, minlength=n_groups))[:-1]
+    return np.split(order, bounds)
+
+
+def factorize(column):
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return column.cat.codes.to_numpy().astype(np.int64), column.cat.categories.tolist()
+    codes, values = pd.factorize(column, sort=True)
+    return codes.astype(np.int64), values.tolist()
+
+
+def union_rows(*rows):
+    if not rows:
+        return EMPTY_ROWS
+    return np.unique(np.concatenate(rows))
+
+
+def intersect_rows(*rows):
+    result = rows[0]
+    for other in rows[1:]:
+        result = np.intersect1d(result, other, assume_unique=True)
+    return result
+
+
+def append_postings(postings, new_postings, offset):
+    postings = dict(postings)
+    for key, rows in new_postings.items():
+        postings[key] = np.concatenate([postings.get(key, EMPTY_ROWS), rows + offset])
+    return postings
+
+
+class RowIndex:
+    def __init__(self, df):
+        self.n_rows = len(df)
+
+        year_codes, years = factorize(df["Year"])
+        job_codes, jobs = factorize(df["Job_Title"])
+
+        self.years = {year: rows for year, rows in zip(years, group_rows(year_codes, len(years))) if len(rows)}
+        self.jobs = {job: rows for job, rows in zip(jobs, group_rows(job_codes, len(jobs))) if len(rows)}
+
+        # (Year, Job) Pairs --> One Combined Code Per Row
+        pair_codes = year_codes * len(jobs) + job_codes
+        self.pairs = {}
+        for code, rows in enumerate(group_rows(pair_codes, len(years) * len(jobs))):
+            if len(rows):
+                self.pairs[(years[code // len(jobs)], jobs[code % len(jobs)])] = rows
+
+    def extended(self, other):
+        # Index of The Rows of `self` + The Rows of `other` Appended After Them
+        index = RowIndex.__new__(RowIndex)
+        index.n_rows = self.n_rows + other.n_rows
+        index.years = append_postings(self.years, other.years, self.n_rows)
+        index.jobs = append_postings(self.jobs, other.jobs, self.n_rows)
+        index.pairs = append_postings(self.pairs, other.pairs, self.n_rows)
+        return index
+
+    def rows(self, year=ALL_YEARS, job=ALL_JOBS):
+        # None --> Every Row (No Filter)
+        if year == ALL_YEARS and job == ALL_JOBS:
+            return None
+        if year == ALL_YEARS:
+            return self.jobs.get(job, EMPTY_ROWS)
+        if job == ALL_JOBS:
+            return self.years.get(year, EMPTY_ROWS)
+        return self.pairs.get((year, job), EMPTY_ROWS)
+
+    def select(self, years=None, jobs=None):
+        # Several Years and/or Jobs (None --> No Filter On That Column)
+        selections = []
+        if years is not None:
+            selections.append(union_rows(*[self.years.get(year, EMPTY_ROWS) for year in years]))
+        if jobs is not None:
+            selections.append(union_rows(*[self.jobs.get(job, EMPTY_ROWS) for job in jobs]))
+
+        if not selections:
+            return None
+        return intersect_rows(*selections)
+
+    def take(self, df, year=ALL_YEARS, job=ALL_JOBS):
+        rows = self.rows(year, job)
+        return df if rows is None else df.take(rows)
+
+    # -------------- Saved Next To The Data Snapshot ------------------ #
+    # One .npy per filter (the postings one after the other) + the keys and
+    # lengths in row_index.json, written last. Loaded with mmap_mode="r" the
+    # postings are views of the mapped files, shared by every process.
+    def save(self, folder, key):
+        layout = {"key": key, "n_rows": self.n_rows}
+        try:
+            for name in ["years", "jobs", "pairs"]:
+                postings = getattr(self, name)
+                rows = np.concatenate(list(postings.values())) if postings else EMPTY_ROWS
+                temp_path = os.path.join(folder, f"rows.{name}.{os.getpid()}.tmp.npy")
+                np.save(temp_path, rows)
+                os.replace(temp_path, os.path.join(folder, f"rows.{name}.npy"))
+                layout[name] = [[list(k) if name == "pairs" else k, len(r)] for k, r in postings.items()]
+
+            temp_path = os.path.join(folder, f"row_index.{os.getpid()}.tmp")
+            with open(temp_path, "w") as f:
+                json.dump(layout, f)
+            os.replace(temp_path, os.path.join(folder, "row_index.json"))
+        except OSError:
+            # Read-only data folder --> the index is built by every process
+            pass
+
+    @classmethod
+    def load(cls, folder, key, mmap_mode=None):
+        try:
+            with open(os.path.join(folder, "row_index.json")) as f:
+                layout = json.load(f)
+            if layout.get("key") != key:
+                return None
+
+            index = cls.__new__(cls)
+            index.n_rows = layout["n_rows"]
+            for name in ["years", "jobs", "pairs"]:
+                rows = np.load(os.path.join(folder, f"rows.{name}.npy"), mmap_mode=mmap_mode, allow_pickle=False)
+                lengths = [length for _, length in layout[name]]
+                if sum(lengths) != len(rows):
+                    # Being Rewritten By Another Process
+                    return None
+                keys = [tuple(k) if name == "pairs" else k for k, _ in layout[name]]
+                setattr(index, name, dict(zip(keys, np.split(rows, np.cumsum(lengths)[:-1]))))
+        except (OSError, ValueError, KeyError):
+            return None
+        return index
+
+    @classmethod
+    def cached(cls, df, folder, key, mmap_mode=None):
+        index = cls.load(folder, key, mmap_mode)
+        if index is None:
+            index = cls(df)
+            index.save(folder, key)
+            # Mapped From The Files Just Written (When They Could Be Written)
+            index = cls.load(folder, key, mmap_mode) or index
+        return index
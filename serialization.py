@@ -0,0 +1,90 @@
+# Importing Toolkit
+import os
+import time
+
+import plotly.io as pio
+from plotly.io.json import to_json_plotly
+from _plotly_utils.utils import PlotlyJSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# *************************************************************************
+# ** JSON Encoding of The Callback Responses (Figures & Page Content)    **
+# *************************************************************************
+# The numeric arrays of the figures are already base64 typed arrays
+# ({"dtype": "f8", "bdata": "..."}, see figure_factory.py), so what is left
+# is the JSON encoder itself:
+#   - Dash encodes through plotly's to_json --> importing this module sets
+#     plotly's default engine to orjson when it is installed (about 5x
+#     faster than the json module)
+#   - without orjson (or DASHBOARD_JSON=json) --> plotly's json encoder,
+#     the same output Dash gives by default
+#   - dumps(value) --> the encoding of the exports & the metrics: orjson
+#     with one `default` hook (to_plotly_json / PlotlyJSONEncoder) for the
+#     Dash components & other objects orjson doesn't know
+#
+# measure(value) --> (bytes, seconds) of one encoding, used by the metrics
+# (dashboard_figure_bytes / dashboard_figure_encode_seconds) and by
+# benchmarks/bench_serialization.py.
+
+# "auto" (orjson When Installed), "orjson" or "json"
+ENGINE = os.environ.get("DASHBOARD_JSON", "auto")
+if ENGINE not in ("auto", "orjson", "json"):
+    raise ValueError(f"DASHBOARD_JSON must be auto, orjson or json, not {ENGINE!r}")
+if ENGINE == "orjson" and orjson is None:
+    raise ImportError("DASHBOARD_JSON=orjson needs the orjson package (pip install orjson)")
+if ENGINE == "auto":
+    ENGINE = "json" if orjson is None else "orjson"
+
+# Dash Encodes The Callback Responses & The Layout With plotly's to_json,
+# Which Uses This Engine
+pio.json.config.default_engine = ENGINE
+
+# Same Escaping As plotly (The JSON Stays Safe Inside a <script> Tag)
+SAFE_CHARACTERS = (
+    ("<", "\\u003c"),
+    (">", "\\u003e"),
+    ("/", "\\u002f"),
+    ("\u2028", "\\u2028"),
+    ("\u2029", "\\u2029"),
+)
+
+_encoder = PlotlyJSONEncoder()
+
+
+def _default(value):
+    # Dash Components, pandas / numpy Objects orjson Can't Write Itself
+    to_plotly_json = getattr(value, "to_plotly_json", None)
+    if to_plotly_json is not None:
+        return to_plotly_json()
+    return _encoder.default(value)
+
+
+def _safe(text):
+    for unsafe, safe in SAFE_CHARACTERS:
+        if unsafe in text:
+            text = text.replace(unsafe, safe)
+    return text
+
+
+def dumps(value, engine=None):
+    engine = engine or ENGINE
+    if engine == "orjson":
+        try:
+            text = orjson.dumps(value, default=_default,
+                                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+            return _safe(text)
+        except TypeError:
+            # Too Deep / Unknown Types --> plotly's Own Cleaning
+            pass
+    return to_json_plotly(value, engine=engine)
+
+
+def measure(value, engine=None):
+    start = time.perf_counter()
+    size = len(dumps(value, engine).encode())
+    return size, time.perf_counter() - start
+
@@ -0,0 +1,163 @@
+# Importing Toolkit
+import os
+import uuid
+import fcntl
+import hashlib
+import threading
+from urllib.parse import urlparse, parse_qs
+
+# *************************************************************************
+# ** Cache Shared By All The gunicorn Workers                           **
+# *************************************************************************
+# Every worker computes the same aggregates & figures, so they are kept in
+# one store all workers read from. The backends speak the small part of the
+# Redis client API we need:
+#
+#   get(key) -> bytes or None      set(key, value, ex=None)      delete(*keys)
+#
+#   FileCache  --> one file per key in a local folder (no server needed)
+#   RedisCache --> a real Redis server (needs the `redis` package)
+#
+# Chosen with a URL (DASHBOARD_SHARED_CACHE in app.py):
+#   file:///var/cache/dashboard?max_mb=256
+#   file://.cache/dashboard                     (relative folder)
+#   redis://localhost:6379/0
+
+
+class FileCache:
+    def __init__(self, directory, max_bytes=256 * 2 ** 20):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._written = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, hashlib.sha1(key.encode()).hexdigest())
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = f.read()
+        except FileNotFoundError:
+            return None
+
+        # The Modification Time Is The "Last Used" Time For The Eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def set(self, key, value, ex=None):
+        # Written To a Unique Temp File, Then Renamed --> Readers & Other
+        # Writers Only Ever See Complete Entries
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(value)
+        os.replace(temp_path, path)
+
+        with self._lock:
+            self._written += len(value)
+            evict = self._written > self.max_bytes // 10
+            if evict:
+                self._written = 0
+        if evict:
+            self.evict()
+        return True
+
+    def delete(self, *keys):
+        deleted = 0
+        for key in keys:
+            try:
+                os.remove(self._path(key))
+                deleted += 1
+            except FileNotFoundError:
+                pass
+        return deleted
+
+    def evict(self):
+        # One Worker At a Time Removes The Least Recently Used Entries
+        with open(os.path.join(self.directory, ".lock"), "w") as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return
+
+            entries = []
+            total = 0
+            for entry in os.scandir(self.directory):
+                if entry.name.startswith(".") or entry.name.endswith(".tmp"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+            if total <= self.max_bytes:
+                return
+
+            entries.sort()
+            target = self.max_bytes * 0.9
+            for _, size, path in entries:
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+
+    def size_bytes(self):
+        return sum(entry.stat().st_size for entry in os.scandir(self.directory) if not entry.name.startswith("."))
+
+
+class RedisCache:
+    def __init__(self, url, prefix="dashboard:"):
+        import redis  # Optional Dependency, Only For redis:// URLs
+
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    def get(self, key):
+        return self.client.get(self.prefix + key)
+
+    def set(self, key, value, ex=None):
+        # Size Limit & Eviction --> Redis `maxmemory` + `allkeys-lru`
+        return self.client.set(self.prefix + key, value, ex=ex)
+
+    def delete(self, *keys):
+        return self.client.delete(*[self.prefix + key for key in keys])
+
+
+def make_shared_cache(url):
+    if not url:
+        return None
+
+    parsed = urlparse(url)
+    if parsed.scheme == "file":
+        options = parse_qs(parsed.query)
+        max_mb = float(options.get("max_mb", ["256"])[0])
+        return FileCache(parsed.netloc + parsed.path, max_bytes=int(max_mb * 2 ** 20))
+    if parsed.scheme in ("redis", "rediss", "unix"):
+        return RedisCache(url)
+
+    raise ValueError(f"Unknown shared cache URL: {url}")
+
+
+def get_or_build(shared, key, build, dumps, loads):
+    # Value From The Shared Cache, Or Built Here & Shared With The Others
+    if shared is None:
+        return build()
+
+    value = shared.get(key)
+    if value is not None:
+        return loads(value)
+
+    result = build()
+    shared.set(key, dumps(result))
+    return result
@@ -0,0 +1,45 @@
+# Importing Toolkit
+import sys
+import time
+
+# *************************************************************************
+# ** Startup Phases: Where The Cold Start Goes                           **
+# *************************************************************************
+# Imported on the first line of app.py, which marks the end of each phase
+# of its import. A phase is the time since the previous mark (marks with
+# the same name add up).
+#   DASHBOARD_STARTUP_REPORT=1 --> the breakdown printed on stderr
+#   /metrics                   --> dashboard_startup_seconds{phase}
+
+
+class StartupPhases:
+    def __init__(self):
+        self.start = self.last = time.perf_counter()
+        self.phases = {}
+
+    def mark(self, name):
+        now = time.perf_counter()
+        self.phases[name] = self.phases.get(name, 0.0) + (now - self.last)
+        self.last = now
+
+    def total(self):
+        return self.last - self.start
+
+    def report(self, file=sys.stderr):
+        print(f"{'Startup Phase':<22}{'Seconds':>10}", file=file)
+        for name, seconds in self.phases.items():
+            print(f"{name:<22}{seconds:>10.3f}", file=file)
+        print(f"{'total':<22}{self.total():>10.3f}", file=file, flush=True)
+
+    def collector(self):
+        def collect():
+            lines = ["# HELP dashboard_startup_seconds Time spent in each phase of the app import.",
+                     "# TYPE dashboard_startup_seconds gauge"]
+            for name, seconds in self.phases.items():
+                lines.append(f'dashboard_startup_seconds{{phase="{name}"}} {seconds}')
+            return lines
+
+        return collect
+
+
+startup = StartupPhases()
@@ -0,0 +1,109 @@
+# Importing Toolkit
+import os
+import sys
+import time
+import resource
+import multiprocessing
+
+# *************************************************************************
+# ** Warm-Up: Build Every (Chart, Year, Job) Figure Before The Requests  **
+# *************************************************************************
+# The figures are built by a pool of forked processes (they inherit the
+# loaded data, nothing is re-read) and stored in the figure cache of the
+# main process, so the first visitor of every view is served from memory.
+# With `gunicorn --preload` this runs once in the master and every worker
+# gets the warm cache through fork.
+#
+# The work stops early when the time budget (seconds) or the memory budget
+# (MB of RSS growth) is used up, or when the figure cache is full (more
+# figures would only evict the first ones); the remaining figures are built
+# on demand.
+
+# Chart Functions of The Running App, Shared With The Forked Processes
+_charts = {}
+
+
+def rss_mb():
+    # Current RSS On Linux, Peak RSS Elsewhere
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10
+
+
+def _build(task):
+    name, args = task
+    return name, args, _charts[name](*args)
+
+
+def cached(figure_cache, key):
+    return key in figure_cache or figure_cache.get_shared(key) is not None
+
+
+def print_progress(done, total, seconds, memory):
+    print(f"[warm-up] {done}/{total} figures, {seconds:0.1f}s, +{memory:0.1f} MB", file=sys.stderr, flush=True)
+
+
+def warm_up(charts, tasks, figure_cache, processes=None, time_budget=None, memory_budget_mb=None,
+            progress=print_progress, chunksize=32):
+    # charts: {name: function building the figure (not cached)}
+    # tasks : [(name, args), ...] --> every figure to build
+    _charts.clear()
+    _charts.update(charts)
+
+    # Figures Another Worker Already Put In The Shared Cache Are Just Loaded
+    tasks = [task for task in tasks if not cached(figure_cache, figure_cache.key(task[0], *task[1]))]
+    total = len(tasks)
+    start_time = time.perf_counter()
+    start_memory = rss_mb()
+    report_every = max(total // 10, 1)
+    done = 0
+    stopped = None
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    fork = "fork" in multiprocessing.get_all_start_methods()
+    pool = multiprocessing.get_context("fork").Pool(processes) if fork and processes > 1 else None
+    results = pool.imap_unordered(_build, tasks, chunksize) if pool else map(_build, tasks)
+
+    try:
+        for name, args, figure in results:
+            figure_cache.put(figure_cache.key(name, *args), figure)
+            done += 1
+
+            seconds = time.perf_counter() - start_time
+            memory = rss_mb() - start_memory
+            if progress and (done % report_every == 0 or done == total):
+                progress(done, total, seconds, memory)
+
+            if time_budget is not None and seconds > time_budget:
+                stopped = "time budget"
+                break
+            if memory_budget_mb is not None and memory > memory_budget_mb:
+                stopped = "memory budget"
+                break
+            if done < total and len(figure_cache) >= figure_cache.maxsize:
+                stopped = "cache size"
+                print(f"[warm-up] figure cache full ({figure_cache.maxsize} figures), {total - done} left to build "
+                      f"on demand: raise FIGURE_CACHE_SIZE to keep them all", file=sys.stderr, flush=True)
+                break
+    finally:
+        if pool:
+            pool.terminate()
+            pool.join()
+
+    report = {
+        "figures": done,
+        "total": total,
+        "seconds": time.perf_counter() - start_time,
+        "memory_mb": rss_mb() - start_memory,
+        "processes": processes if pool else 1,
+        "stopped_by": stopped,
+    }
+    if progress:
+        print(f"[warm-up] done: {report}", file=sys.stderr, flush=True)
+    return report